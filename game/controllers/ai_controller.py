@@ -30,7 +30,7 @@ class AIController:
         
         # Registrar para eventos relevantes
         if event_bus:
-            self.event_bus.subscribe("turn.civ_start", self._on_civ_turn_start)
+            self.event_bus.subscribe("turn.civ_start_batch", self._on_civ_turn_start_batch)
     
     def process_ai_turn(self, civ: Civilization) -> None:
         """
@@ -1107,7 +1107,7 @@ class AIController:
             return False
         
         # Verificar se está muito perto de outras cidades
-        for city in self.game_controller.get_all_cities():
+        for city in self.game_controller.iter_all_cities():
             distance = self._distance(x, y, city.x, city.y)
             if distance < 4:  # Distância mínima entre cidades
                 return False
@@ -1696,6 +1696,17 @@ class AIController:
         # Distância euclidiana simples
         return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
     
+    def _on_civ_turn_start_batch(self, event_data: Dict[str, Any]) -> None:
+        """
+        Manipulador de evento para o início de turno agrupado de todas as civilizações.
+        
+        Args:
+            event_data: Dados do evento (com a lista ``civ_ids``)
+        """
+        turn = event_data.get("turn")
+        for civ_id in event_data.get("civ_ids", ()):
+            self._on_civ_turn_start({"civ_id": civ_id, "turn": turn})
+    
     def _on_civ_turn_start(self, event_data: Dict[str, Any]) -> None:
         """
         Manipulador de evento para início de turno de civilização.
@@ -1715,7 +1726,7 @@ class AIController:
                 civ = c
                 break
         
-        if not civ or civ == self.game_controller.game_state.player_civ:
+        if not civ or civ is self.game_controller.game_state.player_civ:
             return
         
         # Processar turno da IA
@@ -133,14 +133,14 @@ class CivController:
             return False
         
         # Verifica se a tecnologia já foi pesquisada
-        if tech_id in civilization.technologies:
+        if tech_id in civilization._tech_set:
             self.logger.warning(f"Tecnologia já pesquisada: {tech_id}")
             return False
         
         # Verifica pré-requisitos
         prerequisites = tech_data.get('requires', [])
         for prereq in prerequisites:
-            if prereq not in civilization.technologies:
+            if prereq not in civilization._tech_set:
                 self.logger.warning(f"Pré-requisito não atendido: {prereq}")
                 return False
         
@@ -171,7 +171,7 @@ class CivController:
         
         for tech_id, tech_data in self.game_state.tech_tree.items():
             # Ignora tecnologias já pesquisadas
-            if tech_id in civilization.technologies:
+            if tech_id in civilization._tech_set:
                 continue
             
             # Verifica pré-requisitos
@@ -179,7 +179,7 @@ class CivController:
             all_prereqs_met = True
             
             for prereq in prerequisites:
-                if prereq not in civilization.technologies:
+                if prereq not in civilization._tech_set:
                     all_prereqs_met = False
                     break
             
@@ -264,16 +264,47 @@ class CivController:
                 civ.id = f"ai_{i}"
             self.game_state.civilizations.append(civ)
     
-    def place_initial_units(self):
+    def place_initial_units(self, executor=None):
         """
         Posiciona unidades iniciais para cada civilização no início do jogo.
+        
+        A criação das unidades é independente por civilização e pode ser
+        distribuída em um executor; a inserção no mundo (estado compartilhado)
+        é feita depois, em uma única thread.
+        
+        Args:
+            executor: Executor opcional (concurrent.futures) para criar as
+                unidades em paralelo.
+        """
+        civs = list(enumerate(self.game_state.civilizations))
+        if executor is not None:
+            placements = list(executor.map(self._create_initial_units, civs))
+        else:
+            placements = [self._create_initial_units(item) for item in civs]
+
+        # Reconciliar em série: tiles do mundo são compartilhados entre civs
+        world = self.game_state.world
+        for civ, units in placements:
+            for unit in units:
+                civ.units.append(unit)
+                world.get_tile(unit.x, unit.y).units.append(unit)
+
+    @staticmethod
+    def _create_initial_units(item):
+        """
+        Cria as unidades iniciais de uma civilização sem tocar no mundo.
+        
+        Args:
+            item (tuple): Par (índice, civilização).
+            
+        Returns:
+            tuple: (civilização, lista de unidades criadas).
         """
         from game.models.unit import Unit
 
-        for i, civ in enumerate(self.game_state.civilizations):
-            x = 2 + i * 2
-            y = 2 + i * 2
-            unit = Unit(x=x, y=y, unit_type="settler")
-            unit.owner = civ
-            civ.units.append(unit)
-            self.game_state.world.get_tile(x, y).units.append(unit)
+        i, civ = item
+        x = 2 + i * 2
+        y = 2 + i * 2
+        unit = Unit(x=x, y=y, unit_type="settler")
+        unit.owner = civ
+        return civ, [unit]
@@ -208,7 +208,7 @@ class DiplomacyController:
             return False
         
         # Avaliar o acordo (para IA)
-        if civ2 != self.game_controller.game_state.player_civ:
+        if civ2 is not self.game_controller.game_state.player_civ:
             # Lógica de avaliação para IA
             deal_value = self._evaluate_trade_deal(civ2, offer, request)
             
@@ -1,9 +1,12 @@
 """
 Controlador principal do jogo que coordena outros controladores especializados.
 """
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Union
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 
 # Importações de modelos
 from game.models.game_state import GameState
@@ -19,10 +22,12 @@ from game.controllers.tech_controller import TechController
 from game.controllers.event_controller import EventController
 
 # Importações de utilidades
-from game.utils.data_loader import DataLoader
-from game.utils.save_manager import SaveManager
+from game.utils.data_loader import DataLoader, get_data_loader
+from game.utils.save_manager import SaveManager, get_save_manager
 from game.utils.event_bus import EventBus
 
+__all__ = ['GameController']
+
 
 class GameController(QObject):
     """
@@ -38,15 +43,15 @@ class GameController(QObject):
     turn_changed = pyqtSignal()
     active_city_changed = pyqtSignal()
     map_updated = pyqtSignal()
-    
+
     def __init__(self, data_loader: Optional[DataLoader] = None, 
                  save_manager: Optional[SaveManager] = None):
         """
         Inicializa o controlador principal do jogo.
         
         Args:
-            data_loader: Carregador de dados (opcional, será criado se não fornecido)
-            save_manager: Gerenciador de salvamentos (opcional, será criado se não fornecido)
+            data_loader: Carregador de dados (opcional, usa a instância compartilhada se não fornecido)
+            save_manager: Gerenciador de salvamentos (opcional, usa a instância compartilhada se não fornecido)
         """
         super().__init__()
         
@@ -58,11 +63,11 @@ class GameController(QObject):
         self.event_bus = EventBus()
         
         # Inicializar utilitários com injeção de dependência
-        self.data_loader = data_loader or DataLoader()
-        self.save_manager = save_manager or SaveManager()
+        self.data_loader = data_loader or get_data_loader()
+        self.save_manager = save_manager or get_save_manager()
         
-        # Carregar configuração
-        self.config = self.data_loader.load_config()
+        # Configuração carregada sob demanda (ver propriedade config)
+        self._config = None
         
         # Inicializar estado do jogo
         self.game_state = None
@@ -76,10 +81,73 @@ class GameController(QObject):
         self.tech_controller = None
         self.event_controller = None
         
+        # Cache de dados estáticos (carregados sob demanda, estáveis durante a sessão)
+        self._tech_tree = None
+        self._building_data = None
+        self._unit_data = None
+        
+        # Pool de threads para operações independentes por civilização
+        self._pool = None
+        
+        # Autosave periódico (criado em start_autosave)
+        self._autosave_timer = None
+        self._last_autosave_turn = None
+        
+        # Pré-calcular configuração achatada e opções de autosave
+        self._config_flat = {}
+        self._world_dims = {}
+        self._flatten_config()
+    
+    def _flatten_config(self) -> None:
+        """
+        Achata a configuração em um dicionário indexado por caminhos pontuados
+        (ex.: ``'world_sizes.standard.width'``) e atualiza os atributos derivados.
+        
+        Deve ser chamado sempre que ``self.config`` for alterado. Enquanto a
+        configuração não for carregada, apenas os valores padrão são aplicados.
+        """
+        config = self._config or {}
+        flat = {}
+        stack = [('', config)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+        self._config_flat = flat
+        
+        # Dimensões (largura, altura) por tamanho de mundo
+        self._world_dims = {
+            size: (dims.get('width', 40), dims.get('height', 24))
+            for size, dims in config.get('world_sizes', {}).items()
+        }
+        
+        # Modo sem interface (simulações/perfilamento): nenhum sinal é emitido
+        self._headless = flat.get('headless', False)
+        
         # Configurar autosave
-        self.autosave_interval = self.config.get('autosave_interval', 5)  # turnos
-        self.autosave_enabled = self.config.get('autosave_enabled', True)
-        self.autosave_slots = self.config.get('autosave_slots', 3)
+        self.autosave_interval = flat.get('autosave_interval', 5)  # turnos
+        self.autosave_enabled = flat.get('autosave_enabled', True)
+        self.autosave_slots = flat.get('autosave_slots', 3)
+    
+    def _ensure_config(self) -> Dict[str, Any]:
+        """Carrega a configuração na primeira utilização e a retorna."""
+        if self._config is None:
+            self._config = self.data_loader.load_config()
+            self._flatten_config()
+        return self._config
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuração do jogo, carregada no primeiro acesso."""
+        return self._ensure_config()
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._flatten_config()
     
     def new_game(self, config: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -90,9 +158,10 @@ class GameController(QObject):
         """
         self.logger.info("Iniciando novo jogo")
         
-        # Usar configuração fornecida ou padrão
+        # Usar configuração fornecida ou padrão (carrega a configuração global)
+        defaults = self.config
         if config is None:
-            config = self.config.get('default_game', {})
+            config = defaults.get('default_game', {})
         
         # Criar novo estado de jogo
         self.game_state = GameState()
@@ -101,9 +170,7 @@ class GameController(QObject):
         # Criar o mundo
         world_size = config.get('world_size', 'standard')
         world_type = config.get('world_type', 'continents')
-        world_config = self.config.get('world_sizes', {}).get(world_size, {})
-        width = world_config.get('width', 40)
-        height = world_config.get('height', 24)
+        width, height = self._world_dims.get(world_size, (40, 24))
         self.game_state.world = World(width, height)
 
         # Inicializar controladores com injeção de dependência
@@ -119,16 +186,19 @@ class GameController(QObject):
         self.civ_controller.create_civilizations(num_civs, player_civ_id)
         
         # Posicionar unidades e cidades iniciais
-        self.civ_controller.place_initial_units()
+        self.civ_controller.place_initial_units(executor=self._get_pool())
         
         # Definir civilização do jogador
         self.game_state.player_civ = self.civ_controller.get_player_civilization()
+        self.game_state.player_civ_id = (
+            self.game_state.player_civ.id if self.game_state.player_civ else None
+        )
         
         # Configurar eventos iniciais
         self.event_controller.setup_initial_events()
         
         # Emitir sinal para a GUI
-        self.game_started.emit()
+        self._emit(self.game_started)
         self.logger.info("Novo jogo iniciado com sucesso")
     
     def _initialize_controllers(self) -> None:
@@ -144,9 +214,33 @@ class GameController(QObject):
         self.tech_controller = TechController(self, self.event_bus)
         self.event_controller = EventController(self, self.event_bus)
         
+        # Capturar referências diretas após todos os controladores existirem
+        self.turn_controller.attach_controllers()
+        
         # Conectar sinais do barramento de eventos
         self._connect_event_signals()
     
+    def _emit(self, signal) -> None:
+        """
+        Emite um sinal da GUI apenas se houver quem o receba.
+        
+        Em modo headless, ou sem slots conectados, a emissão é ignorada.
+        
+        Args:
+            signal: Sinal (pyqtSignal vinculado) a ser emitido
+        """
+        if not self._headless and self.receivers(signal) > 0:
+            signal.emit()
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Obtém (criando sob demanda) o pool de threads por civilização."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="civ-worker"
+            )
+        return self._pool
+    
     def _connect_event_signals(self) -> None:
         """Conecta sinais do barramento de eventos aos handlers apropriados."""
         # Exemplo de conexão de eventos
@@ -156,21 +250,24 @@ class GameController(QObject):
         self.event_bus.subscribe("game.save_requested", self._on_save_requested)
     
     def _on_turn_ended(self, data: Dict[str, Any]) -> None:
-        """Handler para o evento de fim de turno."""
-        self.turn_ended.emit()
+        """Handler para o evento de fim de turno (adaptador barramento → sinais da GUI)."""
+        self._emit(self.turn_changed)
+        self._emit(self.turn_ended)
         
         # Verificar se é hora de fazer autosave
-        if (self.autosave_enabled and 
-            self.game_state.current_turn % self.autosave_interval == 0):
+        gs = self.game_state
+        if gs is None or not self.autosave_enabled:
+            return
+        if gs.current_turn % self.autosave_interval == 0:
             self._do_autosave()
     
     def _on_city_selected(self, data: Dict[str, Any]) -> None:
         """Handler para o evento de seleção de cidade."""
-        self.active_city_changed.emit()
+        self._emit(self.active_city_changed)
     
     def _on_map_updated(self, data: Dict[str, Any]) -> None:
         """Handler para o evento de atualização do mapa."""
-        self.map_updated.emit()
+        self._emit(self.map_updated)
     
     def _on_save_requested(self, data: Dict[str, Any]) -> None:
         """Handler para o evento de solicitação de salvamento."""
@@ -215,6 +312,7 @@ class GameController(QObject):
             True se o carregamento foi bem-sucedido, False caso contrário
         """
         self.logger.info(f"Carregando jogo: {save_name}")
+        self._ensure_config()
         
         try:
             # Carregar estado do jogo do arquivo
@@ -226,17 +324,22 @@ class GameController(QObject):
             
             # Atualizar estado do jogo
             self.game_state = loaded_state
+            player_civ = getattr(loaded_state, 'player_civ', None)
+            if player_civ is not None:
+                self.game_state.player_civ_id = player_civ.id
             
             # Inicializar controladores com o estado carregado
             self._initialize_controllers()
             
             # Emitir sinal para a GUI
-            self.game_loaded.emit()
+            self._emit(self.game_loaded)
             self.logger.info(f"Jogo carregado com sucesso: {save_name}")
             return True
             
         except Exception as e:
-            self.logger.error(f"Erro ao carregar o jogo: {e}", exc_info=True)
+            # O traceback só é montado se o nível ERROR estiver habilitado
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error("Erro ao carregar o jogo: %s", e, exc_info=True)
             return False
     
     def save_game(self, save_name: str, is_autosave: bool = False) -> bool:
@@ -257,7 +360,7 @@ class GameController(QObject):
             metadata = {
                 "is_autosave": is_autosave,
                 "turn": self.game_state.current_turn,
-                "player_civ": self.game_state.player_civ.id if self.game_state.player_civ else None
+                "player_civ": self.game_state.player_civ_id
             }
             
             # Salvar estado do jogo para arquivo
@@ -268,40 +371,65 @@ class GameController(QObject):
                 return False
             
             # Emitir sinal para a GUI
-            self.game_saved.emit()
+            self._emit(self.game_saved)
             self.logger.info(f"Jogo salvo com sucesso: {save_name}")
             return True
             
         except Exception as e:
-            self.logger.error(f"Erro ao salvar o jogo: {e}", exc_info=True)
+            # O traceback só é montado se o nível ERROR estiver habilitado
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error("Erro ao salvar o jogo: %s", e, exc_info=True)
             return False
     
     def end_turn(self) -> None:
-        """Finaliza o turno atual e processa os turnos da IA."""
-        self.logger.info(f"Finalizando turno {self.game_state.current_turn}")
-        
-        # Delegar para o controlador de turnos
-        self.turn_controller.end_turn()
-        
-        # Autosave a cada N turnos
-        if self.autosave_enabled and self.game_state.current_turn % self.autosave_interval == 0:
-            self.save_game('autosave', is_autosave=True)
+        """
+        Finaliza o turno atual e processa os turnos da IA.
         
-        # Emitir sinal para a GUI
-        self.turn_changed.emit()
+        Toda a lógica de turno fica no TurnController; os sinais da GUI e o
+        autosave são disparados pelo evento ``turn.ended`` (ver _on_turn_ended).
+        """
+        # Delegar para o controlador de turnos, agrupando os eventos do turno
+        self.event_bus.begin_batch()
+        try:
+            self.turn_controller.end_turn()
+        finally:
+            self.event_bus.end_batch()
     
     def start_autosave(self):
         """
         Inicia o autosave em background, salvando a cada N turnos se habilitado.
         """
+        self._ensure_config()
         if not self.autosave_enabled:
             self.logger.info("Autosave está desabilitado.")
             return
-        def get_state():
-            return self.game_state.to_dict() if self.game_state else None
-        self.save_manager.autosave(get_state, interval_sec=self.autosave_interval * 2)  # Exemplo: 2s por turno
+        if self._autosave_timer is None:
+            self._autosave_timer = QTimer(self)
+            self._autosave_timer.timeout.connect(self._on_autosave_timer)
+        self._autosave_timer.start(self.autosave_interval * 2 * 1000)  # Exemplo: 2s por turno
         self.logger.info(f"Autosave iniciado a cada {self.autosave_interval} turnos.")
     
+    def stop_autosave(self) -> None:
+        """Interrompe o autosave periódico, se estiver ativo."""
+        if self._autosave_timer is not None:
+            self._autosave_timer.stop()
+    
+    def _on_autosave_timer(self) -> None:
+        """Dispara o autosave em background se algum turno passou desde o último."""
+        gs = self.game_state
+        if gs is None or gs.current_turn == self._last_autosave_turn:
+            return
+        self._last_autosave_turn = gs.current_turn
+        
+        # O snapshot é tirado aqui, na thread da GUI, que é a única a mutar o
+        # estado; a thread de trabalho só calcula o hash, comprime e grava
+        try:
+            state_json = self.save_manager.serialize_state(gs)
+        except Exception as e:
+            self.logger.error(f"Erro ao preparar autosave: {e}", exc_info=True)
+            return
+        self._get_pool().submit(self.save_manager.autosave, state_json)
+    
     # Métodos de delegação para controladores especializados
     # Estes métodos implementam o padrão Facade, simplificando a interface
     
@@ -329,21 +457,58 @@ class GameController(QObject):
     # Estes métodos fornecem acesso simplificado aos dados do jogo
     
     def get_tech_tree(self) -> Dict[str, Any]:
-        """Obtém a árvore tecnológica."""
-        return self.data_loader.load_tech_tree()
+        """Obtém a árvore tecnológica (carregada uma única vez por sessão)."""
+        if self._tech_tree is None:
+            self._tech_tree = self.data_loader.load_tech_tree()
+        return self._tech_tree
     
     def get_building_data(self) -> Dict[str, Any]:
-        """Obtém dados de edifícios."""
-        return self.data_loader.load_buildings()
+        """Obtém dados de edifícios (carregados uma única vez por sessão)."""
+        if self._building_data is None:
+            self._building_data = self.data_loader.load_buildings()
+        return self._building_data
     
     def get_unit_data(self) -> Dict[str, Any]:
-        """Obtém dados de unidades."""
-        return self.data_loader.load_units()
+        """Obtém dados de unidades (carregados uma única vez por sessão)."""
+        if self._unit_data is None:
+            self._unit_data = self.data_loader.load_units()
+        return self._unit_data
+    
+    def invalidate_data_cache(self) -> None:
+        """
+        Descarta os dados estáticos em cache.
+        
+        Deve ser chamado apenas quando os arquivos de dados forem recarregados
+        (por exemplo, ao ativar ou recarregar um mod).
+        """
+        self._tech_tree = None
+        self._building_data = None
+        self._unit_data = None
+        if self.unit_controller is not None:
+            self.unit_controller.invalidate_static_info()
     
     def get_world(self) -> Optional[World]:
         """Obtém o mundo do jogo."""
         return self.game_state.world if self.game_state else None
     
+    def tile_snapshot(self, x: int, y: int) -> Tuple[Optional[Any], List, Optional[Any]]:
+        """
+        Obtém, numa única consulta, um tile e o que está sobre ele.
+        
+        Args:
+            x: Coordenada X do tile
+            y: Coordenada Y do tile
+            
+        Returns:
+            Tupla (tile, unidades, cidade); (None, [], None) se não houver
+            mundo ou o tile estiver fora do mapa.
+        """
+        world = self.get_world()
+        tile = world.get_tile(x, y) if world else None
+        if tile is None:
+            return None, [], None
+        return tile, tile.units, tile.city
+    
     def get_game_state(self) -> Optional[GameState]:
         """Obtém o estado atual do jogo."""
         return self.game_state
@@ -352,21 +517,40 @@ class GameController(QObject):
         """Obtém a civilização atual do jogador."""
         return self.game_state.player_civ if self.game_state else None
     
-    def get_all_units(self) -> List:
+    def iter_all_units(self) -> Iterator:
         """
-        Obtém todas as unidades no jogo.
+        Itera sobre todas as unidades no jogo sem criar uma lista intermediária.
         
         Returns:
-            Lista de todas as unidades.
+            Iterador sobre todas as unidades.
         """
         if not self.game_state:
-            return []
+            return iter(())
+        return itertools.chain.from_iterable(
+            civ.units for civ in self.game_state.civilizations
+        )
+    
+    def iter_all_cities(self) -> Iterator:
+        """
+        Itera sobre todas as cidades no jogo sem criar uma lista intermediária.
         
-        all_units = []
-        for civ in self.game_state.civilizations:
-            all_units.extend(civ.units)
+        Returns:
+            Iterador sobre todas as cidades.
+        """
+        if not self.game_state:
+            return iter(())
+        return itertools.chain.from_iterable(
+            civ.cities for civ in self.game_state.civilizations
+        )
+    
+    def get_all_units(self) -> List:
+        """
+        Obtém todas as unidades no jogo.
         
-        return all_units
+        Returns:
+            Lista de todas as unidades.
+        """
+        return list(self.iter_all_units())
     
     def get_all_cities(self) -> List:
         """
@@ -375,14 +559,7 @@ class GameController(QObject):
         Returns:
             Lista de todas as cidades.
         """
-        if not self.game_state:
-            return []
-        
-        all_cities = []
-        for civ in self.game_state.civilizations:
-            all_cities.extend(civ.cities)
-        
-        return all_cities
+        return list(self.iter_all_cities())
     
     def get_save_list(self) -> List[Dict[str, Any]]:
         """
@@ -427,6 +604,8 @@ class GameController(QObject):
         """
         if key in self.config:
             self.config[key] = value
+            self._flatten_config()
+            self.event_bus.publish("config.changed", {"key": key, "value": value})
             return True
         return False
     
@@ -435,13 +614,15 @@ class GameController(QObject):
         Obtém uma opção de configuração.
         
         Args:
-            key: Nome da opção.
+            key: Nome da opção; aceita caminhos pontuados para valores aninhados
+                (ex.: ``'world_sizes.standard.width'``).
             default: Valor padrão caso a opção não exista.
             
         Returns:
             Valor da opção ou o valor padrão.
         """
-        return self.config.get(key, default)
+        self._ensure_config()
+        return self._config_flat.get(key, default)
     
     def restart_game(self) -> None:
         """Reinicia o jogo atual com as mesmas configurações."""
@@ -465,11 +646,19 @@ class GameController(QObject):
         """Prepara o jogo para ser encerrado, salvando configurações e estado se necessário."""
         self.logger.info("Preparando para encerrar o jogo")
         
-        # Salvar configurações atuais
-        self.data_loader.save_config(self.config)
+        # Salvar configurações atuais (apenas se chegaram a ser carregadas)
+        if self._config is not None:
+            self.data_loader.save_config(self._config)
         
         # Fazer autosave final se um jogo estiver em andamento
         if self.game_state and self.autosave_enabled:
             self.save_game("exit_save", is_autosave=True)
         
+        self.stop_autosave()
+        
+        # Encerrar o pool de threads, se criado
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        
         self.logger.info("Jogo encerrado com sucesso")
@@ -7,12 +7,38 @@ from typing import Dict, Any, List, Optional
 from game.models.civilization import Civilization
 from game.utils.event_bus import EventBus
 
+try:
+    from numba import njit
+except ImportError:  # numba é opcional; sem ela o kernel roda em Python/NumPy
+    njit = None
+
+# A partir deste número de cidades o kernel compilado compensa o custo de despacho
+SCIENCE_KERNEL_MIN_CITIES = 16
+
+
+def _science_kernel_py(city_science, modifier):
+    """Soma a ciência das cidades, aplica o modificador e garante no mínimo 1."""
+    return max(1, int(city_science.sum() * modifier))
+
+
+if njit is not None:
+    _science_kernel = njit(cache=True, fastmath=True)(_science_kernel_py)
+else:
+    _science_kernel = _science_kernel_py
+
+
 class TechController:
     """
     Gerencia a pesquisa de tecnologias, incluindo o progresso de pesquisa
     e a descoberta de novas tecnologias.
     """
     
+    __slots__ = (
+        "logger", "game_controller", "event_bus", "tech_data",
+        "_prereqs_frozen", "_dependents", "_science_cache",
+        "_difficulty_data", "_speed_data", "_player_total", "_ai_total",
+    )
+    
     def __init__(self, game_controller, event_bus: Optional[EventBus] = None):
         """
         Inicializa o controlador de tecnologias.
@@ -27,6 +53,46 @@ class TechController:
         
         # Carregar dados de tecnologias
         self.tech_data = self.game_controller.data_loader.get_tech_tree()
+        
+        # Índices pré-calculados da árvore: pré-requisitos e dependentes diretos
+        self._prereqs_frozen = {
+            tid: tuple(td.get("prerequisites", ()))
+            for tid, td in self.tech_data.items()
+        }
+        self._dependents = {tid: [] for tid in self.tech_data}
+        for tid, prereqs in self._prereqs_frozen.items():
+            for prereq in prereqs:
+                self._dependents.setdefault(prereq, []).append(tid)
+        
+        # Cache de ciência: id(civ) -> (turno, versão da ciência das cidades, ciência)
+        self._science_cache: Dict[int, tuple] = {}
+        
+        # Dados de dificuldade/velocidade e modificadores derivados (carregados sob demanda)
+        self._difficulty_data = None
+        self._speed_data = None
+        self._player_total = 1.0
+        self._ai_total = 1.0
+        self.event_bus.subscribe("config.changed", self._on_config_changed)
+    
+    def _on_config_changed(self, data: Dict[str, Any]) -> None:
+        """Descarta dados derivados da configuração quando ela muda."""
+        self._difficulty_data = None
+        self._speed_data = None
+        self._science_cache.clear()
+    
+    def _load_modifier_data(self) -> None:
+        """Carrega os dados de dificuldade e velocidade a partir da configuração atual."""
+        config = self.game_controller.config
+        data_loader = self.game_controller.data_loader
+        difficulty = config.get("difficulty", "prince")
+        game_speed = config.get("game_speed", "standard")
+        self._difficulty_data = data_loader.get_difficulty_data(difficulty)
+        self._speed_data = data_loader.get_game_speed_data(game_speed)
+        
+        # Modificadores finais de ciência (dificuldade x velocidade)
+        speed_mod = self._speed_data.get("research_speed", 1.0)
+        self._player_total = self._difficulty_data.get("player_science_modifier", 1.0) * speed_mod
+        self._ai_total = self._difficulty_data.get("ai_science_modifier", 1.0) * speed_mod
     
     def start_research(self, civ: Civilization, tech_id: str) -> Dict[str, Any]:
         """
@@ -47,14 +113,14 @@ class TechController:
             return {"success": False, "message": f"Tecnologia não encontrada: {tech_id}"}
         
         # Verificar se a civilização já possui a tecnologia
-        if tech_id in civ.technologies:
+        known = civ._tech_set
+        if tech_id in known:
             self.logger.warning(f"{civ.name} já possui a tecnologia {tech_id}")
             return {"success": False, "message": f"Você já possui esta tecnologia"}
         
         # Verificar pré-requisitos
-        prerequisites = self.tech_data[tech_id].get("prerequisites", [])
-        for prereq in prerequisites:
-            if prereq not in civ.technologies:
+        for prereq in self._prereqs_frozen[tech_id]:
+            if prereq not in known:
                 self.logger.warning(f"{civ.name} não possui pré-requisito {prereq} para {tech_id}")
                 return {
                     "success": False, 
@@ -66,11 +132,12 @@ class TechController:
         civ.research_progress = 0
         
         # Publicar evento de início de pesquisa
-        self.event_bus.publish("tech.research_started", {
-            "civ_id": civ.id,
-            "tech_id": tech_id,
-            "tech_name": self.tech_data[tech_id]["name"]
-        })
+        if self.event_bus.has("tech.research_started"):
+            self.event_bus.publish("tech.research_started", {
+                "civ_id": civ.id,
+                "tech_id": tech_id,
+                "tech_name": self.tech_data[tech_id]["name"]
+            })
         
         return {
             "success": True,
@@ -117,46 +184,47 @@ class TechController:
         self.logger.info(f"{civ.name} completou a pesquisa de {tech_id}")
         
         # Adicionar tecnologia à lista de tecnologias da civilização
-        civ.technologies.append(tech_id)
+        civ.add_technology(tech_id)
         
         # Resetar pesquisa atual
         civ.current_research = None
         civ.research_progress = 0
         
         # Publicar evento de conclusão de pesquisa
-        self.event_bus.publish("tech.research_completed", {
-            "civ_id": civ.id,
-            "tech_id": tech_id,
-            "tech_name": self.tech_data[tech_id]["name"]
-        })
+        if self.event_bus.has("tech.research_completed"):
+            self.event_bus.publish("tech.research_completed", {
+                "civ_id": civ.id,
+                "tech_id": tech_id,
+                "tech_name": self.tech_data[tech_id]["name"]
+            })
         
-        # Verificar tecnologias desbloqueadas
-        self._check_unlocked_techs(civ)
+        # Verificar tecnologias desbloqueadas apenas se alguém estiver ouvindo;
+        # a lista de disponíveis é recalculada sob demanda (get_available_techs)
+        if self.event_bus.has("tech.unlocked"):
+            self._check_unlocked_techs(civ, tech_id)
     
-    def _check_unlocked_techs(self, civ: Civilization) -> None:
+    def _check_unlocked_techs(self, civ: Civilization, completed_tech_id: str) -> None:
         """
-        Verifica quais tecnologias foram desbloqueadas para uma civilização.
+        Verifica quais tecnologias foram desbloqueadas pela conclusão de uma pesquisa.
+        
+        Apenas os dependentes diretos da tecnologia concluída podem ter sido
+        desbloqueados, então o restante da árvore não é percorrido.
         
         Args:
             civ: Civilização a ser verificada
+            completed_tech_id: ID da tecnologia recém-concluída
         """
         unlocked_techs = []
+        known = civ._tech_set
+        prereqs_frozen = self._prereqs_frozen
         
-        for tech_id, tech_data in self.tech_data.items():
+        for tech_id in self._dependents.get(completed_tech_id, ()):
             # Pular tecnologias já pesquisadas
-            if tech_id in civ.technologies:
+            if tech_id in known:
                 continue
             
             # Verificar se todos os pré-requisitos foram atendidos
-            prerequisites = tech_data.get("prerequisites", [])
-            all_prereqs_met = True
-            
-            for prereq in prerequisites:
-                if prereq not in civ.technologies:
-                    all_prereqs_met = False
-                    break
-            
-            if all_prereqs_met:
+            if all(prereq in known for prereq in prereqs_frozen[tech_id]):
                 unlocked_techs.append(tech_id)
         
         # Publicar evento de tecnologias desbloqueadas
@@ -176,35 +244,50 @@ class TechController:
         Returns:
             Quantidade de ciência produzida
         """
-        # Base de ciência
-        science = 0
-        
-        # Adicionar ciência das cidades
-        for city in civ.cities:
-            science += city.science_output
-        
-        # Aplicar modificadores
-        science_modifier = 1.0
-        
-        # Modificador de dificuldade
-        if civ == self.game_controller.game_state.player_civ:
-            difficulty = self.game_controller.config.get("difficulty", "prince")
-            difficulty_data = self.game_controller.data_loader.get_difficulty_data(difficulty)
-            science_modifier *= difficulty_data.get("player_science_modifier", 1.0)
+        # Reutilizar o valor já calculado neste turno, se nenhuma cidade da
+        # civilização mudou de ciência desde então
+        game_state = self.game_controller.game_state
+        turn = game_state.current_turn
+        version = civ._science_version
+        cached = self._science_cache.get(id(civ))
+        if cached and cached[0] == turn and cached[1] == version:
+            return cached[2]
+        
+        if self._difficulty_data is None:
+            self._load_modifier_data()
+        
+        # Modificador pré-calculado (dificuldade x velocidade do jogo)
+        if civ is game_state.player_civ:
+            science_modifier = self._player_total
         else:
-            difficulty = self.game_controller.config.get("difficulty", "prince")
-            difficulty_data = self.game_controller.data_loader.get_difficulty_data(difficulty)
-            science_modifier *= difficulty_data.get("ai_science_modifier", 1.0)
+            science_modifier = self._ai_total
         
-        # Modificador de velocidade do jogo
-        game_speed = self.game_controller.config.get("game_speed", "standard")
-        speed_data = self.game_controller.data_loader.get_game_speed_data(game_speed)
-        science_modifier *= speed_data.get("research_speed", 1.0)
+        # Soma da ciência das cidades com o modificador aplicado
+        # (garantindo pelo menos 1 de ciência por turno)
+        city_science = civ._city_science
+        if len(city_science) >= SCIENCE_KERNEL_MIN_CITIES:
+            science = _science_kernel(city_science, science_modifier)
+        else:
+            science = _science_kernel_py(city_science, science_modifier)
         
-        # Aplicar modificador
-        science = int(science * science_modifier)
+        # Com ai_parallel, várias threads do turno escrevem aqui, cada uma com
+        # a chave da própria civilização (uma atribuição de dict, atômica sob a
+        # GIL); a carga preguiçosa dos modificadores acima é idempotente
+        self._science_cache[id(civ)] = (turn, version, science)
+        return science
+    
+    def get_cached_science(self, civ: Civilization) -> int:
+        """
+        Obtém a última ciência por turno calculada para uma civilização.
         
-        return max(1, science)  # Garantir pelo menos 1 de ciência por turno
+        Args:
+            civ: Civilização a ser consultada
+            
+        Returns:
+            Ciência do último cálculo, ou 0 se ainda não houver cálculo
+        """
+        cached = self._science_cache.get(id(civ))
+        return cached[2] if cached else 0
     
     def get_research_progress(self, civ: Civilization) -> Dict[str, Any]:
         """
@@ -229,11 +312,14 @@ class TechController:
         tech_id = civ.current_research
         tech_data = self.tech_data.get(tech_id, {})
         tech_cost = tech_data.get("cost", 0)
-        science_per_turn = self._calculate_science(civ)
+        science_per_turn = self._calculate_science(civ)  # Em cache durante o turno
         
-        # Calcular turnos restantes
+        # Calcular turnos restantes (divisão com arredondamento para cima)
         remaining_science = tech_cost - civ.research_progress
-        turns_remaining = (remaining_science + science_per_turn - 1) // science_per_turn  # Arredondamento para cima
+        if remaining_science <= 0:
+            turns_remaining = 0
+        else:
+            turns_remaining = -(-remaining_science // science_per_turn)
         
         return {
             "researching": True,
@@ -255,23 +341,21 @@ class TechController:
         Returns:
             Lista de dicionários com informações sobre as tecnologias disponíveis
         """
+        # Reutilizar a lista enquanto nenhuma tecnologia nova for concluída
+        if not civ._unlocked_dirty and civ._unlocked_cache is not None:
+            return list(civ._unlocked_cache)
+        
         available_techs = []
+        known = civ._tech_set
+        prereqs_frozen = self._prereqs_frozen
         
         for tech_id, tech_data in self.tech_data.items():
             # Pular tecnologias já pesquisadas
-            if tech_id in civ.technologies:
+            if tech_id in known:
                 continue
             
             # Verificar se todos os pré-requisitos foram atendidos
-            prerequisites = tech_data.get("prerequisites", [])
-            all_prereqs_met = True
-            
-            for prereq in prerequisites:
-                if prereq not in civ.technologies:
-                    all_prereqs_met = False
-                    break
-            
-            if all_prereqs_met:
+            if all(prereq in known for prereq in prereqs_frozen[tech_id]):
                 available_techs.append({
                     "id": tech_id,
                     "name": tech_data.get("name", tech_id),
@@ -281,4 +365,6 @@ class TechController:
                     "unlocks": tech_data.get("unlocks", [])
                 })
         
-        return available_techs
+        civ._unlocked_cache = available_techs
+        civ._unlocked_dirty = False
+        return list(available_techs)
@@ -1,11 +1,66 @@
 """
 Controlador responsável por gerenciar a lógica de turnos do jogo.
 """
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
 
 from game.models.civilization import Civilization
-from game.utils.event_bus import EventBus
+from game.utils.event_bus import EventBus, worker_event_buffer
+
+# Períodos de atualização (em turnos) por nível de detalhe da IA: L0..L4
+LOD_PERIODS = (1, 2, 4, 8, 16)
+
+# Tamanho máximo do pool de payloads de eventos reutilizáveis
+PAYLOAD_POOL_SIZE = 32
+
+
+def _positions(civ: Civilization) -> np.ndarray:
+    """Coordenadas (x, y) das cidades e unidades de uma civilização, como array (n, 2)."""
+    return np.array(
+        [(obj.x, obj.y) for obj in itertools.chain(civ.cities, civ.units)],
+        dtype=np.int32
+    ).reshape(-1, 2)
+
+
+class TurnWorkerContext:
+    """
+    Conjunto de trabalho isolado de uma civilização processada em paralelo.
+    
+    Enquanto o contexto está ativo, os eventos publicados na thread corrente
+    são acumulados em ``_event_buffer`` em vez de entregues imediatamente.
+    """
+    
+    __slots__ = ("civ_id", "_event_buffer", "_token")
+    
+    def __init__(self, civ_id: str):
+        self.civ_id = civ_id
+        self._event_buffer: List[Tuple[str, Dict[str, Any]]] = []
+        self._token = None
+    
+    def __enter__(self) -> "TurnWorkerContext":
+        self._token = worker_event_buffer.set(self._event_buffer)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        worker_event_buffer.reset(self._token)
+        self._token = None
+    
+    def drain(self, event_bus: EventBus) -> None:
+        """
+        Republica, na ordem original, os eventos acumulados.
+        
+        Args:
+            event_bus: Barramento onde os eventos serão entregues
+        """
+        buffer = self._event_buffer
+        self._event_buffer = []
+        publish = event_bus.publish
+        for event_type, event_data in buffer:
+            publish(event_type, event_data)
+
 
 class TurnController:
     """
@@ -13,6 +68,12 @@ class TurnController:
     para todas as civilizações.
     """
     
+    __slots__ = (
+        "logger", "game_controller", "event_bus",
+        "_payload_pool",
+        "_city_end", "_unit_end", "_unit_reset", "_city_prod", "_tech_proc", "_ai",
+    )
+    
     def __init__(self, game_controller, event_bus: Optional[EventBus] = None):
         """
         Inicializa o controlador de turnos.
@@ -25,37 +86,288 @@ class TurnController:
         self.game_controller = game_controller
         self.event_bus = event_bus or EventBus()
         
+        # Pool de dicionários reutilizados como payload de eventos por civilização
+        self._payload_pool: List[Dict[str, Any]] = []
+        
+        # Métodos vinculados dos demais controladores (ver attach_controllers)
+        self._city_end = None
+        self._unit_end = None
+        self._unit_reset = None
+        self._city_prod = None
+        self._tech_proc = None
+        self._ai = None
+        
         # Registrar para eventos relevantes
         if event_bus:
             self.event_bus.subscribe("unit.moved", self._check_unit_turn_complete)
             self.event_bus.subscribe("city.production_complete", self._on_production_complete)
     
+    def attach_controllers(self) -> None:
+        """
+        Captura referências diretas aos métodos dos controladores especializados.
+        
+        Deve ser chamado depois que todos os controladores forem criados (e
+        novamente sempre que forem recriados, como ao carregar um jogo), para
+        evitar cadeias ``game_controller.X_controller.metodo`` nos laços de turno.
+        """
+        gc = self.game_controller
+        self._city_end = gc.city_controller.process_end_of_turn
+        self._city_prod = gc.city_controller.process_production
+        self._unit_end = gc.unit_controller.process_end_of_turn
+        self._unit_reset = gc.unit_controller.reset_movement
+        self._tech_proc = gc.tech_controller.process_research
+        self._ai = gc.civ_controller.process_ai_turn
+    
     def end_turn(self) -> None:
         """
         Finaliza o turno atual e processa os turnos da IA.
+        
+        Todas as civilizações são percorridas uma única vez: fim de turno,
+        decisão da IA (se não for o jogador) e início do próximo turno.
+        
+        Os eventos por civilização são agrupados em ``turn.civ_end_batch`` e
+        ``turn.civ_start_batch`` (com a lista de ``civ_ids``), publicados uma
+        vez por turno. Os eventos legados ``turn.civ_end``/``turn.civ_start``
+        continuam disponíveis com a opção ``legacy_civ_events``.
+        
+        Com a opção de configuração ``ai_parallel`` ativa, apenas a pesquisa
+        das civilizações da IA roda em um pool de threads: ela lê e escreve só
+        o estado da própria civilização. Cidades, unidades e decisões da IA
+        escrevem em estado compartilhado (``Tile.units``, ``unit_index``,
+        visibilidade de outras civilizações) e continuam na thread principal.
+        Cada IA publica os eventos da pesquisa em um TurnWorkerContext
+        próprio; ao final, os buffers são republicados na thread principal na
+        ordem das civilizações.
+        
+        Com ``ai_lod_enabled``, civilizações da IA distantes ou sem contato com
+        o jogador só recebem o processamento completo a cada N turnos (ver
+        LOD_PERIODS); nos demais turnos recebem uma atualização estatística
+        barata. Isso troca precisão da simulação distante por desempenho.
+        
+        Civilizações inativas (sem cidades, unidades ou pesquisa) são ignoradas.
         """
-        self.logger.info(f"Finalizando turno {self.game_state.current_turn}")
+        game_state = self.game_state
+        all_civs = game_state.civilizations
+        civs = [civ for civ in all_civs if civ.is_active]
+        player = game_state.player_civ
+        current_turn = game_state.current_turn
+        next_turn = current_turn + 1
+        
+        self.logger.info(f"Finalizando turno {current_turn}")
         
-        # Processar fim de turno para civilização do jogador
-        self.process_end_of_turn(self.game_state.player_civ)
+        # Referências locais para evitar cadeias de atributos no laço
+        if self._city_end is None:
+            self.attach_controllers()
+        city_end = self._city_end
+        city_production = self._city_prod
+        unit_end = self._unit_end
+        unit_reset = self._unit_reset
+        process_research = self._tech_proc
+        process_ai_turn = self._ai
         
-        # Processar turnos da IA
-        for civ in self.game_state.civilizations:
-            if civ != self.game_state.player_civ:
-                self.process_ai_turn(civ)
+        has = self.event_bus.has
+        legacy_events = self.game_controller.get_config_option("legacy_civ_events", False)
+        legacy_end = legacy_events and has("turn.civ_end")
+        legacy_start = legacy_events and has("turn.civ_start")
+        civ_end_ids = []
+        civ_start_ids = []
+        
+        ai_parallel = self.game_controller.get_config_option("ai_parallel", False)
+        publish = self.event_bus.publish
+        
+        def end_civ_turn(civ):
+            # Fim de turno de cidades e unidades (estado compartilhado)
+            for city in civ.cities:
+                city_end(city)
+            for unit in civ.units:
+                unit_end(unit)
+        
+        def research_civ_turn(civ):
+            # Pesquisa: só o estado da própria civilização
+            process_research(civ)
+            if legacy_end:
+                publish("turn.civ_end", {"civ_id": civ.id, "turn": current_turn})
+        
+        def start_civ_turn(civ):
+            # Tomada de decisão da IA
+            if civ is not player:
+                process_ai_turn(civ)
+            
+            # Início do próximo turno
+            for unit in civ.units:
+                unit_reset(unit)
+            for city in civ.cities:
+                city_production(city)
+            civ_start_ids.append(civ.id)
+            if legacy_start:
+                publish("turn.civ_start", {"civ_id": civ.id, "turn": next_turn})
+        
+        def run_civ_turn(civ):
+            end_civ_turn(civ)
+            research_civ_turn(civ)
+            civ_end_ids.append(civ.id)
+            start_civ_turn(civ)
+        
+        # Selecionar as civilizações com processamento completo neste turno
+        if self.game_controller.get_config_option("ai_lod_enabled", False):
+            periods = self._classify_lod(civs, player)
+            scheduled = []
+            # A fase de cada civilização é sua posição na lista completa, que
+            # não muda quando outras civilizações ficam inativas
+            phases = {civ.id: index for index, civ in enumerate(all_civs)}
+            for civ in civs:
+                period = periods.get(civ.id, 1)
+                if period == 1 or current_turn % period == phases[civ.id] % period:
+                    scheduled.append(civ)
+                else:
+                    self._statistical_update(civ)
+        else:
+            scheduled = civs
+        
+        if ai_parallel:
+            for civ in scheduled:
+                end_civ_turn(civ)
+            
+            ai_civs = [civ for civ in scheduled if civ is not player]
+            if player is not None and player in scheduled:
+                research_civ_turn(player)
+            
+            def run_isolated(civ):
+                with TurnWorkerContext(civ.id) as context:
+                    research_civ_turn(civ)
+                return context
+            
+            # Aguardar todas as IAs antes de republicar (os handlers podem ler o
+            # estado); map preserva a ordem das civilizações, tornando a
+            # republicação determinística
+            # Usa o pool por civilização do GameController (encerrado em exit_game)
+            contexts = list(self.game_controller._get_pool().map(run_isolated, ai_civs))
+            for context in contexts:
+                context.drain(self.event_bus)
+            civ_end_ids.extend(civ.id for civ in scheduled)
+            
+            for civ in scheduled:
+                start_civ_turn(civ)
+        else:
+            for civ in scheduled:
+                run_civ_turn(civ)
         
         # Incrementar contador de turnos
-        self.game_state.current_turn += 1
+        game_state.current_turn = next_turn
         
-        # Processar início de turno para todas as civilizações
-        for civ in self.game_state.civilizations:
-            self.process_start_of_turn(civ)
+        # Publicar eventos agrupados por civilização
+        if has("turn.civ_end_batch"):
+            publish("turn.civ_end_batch", {"turn": current_turn, "civ_ids": civ_end_ids})
+        if has("turn.civ_start_batch"):
+            publish("turn.civ_start_batch", {"turn": next_turn, "civ_ids": civ_start_ids})
         
         # Publicar evento de fim de turno
-        self.event_bus.publish("turn.ended", {
-            "turn": self.game_state.current_turn,
-            "player_civ": self.game_state.player_civ.id if self.game_state.player_civ else None
-        })
+        if has("turn.ended"):
+            publish("turn.ended", {
+                "turn": next_turn,
+                "player_civ": player.id if player else None
+            })
+    
+    def _classify_lod(self, civs: List[Civilization],
+                      player: Optional[Civilization]) -> Dict[str, int]:
+        """
+        Classifica as civilizações da IA em níveis de detalhe.
+        
+        O nível depende do estado diplomático com o jogador (guerra mantém
+        detalhe máximo), do contato e da distância entre a cidade/unidade mais
+        próxima da IA e as do jogador.
+        
+        Args:
+            civs: Civilizações do jogo
+            player: Civilização do jogador
+            
+        Returns:
+            Dicionário {civ_id: período de atualização em turnos}
+        """
+        periods = {}
+        if player is None:
+            return periods
+        
+        player_positions = _positions(player)
+        
+        for civ in civs:
+            if civ is player:
+                continue
+            
+            if civ.relations.get(player.id) == 'war':
+                periods[civ.id] = LOD_PERIODS[0]
+                continue
+            
+            # Menor distância de Chebyshev entre todos os pares (IA x jogador)
+            positions = _positions(civ)
+            if len(positions) and len(player_positions):
+                distance = int(np.abs(positions[:, None, :] - player_positions[None, :, :])
+                               .max(axis=2).min())
+            else:
+                distance = float('inf')
+            in_contact = player.id in civ.known_civs
+            
+            if in_contact and distance <= 10:
+                tier = 0
+            elif in_contact and distance <= 20:
+                tier = 1
+            elif in_contact:
+                tier = 2
+            elif distance <= 30:
+                tier = 3
+            else:
+                tier = 4
+            periods[civ.id] = LOD_PERIODS[tier]
+        
+        return periods
+    
+    def _statistical_update(self, civ: Civilization) -> None:
+        """
+        Atualização barata de uma civilização fora do seu turno de processamento.
+        
+        Avança a pesquisa com a última ciência calculada, sem percorrer
+        cidades e unidades individualmente.
+        
+        Args:
+            civ: Civilização a ser atualizada
+        """
+        if getattr(civ, "current_research", None):
+            science = self.game_controller.tech_controller.get_cached_science(civ)
+            civ.research_progress = getattr(civ, "research_progress", 0) + science
+    
+    def _borrow_payload(self) -> Dict[str, Any]:
+        """Obtém um dicionário de payload vazio do pool (ou cria um novo)."""
+        try:
+            return self._payload_pool.pop()
+        except IndexError:
+            return {}
+    
+    def _return_payload(self, payload: Dict[str, Any]) -> None:
+        """Limpa um payload e o devolve ao pool."""
+        if len(self._payload_pool) < PAYLOAD_POOL_SIZE:
+            payload.clear()
+            self._payload_pool.append(payload)
+    
+    def _publish_pooled(self, event_type: str, civ_id: str, turn: int) -> None:
+        """
+        Publica um evento por civilização usando um payload do pool.
+        
+        Os inscritos recebem o payload de forma síncrona e não devem guardar
+        referência a ele: o dicionário é reaproveitado após a publicação.
+        Em um lote aberto (EventBus.is_batching) ou em um TurnWorkerContext o
+        payload fica retido na fila e, por isso, não é devolvido ao pool.
+        
+        Args:
+            event_type: Tipo de evento
+            civ_id: ID da civilização
+            turn: Turno atual
+        """
+        payload = self._borrow_payload()
+        payload["civ_id"] = civ_id
+        payload["turn"] = turn
+        self.event_bus.publish(event_type, payload)
+        if not self.event_bus.is_batching and worker_event_buffer.get() is None:
+            self._return_payload(payload)
     
     def process_end_of_turn(self, civ: Civilization) -> None:
         """
@@ -64,24 +376,27 @@ class TurnController:
         Args:
             civ: Civilização a ser processada
         """
+        if not civ.is_active:
+            return
+        
         self.logger.debug(f"Processando fim de turno para {civ.name}")
         
         # Processar cidades
+        city_end = self._city_end
         for city in civ.cities:
-            self.game_controller.city_controller.process_end_of_turn(city)
+            city_end(city)
         
         # Processar unidades
+        unit_end = self._unit_end
         for unit in civ.units:
-            self.game_controller.unit_controller.process_end_of_turn(unit)
+            unit_end(unit)
         
         # Processar pesquisa
-        self.game_controller.tech_controller.process_research(civ)
+        self._tech_proc(civ)
         
         # Publicar evento de fim de turno para civilização
-        self.event_bus.publish("turn.civ_end", {
-            "civ_id": civ.id,
-            "turn": self.game_state.current_turn
-        })
+        if self.event_bus.has("turn.civ_end"):
+            self._publish_pooled("turn.civ_end", civ.id, self.game_state.current_turn)
     
     def process_start_of_turn(self, civ: Civilization) -> None:
         """
@@ -90,21 +405,24 @@ class TurnController:
         Args:
             civ: Civilização a ser processada
         """
+        if not civ.is_active:
+            return
+        
         self.logger.debug(f"Processando início de turno para {civ.name}")
         
         # Resetar pontos de movimento para unidades
+        unit_reset = self._unit_reset
         for unit in civ.units:
-            self.game_controller.unit_controller.reset_movement(unit)
+            unit_reset(unit)
         
         # Processar produção de cidades
+        city_prod = self._city_prod
         for city in civ.cities:
-            self.game_controller.city_controller.process_production(city)
+            city_prod(city)
         
         # Publicar evento de início de turno para civilização
-        self.event_bus.publish("turn.civ_start", {
-            "civ_id": civ.id,
-            "turn": self.game_state.current_turn
-        })
+        if self.event_bus.has("turn.civ_start"):
+            self._publish_pooled("turn.civ_start", civ.id, self.game_state.current_turn)
     
     def process_ai_turn(self, civ: Civilization) -> None:
         """
@@ -119,7 +437,7 @@ class TurnController:
         self.process_end_of_turn(civ)
         
         # Tomada de decisão da IA
-        self.game_controller.civ_controller.process_ai_turn(civ)
+        self._ai(civ)
         
         # Processar início de turno
         self.process_start_of_turn(civ)
@@ -17,6 +17,8 @@ class UnitController:
         """
         self.game_controller = game_controller
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Campos estáticos de get_unit_info por tipo de unidade
+        self._static_info_cache = {}
     
     @property
     def game_state(self):
@@ -36,12 +38,7 @@ class UnitController:
         if not self.game_state:
             return None
         
-        for civ in self.game_state.civilizations:
-            for unit in civ.units:
-                if unit.id == unit_id:
-                    return unit
-        
-        return None
+        return self.game_state.unit_index.get(unit_id)
     
     def get_units_at_position(self, x, y):
         """
@@ -85,51 +82,59 @@ class UnitController:
         if unit.has_acted:
             return {'success': False, 'reason': 'already_acted'}
         
+        # Referências locais usadas ao longo do movimento
+        game_state = self.game_state
+        get_tile = game_state.world.get_tile
+        
         # Verifica se o destino é válido
-        target_tile = self.game_state.world.get_tile(target_x, target_y)
+        target_tile = get_tile(target_x, target_y)
         if not target_tile:
             return {'success': False, 'reason': 'invalid_destination'}
         
         # Verifica se a unidade pode mover para o tile alvo
-        if not unit.can_move_to(target_tile, self.game_state.terrain_data):
+        if not unit.can_move_to(target_tile, game_state.terrain_data):
             return {'success': False, 'reason': 'impassable_terrain'}
         
         # Calcula o caminho
+        old_x, old_y = unit.x, unit.y
         path = self.game_controller.world_controller.get_path(
-            unit.x, unit.y, target_x, target_y, unit
+            old_x, old_y, target_x, target_y, unit
         )
         
         if not path:
             return {'success': False, 'reason': 'no_path'}
         
         # Verifica se o caminho é muito longo
-        if len(path) > unit.moves_left:
+        moves_left = unit.moves_left
+        if len(path) > moves_left:
             # Move o máximo possível
-            path = path[:unit.moves_left]
+            path = path[:moves_left]
         
         # Remove a unidade do tile atual
-        current_tile = self.game_state.world.get_tile(unit.x, unit.y)
+        current_tile = get_tile(old_x, old_y)
         if current_tile:
             current_tile.remove_unit(unit)
         
-        # Atualiza a posição da unidade
-        last_pos = path[-1]
-        unit.x, unit.y = last_pos
+        # Atualiza a posição da unidade (e a visibilidade da civilização)
+        new_x, new_y = path[-1]
+        unit.x, unit.y = new_x, new_y
+        unit._update_owner_visibility(old_x, old_y)
         
         # Adiciona a unidade ao novo tile
-        new_tile = self.game_state.world.get_tile(unit.x, unit.y)
+        new_tile = get_tile(new_x, new_y)
         if new_tile:
             new_tile.add_unit(unit)
         
         # Atualiza os movimentos restantes
-        unit.moves_left -= len(path)
+        moves_left -= len(path)
+        unit.moves_left = moves_left
         
-        self.logger.info(f"Unidade {unit.type} movida para ({unit.x}, {unit.y})")
+        self.logger.info(f"Unidade {unit.type} movida para ({new_x}, {new_y})")
         
         return {
             'success': True,
             'path': path,
-            'moves_left': unit.moves_left
+            'moves_left': moves_left
         }
     
     def attack(self, unit, target_x, target_y):
@@ -151,40 +156,32 @@ class UnitController:
         if unit.has_acted:
             return {'success': False, 'reason': 'already_acted'}
         
+        # Verifica se o alvo está ao alcance antes de consultar o mapa
+        distance = abs(unit.x - target_x) + abs(unit.y - target_y)
+        max_range = unit.range if unit.ranged_strength > 0 else 1
+        if distance > max_range:
+            return {'success': False, 'reason': 'out_of_range'}
+        
         # Verifica se o alvo é válido
         target_tile = self.game_state.world.get_tile(target_x, target_y)
         if not target_tile:
             return {'success': False, 'reason': 'invalid_target'}
         
-        # Calcula a distância
-        distance = abs(unit.x - target_x) + abs(unit.y - target_y)
-        
-        # Verifica se o alvo está ao alcance
-        if unit.ranged_strength > 0:
-            if distance > unit.range:
-                return {'success': False, 'reason': 'out_of_range'}
-        else:
-            if distance > 1:
-                return {'success': False, 'reason': 'out_of_range'}
-        
         # Encontra o alvo
         target = None
+        my_oid = unit.owner.id if unit.owner else None
         
-        # Verifica se há uma cidade no tile
-        if target_tile.city:
-            city = target_tile.city
-            
-            # Verifica se a cidade é inimiga
-            if city.owner and unit.owner and city.owner.id != unit.owner.id:
-                target = city
-        
-        # Se não há cidade inimiga, verifica se há unidades inimigas
-        if not target and target_tile.units:
-            for target_unit in target_tile.units:
-                # Verifica se a unidade é inimiga
-                if target_unit.owner and unit.owner and target_unit.owner.id != unit.owner.id:
-                    target = target_unit
-                    break
+        # Verifica se há uma cidade inimiga no tile
+        city = target_tile.city
+        if city and my_oid is not None and city.owner and city.owner.id != my_oid:
+            target = city
+        
+        # Se não há cidade inimiga, procura a primeira unidade inimiga
+        if not target and my_oid is not None and target_tile.units:
+            target = next(
+                (u for u in target_tile.units if u.owner is not None and u.owner.id != my_oid),
+                None
+            )
         
         if not target:
             return {'success': False, 'reason': 'no_valid_target'}
@@ -194,7 +191,7 @@ class UnitController:
         
         # Verifica se o alvo foi destruído
         if target.health <= 0:
-            if isinstance(target, type(unit)):  # É uma unidade
+            if getattr(target, 'is_unit', False):  # É uma unidade
                 # Remove a unidade do tile
                 target_tile.remove_unit(target)
                 
@@ -318,13 +315,21 @@ class UnitController:
             'promotions': unit.promotions
         }
         
-        # Adiciona informações do tipo de unidade
-        unit_data = self.game_state.unit_data.get(unit.type, {})
-        info.update({
-            'name': unit_data.get('name', unit.type),
-            'description': unit_data.get('description', ''),
-            'cost': unit_data.get('cost', 0),
-            'maintenance': unit_data.get('maintenance', 0)
-        })
+        # Adiciona informações do tipo de unidade (calculadas uma vez por tipo)
+        static_info = self._static_info_cache.get(unit.type)
+        if static_info is None:
+            unit_data = self.game_state.unit_data.get(unit.type, {})
+            static_info = {
+                'name': unit_data.get('name', unit.type),
+                'description': unit_data.get('description', ''),
+                'cost': unit_data.get('cost', 0),
+                'maintenance': unit_data.get('maintenance', 0)
+            }
+            self._static_info_cache[unit.type] = static_info
+        info.update(static_info)
         
         return info
+    
+    def invalidate_static_info(self):
+        """Descarta o cache de informações por tipo de unidade (ex.: ao recarregar dados)."""
+        self._static_info_cache.clear()
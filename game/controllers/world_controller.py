@@ -1,7 +1,21 @@
 # game/controllers/world_controller.py
+import heapq
 import logging
-import random
+
+import numpy as np
+
 from game.models.game_state import GameState
+from game.utils.pathfinding import NUMBA_AVAILABLE, NO_PATH, astar
+
+# Limite de nós expandidos por busca de caminho, para limitar casos patológicos
+MAX_PATH_EXPANSIONS = 10000
+
+# Terrenos sorteados por generate_world e seus índices nesta tupla
+TERRAIN_TYPES = ("plains", "hills", "mountains", "forest", "desert", "water")
+TERRAIN_INDEX = {terrain: index for index, terrain in enumerate(TERRAIN_TYPES)}
+
+# Deslocamentos dos vizinhos ortogonais (norte, leste, sul, oeste)
+NEIGHBOR_OFFSETS = ((0, -1), (1, 0), (0, 1), (-1, 0))
 
 class WorldController:
     """
@@ -50,39 +64,18 @@ class WorldController:
         Returns:
             list: Lista de tiles visíveis.
         """
-        if not self.world:
+        world = self.world
+        if not world:
             return []
         
-        # Implementação básica: tiles visíveis são aqueles próximos a unidades e cidades
-        visible_tiles = set()
+        # Contagem de observadores mantida de forma incremental pela civilização;
+        # reconstruída apenas na primeira consulta ou se o mundo mudou de tamanho
+        visibility = civilization._visibility
+        if visibility is None or visibility.shape != (world.height, world.width):
+            visibility = civilization.build_visibility(world.width, world.height)
         
-        # Adiciona tiles próximos a cidades
-        for city in civilization.cities:
-            city_tile = self.world.get_tile(city.x, city.y)
-            if city_tile:
-                visible_tiles.add(city_tile)
-                
-                # Adiciona tiles em um raio de 2 da cidade
-                for dy in range(-2, 3):
-                    for dx in range(-2, 3):
-                        neighbor = self.world.get_tile(city.x + dx, city.y + dy)
-                        if neighbor:
-                            visible_tiles.add(neighbor)
-        
-        # Adiciona tiles próximos a unidades
-        for unit in civilization.units:
-            unit_tile = self.world.get_tile(unit.x, unit.y)
-            if unit_tile:
-                visible_tiles.add(unit_tile)
-                
-                # Adiciona tiles em um raio de 1 da unidade
-                for dy in range(-1, 2):
-                    for dx in range(-1, 2):
-                        neighbor = self.world.get_tile(unit.x + dx, unit.y + dy)
-                        if neighbor:
-                            visible_tiles.add(neighbor)
-        
-        return list(visible_tiles)
+        tile_flat = world._tile_flat
+        return [tile_flat[index] for index in np.flatnonzero(visibility).tolist()]
     
     def get_tile_info(self, x, y):
         """
@@ -136,7 +129,7 @@ class WorldController:
     
     def get_path(self, start_x, start_y, end_x, end_y, unit=None):
         """
-        Encontra um caminho entre dois pontos.
+        Encontra o caminho de menor custo entre dois pontos usando A*.
         
         Args:
             start_x (int): Coordenada X inicial.
@@ -148,39 +141,122 @@ class WorldController:
         Returns:
             list: Lista de coordenadas (x, y) representando o caminho, ou None se não houver caminho.
         """
-        if not self.world:
+        world = self.world
+        if not world:
+            return None
+        
+        if not world.get_tile(start_x, start_y) or not world.get_tile(end_x, end_y):
             return None
         
-        # Implementação básica: caminho em linha reta
-        # TODO: Implementar algoritmo de pathfinding (A*)
-        path = []
+        # Clique no próprio tile: caminho vazio, sem montar a busca
+        if start_x == end_x and start_y == end_y:
+            return []
         
-        # Calcula a direção
-        dx = 1 if end_x > start_x else (-1 if end_x < start_x else 0)
-        dy = 1 if end_y > start_y else (-1 if end_y < start_y else 0)
+        terrain_data = self.game_state.terrain_data
+        terrain_cost, passable = world.get_terrain_arrays(terrain_data)
+        tile_flat = world._tile_flat
+        width = world.width
+        height = world.height
         
-        x, y = start_x, start_y
+        # Destino intransponível: nenhuma busca pode alcançá-lo
+        if not passable[end_y * width + end_x]:
+            return None
         
-        # Gera o caminho
-        while x != end_x or y != end_y:
-            # Prioriza movimento na direção com maior distância
-            if abs(end_x - x) > abs(end_y - y):
-                x += dx
-            else:
-                y += dy
-            
-            # Verifica se o tile é válido
-            tile = self.world.get_tile(x, y)
-            if not tile:
+        # Kernel compilado (numba), quando disponível
+        if NUMBA_AVAILABLE:
+            if unit:
+                if not unit.can_move():
+                    return None
+                passable = self._unit_passable(passable, unit, width)
+            indices = astar(terrain_cost, passable, width, height,
+                            start_x, start_y, end_x, end_y, MAX_PATH_EXPANSIONS)
+            if len(indices) and indices[0] == NO_PATH:
                 return None
+            return [(index % width, index // width) for index in indices.tolist()]
+        
+        goal = (end_x, end_y)
+        
+        # A* em grid 4-conectado; heurística de Manhattan (admissível, custo mínimo 1)
+        open_heap = [(abs(end_x - start_x) + abs(end_y - start_y), 0, start_x, start_y)]
+        g_score = {(start_x, start_y): 0}
+        came_from = {}
+        closed = set()
+        expansions = 0
+        
+        while open_heap:
+            _, g, x, y = heapq.heappop(open_heap)
+            current = (x, y)
+            if current == goal:
+                # Reconstrói o caminho (sem o ponto inicial)
+                path = []
+                while current in came_from:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return path
+            
+            if current in closed:
+                continue
+            closed.add(current)
             
-            # Verifica se a unidade pode mover para o tile
-            if unit and not unit.can_move_to(tile, self.game_state.terrain_data):
+            expansions += 1
+            if expansions > MAX_PATH_EXPANSIONS:
+                self.logger.debug(f"Limite de expansões atingido em get_path para {goal}")
                 return None
             
-            path.append((x, y))
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbor = (nx, ny)
+                if neighbor in closed:
+                    continue
+                
+                # Terreno intransponível é descartado sem consultar o tile
+                index = ny * width + nx
+                if not passable[index]:
+                    continue
+                
+                # Verifica unidades/cidades inimigas no tile
+                if unit and not unit.can_move_to(tile_flat[index], terrain_data):
+                    continue
+                
+                cost = int(terrain_cost[index])
+                
+                tentative = g + cost
+                if tentative < g_score.get(neighbor, tentative + 1):
+                    g_score[neighbor] = tentative
+                    came_from[neighbor] = current
+                    h = abs(end_x - nx) + abs(end_y - ny)
+                    heapq.heappush(open_heap, (tentative + h, tentative, nx, ny))
         
-        return path
+        return None
+    
+    def _unit_passable(self, passable, unit, width):
+        """
+        Máscara de passabilidade para uma unidade específica.
+        
+        Além do terreno, bloqueia os tiles ocupados por unidades ou cidades de
+        outras civilizações (as mesmas regras de Unit.can_move_to).
+        
+        Args:
+            passable: Máscara de passabilidade do terreno.
+            unit (Unit): Unidade que vai percorrer o caminho.
+            width (int): Largura do mundo.
+            
+        Returns:
+            np.ndarray: Cópia da máscara com os tiles inimigos bloqueados.
+        """
+        mask = passable.copy()
+        owner = unit.owner
+        for civ in self.game_state.civilizations:
+            if civ is owner:
+                continue
+            for other in civ.units:
+                mask[other.y * width + other.x] = False
+            for city in civ.cities:
+                mask[city.y * width + city.x] = False
+        return mask
     
     def generate_world(self, world_type="continents"):
         """
@@ -189,19 +265,19 @@ class WorldController:
         Args:
             world_type (str): Tipo de mundo (ex: 'continents', 'pangea', etc.)
         """
-        terrain_types = ["plains", "hills", "mountains", "forest", "desert", "water"]
         world = self.world
         if not world:
             return
 
-        for x in range(world.width):
-            for y in range(world.height):
-                terrain = random.choice(terrain_types)
-                tile = world.get_tile(x, y)
-                if tile:
-                    tile.terrain_type = terrain
-                    tile.resource = None
-                    tile.improvement = None
+        # Sorteia o terreno de todos os tiles de uma vez direto no array SoA
+        rng = np.random.default_rng(world.seed)
+        # Tabela índice em TERRAIN_TYPES -> código de terreno do mundo
+        codes = np.array([world.terrain_code(t) for t in TERRAIN_TYPES], dtype=np.int8)
+        world.set_terrain_codes(codes[rng.integers(0, len(TERRAIN_TYPES), size=world.terrain.size)])
+        
+        for tile in world._tile_flat:
+            tile.resource = None
+            tile.improvement = None
 
     def new_game(self, world_type="continents"):
         # Crie o novo estado do jogo
@@ -2,50 +2,65 @@ from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayo
 from PyQt5.QtGui import QPixmap, QFont
 from PyQt5.QtCore import Qt
 
+# Textos fixos do diálogo
+TITLE = "Project CIVILIZATION"
+VERSION = "Version 0.1"
+DESCRIPTION = (
+    "Project CIVILIZATION is an open-source strategy game inspired by "
+    "the Civilization series. Build an empire to stand the test of time!"
+)
+CREDITS = (
+    "Created by: Project CIVILIZATION Team\n"
+    "Graphics: OpenGL\n"
+    "UI Framework: PyQt5\n"
+    "License: MIT"
+)
+DIALOG_SIZE = (400, 300)
+
 class AboutDialog(QDialog):
     """Diálogo 'Sobre' com informações sobre o jogo."""
     
+    # Fonte do título, criada uma única vez (requer uma QApplication ativa)
+    _TITLE_FONT = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("About Project CIVILIZATION")
         self.setup_ui()
     
+    @classmethod
+    def title_font(cls):
+        """Obtém a fonte compartilhada do título."""
+        if cls._TITLE_FONT is None:
+            font = QFont()
+            font.setPointSize(16)
+            font.setBold(True)
+            cls._TITLE_FONT = font
+        return cls._TITLE_FONT
+    
     def setup_ui(self):
         """Configura a interface do diálogo."""
         layout = QVBoxLayout()
         
         # Título
-        title_label = QLabel("Project CIVILIZATION")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label = QLabel(TITLE)
+        title_label.setFont(self.title_font())
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
         # Versão
-        version_label = QLabel("Version 0.1")
+        version_label = QLabel(VERSION)
         version_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(version_label)
         
         # Descrição
-        description = (
-            "Project CIVILIZATION is an open-source strategy game inspired by "
-            "the Civilization series. Build an empire to stand the test of time!"
-        )
-        desc_label = QLabel(description)
+        desc_label = QLabel(DESCRIPTION)
         desc_label.setWordWrap(True)
         desc_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(desc_label)
         
         # Créditos
-        credits = (
-            "Created by: Project CIVILIZATION Team\n"
-            "Graphics: OpenGL\n"
-            "UI Framework: PyQt5\n"
-            "License: MIT"
-        )
-        credits_label = QLabel(credits)
+        credits_label = QLabel(CREDITS)
         credits_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(credits_label)
         
@@ -59,4 +74,4 @@ class AboutDialog(QDialog):
         
         layout.addLayout(button_layout)
         self.setLayout(layout)
-        self.resize(400, 300)
\ No newline at end of file
+        self.resize(*DIALOG_SIZE)
\ No newline at end of file
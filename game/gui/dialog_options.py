@@ -0,0 +1,90 @@
+"""
+Tabelas e modelos compartilhados pelos diálogos de jogo.
+
+Ficam em um módulo leve para que a janela principal e os módulos de diálogo
+os importem sem carregar uns aos outros.
+"""
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+# Opções fixas dos combos: (texto exibido, valor interno guardado como userData)
+MAP_TYPES = (("Continents", "continents"), ("Pangaea", "pangaea"),
+             ("Archipelago", "archipelago"), ("Inland Sea", "inland_sea"),
+             ("Fractal", "fractal"))
+MAP_SIZES = (("Duel", "duel"), ("Tiny", "tiny"), ("Small", "small"),
+             ("Standard", "standard"), ("Large", "large"), ("Huge", "huge"))
+DIFFICULTIES = (("Settler", "settler"), ("Chieftain", "chieftain"),
+                ("Warlord", "warlord"), ("Prince", "prince"), ("King", "king"),
+                ("Emperor", "emperor"), ("Immortal", "immortal"), ("Deity", "deity"))
+SPEEDS = (("Quick", "quick"), ("Standard", "standard"), ("Epic", "epic"),
+          ("Marathon", "marathon"))
+NUM_CIVS = tuple((str(i), i) for i in range(2, 13))
+
+
+def add_options(combo, options):
+    """
+    Preenche um combo com pares (texto exibido, valor interno).
+    
+    O valor interno fica como userData do item e é lido com currentData().
+    
+    Args:
+        combo: QComboBox a preencher
+        options: Sequência de pares (texto, valor)
+    """
+    for text, value in options:
+        combo.addItem(text, value)
+
+
+# Modelo do painel de detalhes (preenchido com o dicionário do salvamento)
+SAVE_DETAILS_TPL = ("{name}\n\n"
+                    "Date: {timestamp}\n"
+                    "Version: {version}\n"
+                    "File: {filename}")
+
+
+class SavesModel(QAbstractListModel):
+    """
+    Modelo de lista sobre os dicionários de salvamento do SaveManager.
+    
+    A lista é referenciada, não copiada: nenhum item por linha é criado e a
+    view pede apenas as linhas visíveis.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.saves = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.saves)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        save = self.saves[index.row()]
+        if role == Qt.DisplayRole:
+            return save['name']
+        if role == Qt.UserRole:
+            return save['filename']
+        return None
+    
+    def set_saves(self, saves):
+        """
+        Substitui a lista exibida.
+        
+        Args:
+            saves: Lista de dicionários de salvamento (tratada como somente leitura)
+        """
+        self.beginResetModel()
+        self.saves = saves
+        self.endResetModel()
+    
+    def save_at(self, row):
+        """
+        Obtém o dicionário de salvamento de uma linha.
+        
+        Args:
+            row: Linha no modelo
+            
+        Returns:
+            dict: Detalhes do salvamento
+        """
+        return self.saves[row]
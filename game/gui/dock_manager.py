@@ -1,8 +1,8 @@
-from PyQt5.QtWidgets import QDockWidget
-from PyQt5.QtCore import Qt
-from typing import Dict, Any, Optional
+from PyQt5.QtWidgets import QDockWidget, QWidget
+from PyQt5.QtCore import Qt, QTimer
+from typing import Dict, Any, Optional, Callable
 
-from game.gui.gui_factory import GUIFactory
+from game.gui.gui_factory import create_dock_widget
 from game.gui.info_panel import InfoPanel
 from game.gui.minimap_panel import MinimapPanel
 from game.gui.unit_panel import UnitPanel
@@ -30,6 +30,13 @@ class DockManager:
         self.docks: Dict[str, QDockWidget] = {}
         self.panels: Dict[str, Any] = {}
         
+        # Construtores dos painéis criados sob demanda (ver get_panel)
+        self._panel_factories: Dict[str, Callable] = {}
+        
+        # Atualizações pendentes, aplicadas uma vez por iteração do loop de eventos
+        self._dirty: Dict[str, Any] = {}
+        self._flush_scheduled = False
+        
         # Criar painéis
         self._setup_panels()
     def _setup_panels(self):
@@ -39,6 +46,13 @@ class DockManager:
         self._setup_unit_panel()
         self._setup_city_panel()
 
+        # Criar (na primeira vez) e atualizar um painel quando seu dock fica
+        # visível, já que update_panels ignora docks ocultos
+        for dock_name, dock in self.docks.items():
+            dock.visibilityChanged.connect(
+                lambda visible, name=dock_name: visible and self._on_dock_shown(name)
+            )
+
         # Tabificar alguns painéis (agrupar em abas)
         self.main_window.tabifyDockWidget(self.docks['unit'], self.docks['city'])
 
@@ -48,7 +62,7 @@ class DockManager:
     def _setup_info_panel(self):
         """Configura o painel de informações gerais do jogo."""
         self.panels['info'] = InfoPanel(self.game_controller)
-        info_dock = GUIFactory.create_dock_widget(
+        info_dock = create_dock_widget(
             "Game Info", 
             self.panels['info'], 
             self.main_window,
@@ -58,11 +72,11 @@ class DockManager:
         self.docks['info'] = info_dock
     
     def _setup_minimap_panel(self):
-        """Configura o painel do minimapa."""
-        self.panels['minimap'] = MinimapPanel(self.game_controller)
-        minimap_dock = GUIFactory.create_dock_widget(
+        """Configura o painel do minimapa (criado na primeira exibição)."""
+        self._panel_factories['minimap'] = MinimapPanel
+        minimap_dock = create_dock_widget(
             "Minimap", 
-            self.panels['minimap'], 
+            QWidget(), 
             self.main_window,
             Qt.RightDockWidgetArea | Qt.BottomDockWidgetArea
         )
@@ -70,11 +84,11 @@ class DockManager:
         self.docks['minimap'] = minimap_dock
     
     def _setup_unit_panel(self):
-        """Configura o painel de informações de unidades."""
-        self.panels['unit'] = UnitPanel(self.game_controller)
-        unit_dock = GUIFactory.create_dock_widget(
+        """Configura o painel de informações de unidades (criado na primeira exibição)."""
+        self._panel_factories['unit'] = UnitPanel
+        unit_dock = create_dock_widget(
             "Unit Info", 
-            self.panels['unit'], 
+            QWidget(), 
             self.main_window,
             Qt.RightDockWidgetArea
         )
@@ -82,11 +96,11 @@ class DockManager:
         self.docks['unit'] = unit_dock
     
     def _setup_city_panel(self):
-        """Configura o painel de informações de cidades."""
-        self.panels['city'] = CityPanel(self.game_controller)
-        city_dock = GUIFactory.create_dock_widget(
+        """Configura o painel de informações de cidades (criado na primeira exibição)."""
+        self._panel_factories['city'] = CityPanel
+        city_dock = create_dock_widget(
             "City Info", 
-            self.panels['city'], 
+            QWidget(), 
             self.main_window,
             Qt.RightDockWidgetArea
         )
@@ -107,7 +121,7 @@ class DockManager:
     
     def get_panel(self, panel_name: str) -> Optional[Any]:
         """
-        Obtém um painel pelo nome.
+        Obtém um painel pelo nome, criando-o se ainda não tiver sido exibido.
         
         Args:
             panel_name: Nome do painel
@@ -115,7 +129,24 @@ class DockManager:
         Returns:
             O painel correspondente ou None se não existir
         """
-        return self.panels.get(panel_name)
+        panel = self.panels.get(panel_name)
+        if panel is None:
+            factory = self._panel_factories.pop(panel_name, None)
+            if factory is not None:
+                panel = factory(self.game_controller)
+                self.panels[panel_name] = panel
+                self.docks[panel_name].setWidget(panel)
+        return panel
+
+    def _on_dock_shown(self, panel_name: str):
+        """
+        Cria (se necessário) e atualiza o painel de um dock que ficou visível.
+        
+        Args:
+            panel_name: Nome do painel
+        """
+        self.get_panel(panel_name)
+        self._refresh_panel(panel_name)
     
     def toggle_dock(self, dock_name: str) -> bool:
         """
@@ -134,46 +165,120 @@ class DockManager:
         return False
     
     def update_panels(self):
-        """Atualiza todos os painéis com os dados atuais do jogo."""
+        """
+        Atualiza os painéis visíveis com os dados atuais do jogo.
+        
+        Painéis em docks ocultos (ou em abas não selecionadas) são atualizados
+        quando o dock volta a ficar visível.
+        """
+        docks = self.docks
         for panel_name, panel in self.panels.items():
+            dock = docks.get(panel_name)
+            if dock is not None and not dock.isVisible():
+                continue
             if hasattr(panel, 'update_panel'):
                 panel.update_panel()
 
+    def _refresh_panel(self, panel_name: str):
+        """
+        Atualiza um único painel, se ele suportar atualização.
+        
+        Args:
+            panel_name: Nome do painel
+        """
+        panel = self.panels.get(panel_name)
+        if panel is not None and hasattr(panel, 'update_panel'):
+            panel.update_panel()
+
+    def _mark_dirty(self, panel_name: str, item: Any = None):
+        """
+        Registra uma atualização pendente e agenda o flush no loop de eventos.
+        
+        Várias chamadas para o mesmo painel antes do flush resultam em uma
+        única atualização; a seleção mais recente (unidade/cidade) prevalece.
+        
+        Args:
+            panel_name: Nome do painel
+            item: Unidade ou cidade a ser exibida (opcional)
+        """
+        if item is not None or panel_name not in self._dirty:
+            self._dirty[panel_name] = item
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Aplica as atualizações pendentes dos painéis."""
+        dirty = self._dirty
+        self._dirty = {}
+        self._flush_scheduled = False
+        for panel_name, item in dirty.items():
+            if panel_name == 'info':
+                self._update_info_panel()
+            elif panel_name == 'unit':
+                self._update_unit_panel(item)
+            elif panel_name == 'city':
+                self._update_city_panel(item)
+
     def update_info_panel(self):
+        """Agenda a atualização do painel de informações."""
+        self._mark_dirty('info')
+
+    def update_unit_panel(self, unit=None):
+        """
+        Agenda a atualização do painel de unidades.
+
+        Args:
+            unit: Unidade a ser exibida (opcional)
+        """
+        self._mark_dirty('unit', unit)
+
+    def update_city_panel(self, city=None):
+        """
+        Agenda a atualização do painel de cidades.
+
+        Args:
+            city: Cidade a ser exibida (opcional)
+        """
+        self._mark_dirty('city', city)
+
+    def _update_info_panel(self):
         """Atualiza apenas o painel de informações."""
         if 'info' in self.panels and hasattr(self.panels['info'], 'update_panel'):
             self.panels['info'].update_panel()
 
-    def update_unit_panel(self, unit=None):
+    def _update_unit_panel(self, unit=None):
         """
         Atualiza o painel de unidades.
 
         Args:
             unit: Unidade a ser exibida (opcional)
         """
-        if 'unit' in self.panels:
+        panel = self.get_panel('unit')
+        if panel is not None:
             if unit:
-                self.panels['unit'].set_unit(unit)
-            elif hasattr(self.panels['unit'], 'update_panel'):
-                self.panels['unit'].update_panel()
+                panel.set_unit(unit)
+            elif hasattr(panel, 'update_panel'):
+                panel.update_panel()
 
             # Tornar o dock visível se estiver oculto
             if not self.docks['unit'].isVisible():
                 self.docks['unit'].setVisible(True)
             self.docks['unit'].raise_()
 
-    def update_city_panel(self, city=None):
+    def _update_city_panel(self, city=None):
         """
         Atualiza o painel de cidades.
 
         Args:
             city: Cidade a ser exibida (opcional)
         """
-        if 'city' in self.panels:
+        panel = self.get_panel('city')
+        if panel is not None:
             if city:
-                self.panels['city'].set_city(city)
-            elif hasattr(self.panels['city'], 'update_panel'):
-                self.panels['city'].update_panel()
+                panel.set_city(city)
+            elif hasattr(panel, 'update_panel'):
+                panel.update_panel()
 
             # Tornar o dock visível se estiver oculto
             if not self.docks['city'].isVisible():
@@ -212,22 +317,9 @@ class MainWindowDockManager(DockManager):
     Use DockManager para novas implementações.
     """
 
-    def setup_info_panel(self):
-        """Compatibilidade com código existente."""
-        self._setup_info_panel()
-
-    def setup_minimap_panel(self):
-        """Compatibilidade com código existente."""
-        self._setup_minimap_panel()
-
-    def setup_unit_panel(self):
-        """Compatibilidade com código existente."""
-        self._setup_unit_panel()
-
-    def setup_city_panel(self):
-        """Compatibilidade com código existente."""
-        self._setup_city_panel()
-
-    def update_all_panels(self):
-        """Compatibilidade com código existente."""
-        self.update_panels()
+    # Aliases diretos para os métodos atuais (sem chamadas intermediárias)
+    setup_info_panel = DockManager._setup_info_panel
+    setup_minimap_panel = DockManager._setup_minimap_panel
+    setup_unit_panel = DockManager._setup_unit_panel
+    setup_city_panel = DockManager._setup_city_panel
+    update_all_panels = DockManager.update_panels
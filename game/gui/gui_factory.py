@@ -1,197 +1,327 @@
 from PyQt5.QtWidgets import QDockWidget, QAction, QMenu, QToolBar, QMessageBox, QPushButton, QDialog
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QKeySequence
+import importlib
+from functools import lru_cache
 from typing import Callable, Optional, Any, List, Type, Dict, Union
 
-class GUIFactory:
+
+@lru_cache(maxsize=256)
+def _cached_icon(path: str) -> QIcon:
+    """Ícone compartilhado por caminho (evita decodificar o arquivo de novo)."""
+    return QIcon(path)
+
+
+@lru_cache(maxsize=256)
+def _cached_shortcut(shortcut: str) -> QKeySequence:
+    """Sequência de teclas compartilhada por texto do atalho."""
+    return QKeySequence(shortcut)
+
+
+# Helpers estáticos do QMessageBox por ícone (ver create_message_box)
+_MESSAGE_BOX_HELPERS = {
+    QMessageBox.Information: QMessageBox.information,
+    QMessageBox.Warning: QMessageBox.warning,
+    QMessageBox.Critical: QMessageBox.critical,
+    QMessageBox.Question: QMessageBox.question,
+}
+
+
+def create_dock_widget(title: str, widget: Any, parent: Any = None,
+                       allowed_areas: int = Qt.AllDockWidgetAreas) -> QDockWidget:
     """
-    Fábrica para criar componentes da GUI de forma padronizada.
-    
-    Esta classe fornece métodos estáticos para criar diversos componentes
-    da interface gráfica, garantindo consistência visual e comportamental.
-    Implementa o padrão Factory para desacoplar a criação de componentes da sua utilização.
+    Cria um widget de dock com configurações padronizadas.
+
+    Args:
+        title: Título do dock
+        widget: Widget a ser colocado no dock
+        parent: Widget pai
+        allowed_areas: Áreas permitidas para o dock
+
+    Returns:
+        QDockWidget: O dock widget criado
+    """
+    dock = QDockWidget(title, parent)
+    dock.setWidget(widget)
+    dock.setAllowedAreas(allowed_areas)
+    dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetClosable | QDockWidget.DockWidgetFloatable)
+    return dock
+
+
+def create_action(parent: Any, text: str, slot: Optional[Callable] = None,
+                  shortcut: Optional[str] = None, icon: Any = None,
+                  tip: Optional[str] = None, checkable: bool = False,
+                  checked: bool = False, enabled: bool = True) -> QAction:
+    """
+    Cria uma ação com configurações padronizadas.
+
+    Args:
+        parent: Widget pai
+        text: Texto da ação
+        slot: Função a ser chamada quando a ação for acionada
+        shortcut: Atalho de teclado
+        icon: Ícone da ação (QIcon ou caminho do arquivo)
+        tip: Texto de dica
+        checkable: Se a ação pode ser marcada/desmarcada
+        checked: Estado inicial da ação (se checkable=True)
+        enabled: Se a ação está habilitada inicialmente
+
+    Returns:
+        QAction: A ação criada
+    """
+    action = QAction(text, parent)
+
+    # "is not None" evita o __bool__ do QIcon; QAction já nasce habilitada
+    if icon is not None:
+        if isinstance(icon, str):
+            icon = _cached_icon(icon)
+        action.setIcon(icon)
+    if shortcut:
+        if isinstance(shortcut, str):
+            shortcut = _cached_shortcut(shortcut)
+        action.setShortcut(shortcut)
+    if tip:
+        action.setToolTip(tip)
+        action.setStatusTip(tip)
+    if slot is not None:
+        # Apenas conexões novas (callables); ações disparam na thread da GUI
+        assert callable(slot) and not isinstance(slot, str), "slot deve ser um callable"
+        action.triggered.connect(slot, Qt.DirectConnection)
+    if checkable:
+        action.setCheckable(True)
+        action.setChecked(checked)
+    if not enabled:
+        action.setEnabled(False)
+
+    # Referência Python no pai: a ação não depende só da posse do Qt
+    if parent is not None:
+        refs = getattr(parent, '_py_action_refs', None)
+        if refs is None:
+            refs = parent._py_action_refs = []
+        refs.append(action)
+
+    return action
+
+
+def create_cached_icon_action(parent: Any, text: str, icon_path: str,
+                              slot: Optional[Callable] = None, **kwargs: Any) -> QAction:
     """
+    Cria uma ação com ícone vindo do cache compartilhado de ícones.
     
-    @staticmethod
-    def create_dock_widget(title: str, widget: Any, parent: Any = None,
-                          allowed_areas: int = Qt.AllDockWidgetAreas) -> QDockWidget:
-        """
-        Cria um widget de dock com configurações padronizadas.
-        
-        Args:
-            title: Título do dock
-            widget: Widget a ser colocado no dock
-            parent: Widget pai
-            allowed_areas: Áreas permitidas para o dock
-            
-        Returns:
-            QDockWidget: O dock widget criado
-        """
-        dock = QDockWidget(title, parent)
-        dock.setWidget(widget)
-        dock.setAllowedAreas(allowed_areas)
-        dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetClosable | QDockWidget.DockWidgetFloatable)
-        return dock
+    Destinada a menus reconstruídos em tempo de execução (listas de
+    salvamentos, itens recentes): cada arquivo é decodificado uma única vez e
+    o ícone é atribuído só na construção. No macOS, chamar setIcon/setData
+    depois em itens de um menu nativo dispara QEvent::ActionChanged e faz o
+    menu inteiro ser redesenhado, então essas ações devem ser recriadas, não
+    alteradas.
     
-    @staticmethod
-    def create_action(parent: Any, text: str, slot: Optional[Callable] = None,
-                     shortcut: Optional[str] = None, icon: Any = None,
-                     tip: Optional[str] = None, checkable: bool = False,
-                     checked: bool = False, enabled: bool = True) -> QAction:
-        """
-        Cria uma ação com configurações padronizadas.
-        
-        Args:
-            parent: Widget pai
-            text: Texto da ação
-            slot: Função a ser chamada quando a ação for acionada
-            shortcut: Atalho de teclado
-            icon: Ícone da ação
-            tip: Texto de dica
-            checkable: Se a ação pode ser marcada/desmarcada
-            checked: Estado inicial da ação (se checkable=True)
-            enabled: Se a ação está habilitada inicialmente
-            
-        Returns:
-            QAction: A ação criada
-        """
-        action = QAction(text, parent)
+    Args:
+        parent: Widget pai
+        text: Texto da ação
+        icon_path: Caminho do ícone (chave do cache)
+        slot: Função a ser chamada quando a ação for acionada
+        **kwargs: Demais argumentos de create_action
         
-        if icon:
-            action.setIcon(icon)
-        if shortcut:
-            action.setShortcut(shortcut)
-        if tip:
-            action.setToolTip(tip)
-            action.setStatusTip(tip)
-        if slot:
-            action.triggered.connect(slot)
-        if checkable:
-            action.setCheckable(True)
-            action.setChecked(checked)
-            
-        action.setEnabled(enabled)
-
-        return action
+    Returns:
+        QAction: A ação criada
+    """
+    return create_action(parent, text, slot, icon=_cached_icon(icon_path), **kwargs)
+
+
+def create_menu(parent: Any, title: str, actions: Optional[List[Union[QAction, None]]] = None) -> QMenu:
+    """
+    Cria um menu com ações.
+
+    Args:
+        parent: Widget pai
+        title: Título do menu
+        actions: Lista de ações ou None (separadores são representados por None)
+    Returns:
+        QMenu: O menu criado
+    """
+    menu = QMenu(title, parent)
+
+    if actions:
+        for action in actions:
+            if action is None:
+                menu.addSeparator()
+            else:
+                menu.addAction(action)
+
+    return menu
+
+
+def create_toolbar(parent: Any, name: str, actions: Optional[List[Union[QAction, None]]] = None) -> QToolBar:
+    """
+    Cria uma barra de ferramentas.
+
+    Args:
+        parent: Widget pai
+        name: Nome da barra de ferramentas
+        actions: Lista de ações ou None (separadores são representados por None)
+
+    Returns:
+        QToolBar: A barra de ferramentas criada
+    """
+    toolbar = QToolBar(name, parent)
+    toolbar.setMovable(True)
+    toolbar.setFloatable(True)
+
+    if actions:
+        for action in actions:
+            if action is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addAction(action)
+
+    return toolbar
+
+
+def create_message_box(parent: Any, title: str, text: str,
+                       icon: int = QMessageBox.Information,
+                       buttons: int = QMessageBox.Ok) -> int:
+    """
+    Cria e exibe uma caixa de mensagem.
+
+    Args:
+        parent: Widget pai
+        title: Título da caixa de mensagem
+        text: Texto da mensagem
+        icon: Ícone da caixa de mensagem (QMessageBox.Icon)
+        buttons: Botões a serem exibidos (QMessageBox.StandardButtons)
+
+    Returns:
+        int: O botão clicado (QMessageBox.StandardButton)
+    """
+    # Ícones padrão usam os helpers estáticos do Qt (uma única chamada C++)
+    helper = _MESSAGE_BOX_HELPERS.get(icon)
+    if helper is not None:
+        return helper(parent, title, text, buttons)
+    
+    msg_box = QMessageBox(parent)
+    msg_box.setWindowTitle(title)
+    msg_box.setText(text)
+    msg_box.setIcon(icon)
+    msg_box.setStandardButtons(buttons)
+    return msg_box.exec_()
+
+
+def create_button(parent: Any, text: str, slot: Optional[Callable] = None,
+                  icon: Any = None, tip: Optional[str] = None,
+                  enabled: bool = True) -> QPushButton:
+    """
+    Cria um botão.
+
+    Args:
+        parent: Widget pai
+        text: Texto do botão
+        slot: Função a ser chamada quando o botão for clicado
+        icon: Ícone do botão (QIcon ou caminho do arquivo)
+        tip: Texto de dica
+        enabled: Se o botão está habilitado inicialmente
+
+    Returns:
+        QPushButton: O botão criado
+    """
+    button = QPushButton(text, parent)
+
+    if icon is not None:
+        if isinstance(icon, str):
+            icon = _cached_icon(icon)
+        button.setIcon(icon)
+    if tip:
+        button.setToolTip(tip)
+        button.setStatusTip(tip)
+    if slot is not None:
+        button.clicked.connect(slot)
+    if not enabled:
+        button.setEnabled(False)
+
+    return button
+
+
+def create_dialog(dialog_class: Type[QDialog], game_controller: Any,
+                  parent: Any = None, *args: Any, **kwargs: Any) -> int:
+    """
+    Cria e exibe um diálogo.
+
+    Args:
+        dialog_class: Classe do diálogo a ser criado
+        game_controller: Controlador do jogo
+        parent: Widget pai
+        *args, **kwargs: Argumentos adicionais para o diálogo
+
+    Returns:
+        int: O resultado da execução do diálogo
+    """
+    dialog = dialog_class(game_controller, parent, *args, **kwargs)
+    return dialog.exec_()
+
+
+@lru_cache(maxsize=None)
+def load_dialog_class(module_name: str, class_name: str) -> Type[QDialog]:
+    """
+    Importa sob demanda a classe de um diálogo.
+    
+    Diálogos raramente abertos não precisam ser importados na carga da
+    janela principal; a classe é resolvida na primeira abertura e mantida
+    em cache.
     
-    @staticmethod
-    def create_menu(parent: Any, title: str, actions: Optional[List[Union[QAction, None]]] = None) -> QMenu:
-        """
-        Cria um menu com ações.
+    Args:
+        module_name: Caminho do módulo (ex.: 'game.gui.tech_dialog')
+        class_name: Nome da classe do diálogo
         
-        Args:
-            parent: Widget pai
-            title: Título do menu
-            actions: Lista de ações ou None (separadores são representados por None)
-        Returns:
-            QMenu: O menu criado
-        """
-        menu = QMenu(title, parent)
+    Returns:
+        Type[QDialog]: A classe do diálogo
+    """
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_cached_dialog(cache: Dict[type, QDialog], parent: Any,
+                      dialog_class: Type[QDialog], *args: Any) -> QDialog:
+    """
+    Obtém a instância reaproveitável de um diálogo.
+    
+    Na primeira chamada o diálogo é construído com ``(*args, parent)`` e
+    guardado em ``cache``; nas seguintes a mesma instância é devolvida após
+    ``refresh()`` (quando o diálogo o define) para reler o estado atual.
+    
+    Args:
+        cache: Dicionário classe -> diálogo mantido pela janela dona
+        parent: Janela pai dos diálogos
+        dialog_class: Classe do diálogo
+        *args: Argumentos passados ao construtor antes do pai
         
-        if actions:
-            for action in actions:
-                if action is None:
-                    menu.addSeparator()
-                else:
-                    menu.addAction(action)
-                    
-        return menu
-
-    @staticmethod
-    def create_toolbar(parent: Any, name: str, actions: Optional[List[Union[QAction, None]]] = None) -> QToolBar:
-        """
-        Cria uma barra de ferramentas.
-
-        Args:
-            parent: Widget pai
-            name: Nome da barra de ferramentas
-            actions: Lista de ações ou None (separadores são representados por None)
-
-        Returns:
-            QToolBar: A barra de ferramentas criada
-        """
-        toolbar = QToolBar(name, parent)
-        toolbar.setMovable(True)
-        toolbar.setFloatable(True)
-
-        if actions:
-            for action in actions:
-                if action is None:
-                    toolbar.addSeparator()
-                else:
-                    toolbar.addAction(action)
-
-        return toolbar
-
-    @staticmethod
-    def create_message_box(parent: Any, title: str, text: str,
-                          icon: int = QMessageBox.Information,
-                          buttons: int = QMessageBox.Ok) -> int:
-        """
-        Cria e exibe uma caixa de mensagem.
-
-        Args:
-            parent: Widget pai
-            title: Título da caixa de mensagem
-            text: Texto da mensagem
-            icon: Ícone da caixa de mensagem (QMessageBox.Icon)
-            buttons: Botões a serem exibidos (QMessageBox.StandardButtons)
-
-        Returns:
-            int: O botão clicado (QMessageBox.StandardButton)
-        """
-        msg_box = QMessageBox(parent)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(text)
-        msg_box.setIcon(icon)
-        msg_box.setStandardButtons(buttons)
-        return msg_box.exec_()
-
-    @staticmethod
-    def create_button(parent: Any, text: str, slot: Optional[Callable] = None,
-                     icon: Any = None, tip: Optional[str] = None,
-                     enabled: bool = True) -> QPushButton:
-        """
-        Cria um botão.
-
-        Args:
-            parent: Widget pai
-            text: Texto do botão
-            slot: Função a ser chamada quando o botão for clicado
-            icon: Ícone do botão
-            tip: Texto de dica
-            enabled: Se o botão está habilitado inicialmente
-
-        Returns:
-            QPushButton: O botão criado
-        """
-        button = QPushButton(text, parent)
-
-        if icon:
-            button.setIcon(icon)
-        if tip:
-            button.setToolTip(tip)
-            button.setStatusTip(tip)
-        if slot:
-            button.clicked.connect(slot)
-
-        button.setEnabled(enabled)
-
-        return button
-
-    @staticmethod
-    def create_dialog(dialog_class: Type[QDialog], game_controller: Any,
-                     parent: Any = None, *args: Any, **kwargs: Any) -> int:
-        """
-        Cria e exibe um diálogo.
-
-        Args:
-            dialog_class: Classe do diálogo a ser criado
-            game_controller: Controlador do jogo
-            parent: Widget pai
-            *args, **kwargs: Argumentos adicionais para o diálogo
-
-        Returns:
-            int: O resultado da execução do diálogo
-        """
-        dialog = dialog_class(game_controller, parent, *args, **kwargs)
-        return dialog.exec_()
+    Returns:
+        QDialog: O diálogo pronto para exec_()
+    """
+    dialog = cache.get(dialog_class)
+    if dialog is None:
+        dialog = cache[dialog_class] = dialog_class(*args, parent)
+    else:
+        refresh = getattr(dialog, 'refresh', None)
+        if refresh is not None:
+            refresh()
+    return dialog
+
+
+class GUIFactory:
+    """
+    Fábrica para criar componentes da GUI de forma padronizada.
+    
+    As funções de criação vivem no nível do módulo; esta classe as expõe
+    como métodos estáticos, garantindo consistência visual e comportamental.
+    Implementa o padrão Factory para desacoplar a criação de componentes da sua utilização.
+    """
+
+    # Mantidos por compatibilidade; prefira importar as funções do módulo
+    create_dock_widget = staticmethod(create_dock_widget)
+    create_action = staticmethod(create_action)
+    create_cached_icon_action = staticmethod(create_cached_icon_action)
+    create_menu = staticmethod(create_menu)
+    create_toolbar = staticmethod(create_toolbar)
+    create_message_box = staticmethod(create_message_box)
+    create_button = staticmethod(create_button)
+    create_dialog = staticmethod(create_dialog)
+    load_dialog_class = staticmethod(load_dialog_class)
+    get_cached_dialog = staticmethod(get_cached_dialog)
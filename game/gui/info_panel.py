@@ -1,7 +1,40 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout, QPushButton
-from PyQt5.QtCore import pyqtSlot, Qt
+from PyQt5.QtWidgets import QWidget, QLabel, QHBoxLayout, QGridLayout, QPushButton
+from PyQt5.QtCore import pyqtSlot, Qt, QTimer
 from PyQt5.QtGui import QFont, QIcon
 
+from game.gui.gui_factory import load_dialog_class
+
+# Each turn is 25 years, starting at 4000 BC
+_FIRST_YEAR = 4000
+_YEARS_PER_TURN = 25
+
+
+def _format_year(turn):
+    """Convert a turn number to its year string (BC/AD)."""
+    year = _FIRST_YEAR - (turn - 1) * _YEARS_PER_TURN
+    if year <= 0:
+        # Convert to AD
+        return f"{abs(year) + 1} AD"
+    return f"{year} BC"
+
+
+# Year strings for turns 1..1000, indexed by turn - 1
+_YEARS = tuple(_format_year(turn) for turn in range(1, 1001))
+
+# Shared fonts, built on first use (QFont needs a QApplication)
+_FONTS = None
+
+
+def _get_fonts():
+    """Return the shared (bold 12, regular 10, bold 10) fonts."""
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = (
+            QFont("Arial", 12, QFont.Bold),
+            QFont("Arial", 10),
+            QFont("Arial", 10, QFont.Bold),
+        )
+    return _FONTS
 
 class InfoPanel(QWidget):
     """Panel displaying general game information and controls."""
@@ -9,71 +42,63 @@ class InfoPanel(QWidget):
     def __init__(self, game_controller, parent=None):
         super().__init__(parent)
         self.game_controller = game_controller
+        # Last value rendered in each label (see _set)
+        self._last = {}
+        # Top-level window used as dialog parent, cached on first show
+        self._top_window = None
         self.setup_ui()
-        self.update_info()
+        # Fill in the data on the next event-loop tick so the first paint
+        # (with the placeholder texts) is not blocked
+        QTimer.singleShot(0, self.update_info)
     
     def setup_ui(self):
         """Set up the UI components."""
+        font_bold_12, font_reg_10, font_bold_10 = _get_fonts()
+        
         # Main layout
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(5, 5, 5, 5)
         
-        # Turn information
-        turn_layout = QVBoxLayout()
-        
+        # Information labels: one column per group (turn, civilization,
+        # resources, research), title on row 0 and detail on row 1
         self.turn_label = QLabel("Turn: 1")
-        self.turn_label.setFont(QFont("Arial", 12, QFont.Bold))
-        turn_layout.addWidget(self.turn_label)
-        
+        self.turn_label.setFont(font_bold_12)
         self.year_label = QLabel("4000 BC")
-        self.year_label.setFont(QFont("Arial", 10))
-        turn_layout.addWidget(self.year_label)
-        
-        main_layout.addLayout(turn_layout)
-        
-        # Current civilization information
-        civ_layout = QVBoxLayout()
+        self.year_label.setFont(font_reg_10)
         
         self.civ_label = QLabel("Civilization: Rome")
-        self.civ_label.setFont(QFont("Arial", 12, QFont.Bold))
-        civ_layout.addWidget(self.civ_label)
-        
+        self.civ_label.setFont(font_bold_12)
         self.leader_label = QLabel("Leader: Caesar")
-        self.leader_label.setFont(QFont("Arial", 10))
-        civ_layout.addWidget(self.leader_label)
-        
-        main_layout.addLayout(civ_layout)
-        
-        # Resources
-        resources_layout = QVBoxLayout()
+        self.leader_label.setFont(font_reg_10)
         
         self.gold_label = QLabel("Gold: 100")
-        self.gold_label.setFont(QFont("Arial", 10))
-        resources_layout.addWidget(self.gold_label)
-        
+        self.gold_label.setFont(font_reg_10)
         self.science_label = QLabel("Science: 5 per turn")
-        self.science_label.setFont(QFont("Arial", 10))
-        resources_layout.addWidget(self.science_label)
-        
-        main_layout.addLayout(resources_layout)
-        
-        # Current research
-        research_layout = QVBoxLayout()
+        self.science_label.setFont(font_reg_10)
         
         self.research_label = QLabel("Researching:")
-        self.research_label.setFont(QFont("Arial", 10))
-        research_layout.addWidget(self.research_label)
-        
+        self.research_label.setFont(font_reg_10)
         self.tech_label = QLabel("Agriculture (5 turns)")
-        self.tech_label.setFont(QFont("Arial", 10, QFont.Bold))
-        research_layout.addWidget(self.tech_label)
+        self.tech_label.setFont(font_bold_10)
         
-        main_layout.addLayout(research_layout)
+        info_grid = QGridLayout()
+        info_grid.setHorizontalSpacing(main_layout.spacing())
+        for column, (top, bottom) in enumerate((
+                (self.turn_label, self.year_label),
+                (self.civ_label, self.leader_label),
+                (self.gold_label, self.science_label),
+                (self.research_label, self.tech_label))):
+            info_grid.addWidget(top, 0, column)
+            info_grid.addWidget(bottom, 1, column)
+        
+        main_layout.addLayout(info_grid)
         
         # Spacer to push buttons to the right
         main_layout.addStretch(1)
         
-        # Action buttons
+        # Action buttons. The handlers are @pyqtSlot()-decorated, so PyQt
+        # connects clicked straight to the slot registered on the meta-object
+        # (no Python proxy object per connection)
         buttons_layout = QHBoxLayout()
         
         self.tech_button = QPushButton("Technology")
@@ -86,11 +111,21 @@ class InfoPanel(QWidget):
         
         self.end_turn_button = QPushButton("End Turn")
         self.end_turn_button.clicked.connect(self.on_end_turn_clicked)
-        self.end_turn_button.setFont(QFont("Arial", 10, QFont.Bold))
+        self.end_turn_button.setFont(font_bold_10)
         buttons_layout.addWidget(self.end_turn_button)
         
         main_layout.addLayout(buttons_layout)
     
+    def showEvent(self, event):
+        """Cache the top-level window the first time the panel is shown."""
+        if self._top_window is None:
+            self._top_window = self.window()
+        super().showEvent(event)
+    
+    def _dialog_parent(self):
+        """Return the parent for dialogs opened from this panel."""
+        return self._top_window or self.window()
+    
     def update_info(self):
         """Update all information displayed in the panel."""
         # Get current game state
@@ -99,39 +134,50 @@ class InfoPanel(QWidget):
             return
         
         # Update turn information
-        self.turn_label.setText(f"Turn: {game_state.turn}")
-        self.year_label.setText(self.get_year_string(game_state.turn))
+        turn = game_state.turn
+        if self._last.get('turn') != turn:
+            self._last['turn'] = turn
+            self.turn_label.setText(f"Turn: {turn}")
+            self.year_label.setText(self.get_year_string(turn))
         
         # Update civilization information
         current_civ = self.game_controller.get_current_civilization()
         if current_civ:
-            self.civ_label.setText(f"Civilization: {current_civ.name}")
-            self.leader_label.setText(f"Leader: {current_civ.leader}")
+            self._set(self.civ_label, 'civ', current_civ.name, "Civilization: {}")
+            self._set(self.leader_label, 'leader', current_civ.leader, "Leader: {}")
             
             # Update resources
-            self.gold_label.setText(f"Gold: {current_civ.gold}")
-            self.science_label.setText(f"Science: {current_civ.science_per_turn} per turn")
+            self._set(self.gold_label, 'gold', current_civ.gold, "Gold: {}")
+            self._set(self.science_label, 'science', current_civ.science_per_turn,
+                      "Science: {} per turn")
             
             # Update research
             current_research = current_civ.current_research
             if current_research:
-                self.research_label.setText("Researching:")
+                self._set(self.research_label, 'research', "Researching:")
                 turns_left = current_civ.get_turns_to_complete_research()
-                self.tech_label.setText(f"{current_research.name} ({turns_left} turns)")
+                self._set(self.tech_label, 'tech', (current_research.name, turns_left),
+                          "{0[0]} ({0[1]} turns)")
             else:
-                self.research_label.setText("Not researching")
-                self.tech_label.setText("Choose technology")
+                self._set(self.research_label, 'research', "Not researching")
+                self._set(self.tech_label, 'tech', None, "Choose technology")
+    
+    def _set(self, label, key, value, template="{}"):
+        """Set a label's text only when its underlying value changed.
+        
+        The raw value is compared before formatting, so unchanged fields
+        neither build a new string nor trigger a QLabel relayout.
+        """
+        if key in self._last and self._last[key] == value:
+            return
+        self._last[key] = value
+        label.setText(template.format(value))
     
     def get_year_string(self, turn):
         """Convert turn number to year string (BC/AD)."""
-        # Simple conversion: each turn is 25 years, starting at 4000 BC
-        year = 4000 - (turn - 1) * 25
-        
-        if year <= 0:
-            # Convert to AD
-            return f"{abs(year) + 1} AD"
-        else:
-            return f"{year} BC"
+        if 1 <= turn <= len(_YEARS):
+            return _YEARS[turn - 1]
+        return _format_year(turn)
     
     @pyqtSlot()
     def update_turn(self):
@@ -141,18 +187,18 @@ class InfoPanel(QWidget):
     @pyqtSlot()
     def on_tech_clicked(self):
         """Handle technology button click."""
-        # Open technology tree dialog
-        from game.gui.tech_dialog import TechDialog
-        dialog = TechDialog(self.game_controller, self.window())
+        # Open technology tree dialog (module imported on first use)
+        TechDialog = load_dialog_class('game.gui.tech_dialog', 'TechDialog')
+        dialog = TechDialog(self.game_controller, self._dialog_parent())
         dialog.exec_()
         self.update_info()
     
     @pyqtSlot()
     def on_diplomacy_clicked(self):
         """Handle diplomacy button click."""
-        # Open diplomacy dialog
-        from game.gui.diplomacy_dialog import DiplomacyDialog
-        dialog = DiplomacyDialog(self.game_controller, self.window())
+        # Open diplomacy dialog (module imported on first use)
+        DiplomacyDialog = load_dialog_class('game.gui.diplomacy_dialog', 'DiplomacyDialog')
+        dialog = DiplomacyDialog(self.game_controller, self._dialog_parent())
         dialog.exec_()
         self.update_info()
     
@@ -1,8 +1,9 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
-                           QListWidget, QListWidgetItem, QSplitter, QTextBrowser,
-                           QMessageBox)
+                           QListView, QSplitter, QMessageBox)
 from PyQt5.QtCore import Qt
 
+from game.gui.dialog_options import SAVE_DETAILS_TPL, SavesModel
+
 class LoadGameDialog(QDialog):
     """Diálogo para carregar um jogo salvo."""
     
@@ -23,12 +24,19 @@ class LoadGameDialog(QDialog):
         # Splitter para lista e detalhes
         splitter = QSplitter(Qt.Horizontal)
         
-        # Lista de salvamentos
-        self.saves_list = QListWidget()
+        # Lista de salvamentos (a view só materializa as linhas visíveis)
+        self.saves_model = SavesModel(self)
+        self.saves_list = QListView()
+        self.saves_list.setUniformItemSizes(True)
+        self.saves_list.setModel(self.saves_model)
         splitter.addWidget(self.saves_list)
         
         # Painel de detalhes
-        self.details_browser = QTextBrowser()
+        # QLabel em texto simples: sem parser de HTML nem detecção automática
+        self.details_browser = QLabel()
+        self.details_browser.setTextFormat(Qt.PlainText)
+        self.details_browser.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.details_browser.setWordWrap(True)
         splitter.addWidget(self.details_browser)
         
         # Definir proporções do splitter
@@ -40,7 +48,7 @@ class LoadGameDialog(QDialog):
         self.load_existing_saves()
         
         # Conectar seleção da lista à exibição de detalhes
-        self.saves_list.itemClicked.connect(self.on_save_selected)
+        self.saves_list.clicked.connect(self.on_save_selected)
         
         # Botões
         button_layout = QHBoxLayout()
@@ -68,43 +76,38 @@ class LoadGameDialog(QDialog):
     
     def load_existing_saves(self):
         """Carrega a lista de salvamentos existentes."""
-        self.saves_list.clear()
-        saves = self.game_controller.save_manager.list_saves()
+        saves = self.game_controller.save_manager.list_saves_cached()
+        self.saves_model.set_saves(saves)
         
         if not saves:
             self.details_browser.setText("No saved games found.")
-            return
-        
-        for save in saves:
-            item = QListWidgetItem(save['name'])
-            item.setData(Qt.UserRole, save['filename'])
-            # Armazenar todos os detalhes do salvamento
-            item.setData(Qt.UserRole + 1, save)
-            self.saves_list.addItem(item)
     
-    def on_save_selected(self, item):
+    def refresh(self):
+        """Relê a lista de salvamentos e limpa a seleção (reabertura do diálogo)."""
+        self.selected_save = ""
+        self.load_button.setEnabled(False)
+        self.delete_button.setEnabled(False)
+        self.details_browser.clear()
+        self.load_existing_saves()
+    
+    def on_save_selected(self, index):
         """
         Manipulador para seleção de um salvamento.
         
         Args:
-            item: Item selecionado
+            index: Índice (QModelIndex) da linha selecionada
         """
-        self.selected_save = item.data(Qt.UserRole)
-        save_details = item.data(Qt.UserRole + 1)
+        save_details = self.saves_model.save_at(index.row())
+        if save_details['filename'] == self.selected_save:
+            return  # Mesmo salvamento clicado de novo; nada a redesenhar
+        self.selected_save = save_details['filename']
         
         # Habilitar botões
         self.load_button.setEnabled(True)
         self.delete_button.setEnabled(True)
         
         # Exibir detalhes
-        details_html = f"""
-        <h3>{save_details['name']}</h3>
-        <p><b>Date:</b> {save_details['timestamp']}</p>
-        <p><b>Version:</b> {save_details['version']}</p>
-        <p><b>File:</b> {save_details['filename']}</p>
-        """
-        
-        self.details_browser.setHtml(details_html)
+        self.details_browser.setText(SAVE_DETAILS_TPL.format_map(save_details))
     
     def on_load(self):
         """Manipulador para botão de carregar."""
@@ -118,7 +121,7 @@ class LoadGameDialog(QDialog):
         
         reply = QMessageBox.question(
             self, 'Delete Save',
-            f'Are you sure you want to delete "{self.saves_list.currentItem().text()}"?',
+            f'Are you sure you want to delete "{self.saves_list.currentIndex().data()}"?',
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
@@ -1,7 +1,11 @@
 from PyQt5.QtWidgets import (QMainWindow, QDockWidget, QAction, QMenuBar, 
                             QStatusBar, QFileDialog, QMessageBox, QDialog, 
-                            QLineEdit, QListWidget, QListWidgetItem, QSplitter, QTextBrowser)
-from PyQt5.QtCore import Qt, QSize, pyqtSignal
+                            QLineEdit, QListWidget, QListWidgetItem, QListView, QSplitter, QLabel,
+                            QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton,
+                            QComboBox, QGroupBox, QCheckBox, QTabWidget, QWidget,
+                            QSlider, QSpinBox, QDoubleSpinBox)
+from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
+from functools import partial
 import config
 
 from game.gui.map_view import MapGLWidget
@@ -9,15 +13,15 @@ from game.gui.info_panel import InfoPanel
 from game.gui.minimap_panel import MinimapPanel
 from game.gui.unit_panel import UnitPanel
 from game.gui.city_panel import CityPanel
-from game.gui.tech_dialog import TechDialog
-from game.gui.diplomacy_dialog import DiplomacyDialog
-from game.gui.options_dialog import OptionsDialog
-from game.gui.about_dialog import AboutDialog
-from game.gui.new_game_dialog import NewGameDialog
-from game.gui.save_game_dialog import SaveGameDialog
-from game.gui.load_game_dialog import LoadGameDialog
+from game.gui.gui_factory import load_dialog_class, get_cached_dialog
+from game.gui.dialog_options import (MAP_TYPES, MAP_SIZES, DIFFICULTIES, SPEEDS,
+                                     NUM_CIVS, SAVE_DETAILS_TPL, SavesModel,
+                                     add_options)
 from game.utils.i18n import I18n
 
+# Níveis de qualidade gráfica do diálogo de opções
+_QUALITIES = ("Low", "Medium", "High")
+
 
 class GUIFactory:
     """
@@ -65,19 +69,28 @@ class GUIFactory:
         """
         action = QAction(text, parent)
         
-        if icon:
+        # "is not None" evita o __bool__ do QIcon; QAction já nasce não marcável
+        if icon is not None:
             action.setIcon(icon)
         if shortcut:
             action.setShortcut(shortcut)
         if tip:
             action.setStatusTip(tip)
             action.setToolTip(tip)
-        if slot:
-            action.triggered.connect(slot)
-        
-        action.setCheckable(checkable)
+        if slot is not None:
+            # Apenas conexões novas (callables); ações disparam na thread da GUI
+            assert callable(slot) and not isinstance(slot, str), "slot deve ser um callable"
+            action.triggered.connect(slot, Qt.DirectConnection)
         if checkable:
+            action.setCheckable(True)
             action.setChecked(checked)
+        
+        # Referência Python no pai: a ação não depende só da posse do Qt
+        if parent is not None:
+            refs = getattr(parent, '_py_action_refs', None)
+            if refs is None:
+                refs = parent._py_action_refs = []
+            refs.append(action)
             
         return action
     
@@ -105,6 +118,55 @@ class MainWindowMenuManager:
     Responsável por criar e gerenciar os menus da aplicação.
     """
     
+    __slots__ = ('main_window', 'game_controller', 'actions', '_labels',
+                 # Referências diretas às ações do menu View (ver setup_view_menu)
+                 'action_toggle_minimap', 'action_toggle_grid', 'action_toggle_resources',
+                 'action_toggle_improvements', 'action_fullscreen')
+    
+    # Tabelas dos menus: (chave, texto, slot, atalho, dica, marcável, marcada);
+    # None representa um separador
+    _GAME_MENU_SPEC = (
+        ('new_game', "New Game", 'on_new_game', "Ctrl+N", "Start a new game", False, False),
+        ('load_game', "Load Game", 'on_load_game', "Ctrl+L", "Load a saved game", False, False),
+        ('save_game', "Save Game", 'on_save_game', "Ctrl+S", "Save the current game", False, False),
+        ('save_game_as', "Save Game As...", 'on_save_game_as', "Ctrl+Shift+S",
+         "Save the current game with a new name", False, False),
+        None,
+        ('options', "Options", 'on_options', None, "Configure game options", False, False),
+        None,
+        ('exit', "Exit", 'close', "Alt+F4", "Exit the application", False, False),
+    )
+    
+    _VIEW_MENU_SPEC = (
+        ('toggle_minimap', "Toggle Minimap", 'on_toggle_minimap', "M",
+         "Show or hide the minimap", True, True),
+        ('toggle_grid', "Toggle Grid", 'on_toggle_grid', "G",
+         "Show or hide the grid", True, True),
+        ('toggle_resources', "Toggle Resources", 'on_toggle_resources', "R",
+         "Show or hide resources", True, True),
+        ('toggle_improvements', "Toggle Improvements", 'on_toggle_improvements', "I",
+         "Show or hide tile improvements", True, True),
+        None,
+        ('fullscreen', "Fullscreen", 'on_toggle_fullscreen', "F11",
+         "Toggle fullscreen mode", True, config.FULLSCREEN),
+    )
+    
+    _CIVILIZATION_MENU_SPEC = (
+        ('tech_tree', "Technology Tree", 'on_tech_tree', "T", "View the technology tree", False, False),
+        ('diplomacy', "Diplomacy", 'on_diplomacy', "D", "Manage diplomatic relations", False, False),
+        ('economy', "Economy", 'on_economy', "E", "View economic information", False, False),
+        ('military', "Military", 'on_military', "Shift+M", "View military information", False, False),
+        None,
+        ('end_turn', "End Turn", 'on_end_turn', "Enter", "End the current turn", False, False),
+    )
+    
+    _HELP_MENU_SPEC = (
+        ('manual', "Game Manual", 'on_manual', "F1", "View the game manual", False, False),
+        ('about', "About", 'on_about', None, "About this game", False, False),
+    )
+    
+    _MENU_SPECS = (_GAME_MENU_SPEC, _VIEW_MENU_SPEC, _CIVILIZATION_MENU_SPEC, _HELP_MENU_SPEC)
+    
     def __init__(self, main_window, game_controller):
         """
         Inicializa o gerenciador de menus.
@@ -116,6 +178,8 @@ class MainWindowMenuManager:
         self.main_window = main_window
         self.game_controller = game_controller
         self.actions = {}
+        # Textos das ações já traduzidos, resolvidos uma vez (ver _load_labels)
+        self._labels = self._load_labels()
         
         # Criar menus
         self.setup_game_menu()
@@ -123,198 +187,78 @@ class MainWindowMenuManager:
         self.setup_civilization_menu()
         self.setup_help_menu()
     
-    def setup_game_menu(self):
-        """Configura o menu Game."""
-        game_menu = self.main_window.menuBar().addMenu("Game")
-        
-        # New Game
-        self.actions['new_game'] = GUIFactory.create_action(
-            self.main_window, "New Game", 
-            self.main_window.on_new_game,
-            shortcut="Ctrl+N",
-            tip="Start a new game"
-        )
-        game_menu.addAction(self.actions['new_game'])
-        
-        # Load Game
-        self.actions['load_game'] = GUIFactory.create_action(
-            self.main_window, "Load Game", 
-            self.main_window.on_load_game,
-            shortcut="Ctrl+L",
-            tip="Load a saved game"
-        )
-        game_menu.addAction(self.actions['load_game'])
-        
-        # Save Game
-        self.actions['save_game'] = GUIFactory.create_action(
-            self.main_window, "Save Game", 
-            self.main_window.on_save_game,
-            shortcut="Ctrl+S",
-            tip="Save the current game"
-        )
-        game_menu.addAction(self.actions['save_game'])
-        
-        # Save Game As
-        self.actions['save_game_as'] = GUIFactory.create_action(
-            self.main_window, "Save Game As...", 
-            self.main_window.on_save_game_as,
-            shortcut="Ctrl+Shift+S",
-            tip="Save the current game with a new name"
-        )
-        game_menu.addAction(self.actions['save_game_as'])
-        
-        game_menu.addSeparator()
-        
-        # Options
-        self.actions['options'] = GUIFactory.create_action(
-            self.main_window, "Options", 
-            self.main_window.on_options,
-            tip="Configure game options"
-        )
-        game_menu.addAction(self.actions['options'])
+    def _load_labels(self):
+        """
+        Resolve os textos das ações no idioma atual.
         
-        game_menu.addSeparator()
+        Returns:
+            dict: Texto traduzido por chave de ação ('main_menu.<chave>'),
+            com o texto da tabela como padrão
+        """
+        t = self.main_window.i18n.t
+        return {entry[0]: t(f'main_menu.{entry[0]}', default=entry[1])
+                for spec in self._MENU_SPECS for entry in spec if entry is not None}
+    
+    def on_language_changed(self):
+        """Reaplica os textos das ações após troca de idioma (sem recriá-las)."""
+        self._labels = labels = self._load_labels()
+        for key, action in self.actions.items():
+            action.setText(labels[key])
+    
+    def _build_menu(self, title, spec):
+        """
+        Cria um menu da barra a partir de uma tabela declarativa.
         
-        # Exit
-        self.actions['exit'] = GUIFactory.create_action(
-            self.main_window, "Exit", 
-            self.main_window.close,
-            shortcut="Alt+F4",
-            tip="Exit the application"
-        )
-        game_menu.addAction(self.actions['exit'])
+        Args:
+            title: Título do menu
+            spec: Sequência de linhas (chave, texto, slot, atalho, dica,
+                marcável, marcada); None insere um separador
+                
+        Returns:
+            QMenu: O menu criado
+        """
+        main_window = self.main_window
+        actions = self.actions
+        labels = self._labels
+        create_action = GUIFactory.create_action
+        menu = main_window.menuBar().addMenu(title)
+        
+        for entry in spec:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            key, text, slot_name, shortcut, tip, checkable, checked = entry
+            assert key not in actions, f"ação '{key}' criada duas vezes"
+            action = create_action(main_window, labels[key], getattr(main_window, slot_name),
+                                   shortcut, None, tip, checkable, checked)
+            actions[key] = action
+            menu.addAction(action)
+        
+        return menu
+    
+    def setup_game_menu(self):
+        """Configura o menu Game."""
+        self._build_menu("Game", self._GAME_MENU_SPEC)
     
     def setup_view_menu(self):
         """Configura o menu View."""
-        view_menu = self.main_window.menuBar().addMenu("View")
-        
-        # Toggle Minimap
-        self.actions['toggle_minimap'] = GUIFactory.create_action(
-            self.main_window, "Toggle Minimap", 
-            self.main_window.on_toggle_minimap,
-            shortcut="M",
-            tip="Show or hide the minimap",
-            checkable=True,
-            checked=True
-        )
-        view_menu.addAction(self.actions['toggle_minimap'])
-        
-        # Toggle Grid
-        self.actions['toggle_grid'] = GUIFactory.create_action(
-            self.main_window, "Toggle Grid", 
-            self.main_window.on_toggle_grid,
-            shortcut="G",
-            tip="Show or hide the grid",
-            checkable=True,
-            checked=True
-        )
-        view_menu.addAction(self.actions['toggle_grid'])
-        
-        # Toggle Resources
-        self.actions['toggle_resources'] = GUIFactory.create_action(
-            self.main_window, "Toggle Resources", 
-            self.main_window.on_toggle_resources,
-            shortcut="R",
-            tip="Show or hide resources",
-            checkable=True,
-            checked=True
-        )
-        view_menu.addAction(self.actions['toggle_resources'])
-        
-        # Toggle Improvements
-        self.actions['toggle_improvements'] = GUIFactory.create_action(
-            self.main_window, "Toggle Improvements", 
-            self.main_window.on_toggle_improvements,
-            shortcut="I",
-            tip="Show or hide tile improvements",
-            checkable=True,
-            checked=True
-        )
-        view_menu.addAction(self.actions['toggle_improvements'])
-        
-        view_menu.addSeparator()
-        
-        # Fullscreen
-        self.actions['fullscreen'] = GUIFactory.create_action(
-            self.main_window, "Fullscreen", 
-            self.main_window.on_toggle_fullscreen,
-            shortcut="F11",
-            tip="Toggle fullscreen mode",
-            checkable=True,
-            checked=config.FULLSCREEN
-        )
-        view_menu.addAction(self.actions['fullscreen'])
+        self._build_menu("View", self._VIEW_MENU_SPEC)
+        
+        # Acesso direto para os manipuladores de alternância (teclas de atalho)
+        actions = self.actions
+        self.action_toggle_minimap = actions['toggle_minimap']
+        self.action_toggle_grid = actions['toggle_grid']
+        self.action_toggle_resources = actions['toggle_resources']
+        self.action_toggle_improvements = actions['toggle_improvements']
+        self.action_fullscreen = actions['fullscreen']
     
     def setup_civilization_menu(self):
         """Configura o menu Civilization."""
-        civ_menu = self.main_window.menuBar().addMenu("Civilization")
-        
-        # Technology Tree
-        self.actions['tech_tree'] = GUIFactory.create_action(
-            self.main_window, "Technology Tree", 
-            self.main_window.on_tech_tree,
-            shortcut="T",
-            tip="View the technology tree"
-        )
-        civ_menu.addAction(self.actions['tech_tree'])
-        
-        # Diplomacy
-        self.actions['diplomacy'] = GUIFactory.create_action(
-            self.main_window, "Diplomacy", 
-            self.main_window.on_diplomacy,
-            shortcut="D",
-            tip="Manage diplomatic relations"
-        )
-        civ_menu.addAction(self.actions['diplomacy'])
-        
-        # Economy
-        self.actions['economy'] = GUIFactory.create_action(
-            self.main_window, "Economy", 
-            self.main_window.on_economy,
-            shortcut="E",
-            tip="View economic information"
-        )
-        civ_menu.addAction(self.actions['economy'])
-        
-        # Military
-        self.actions['military'] = GUIFactory.create_action(
-            self.main_window, "Military", 
-            self.main_window.on_military,
-            shortcut="Shift+M",
-            tip="View military information"
-        )
-        civ_menu.addAction(self.actions['military'])
-        
-        # End Turn
-        civ_menu.addSeparator()
-        self.actions['end_turn'] = GUIFactory.create_action(
-            self.main_window, "End Turn", 
-            self.main_window.on_end_turn,
-            shortcut="Enter",
-            tip="End the current turn"
-        )
-        civ_menu.addAction(self.actions['end_turn'])
+        self._build_menu("Civilization", self._CIVILIZATION_MENU_SPEC)
     
     def setup_help_menu(self):
         """Configura o menu Help."""
-        help_menu = self.main_window.menuBar().addMenu("Help")
-        
-        # Game Manual
-        self.actions['manual'] = GUIFactory.create_action(
-            self.main_window, "Game Manual", 
-            self.main_window.on_manual,
-            shortcut="F1",
-            tip="View the game manual"
-        )
-        help_menu.addAction(self.actions['manual'])
-        
-        # About
-        self.actions['about'] = GUIFactory.create_action(
-            self.main_window, "About", 
-            self.main_window.on_about,
-            tip="About this game"
-        )
-        help_menu.addAction(self.actions['about'])
+        self._build_menu("Help", self._HELP_MENU_SPEC)
     
     def get_action(self, action_name):
         """
@@ -328,9 +272,16 @@ class MainWindowMenuManager:
         """
         return self.actions.get(action_name)
     
-    def update_actions(self):
-        """Atualiza o estado das ações com base no estado do jogo."""
-        game_state = self.game_controller.get_game_state()
+    def update_actions(self, game_state=None):
+        """
+        Atualiza o estado das ações com base no estado do jogo.
+        
+        Args:
+            game_state: Estado do jogo já obtido pelo chamador (opcional;
+                consultado no controlador se omitido)
+        """
+        if game_state is None:
+            game_state = self.game_controller.get_game_state()
         
         # Ações que dependem de um jogo em andamento
         game_running = game_state is not None
@@ -354,6 +305,9 @@ class MainWindowDockManager:
     Responsável por criar e gerenciar os painéis laterais e inferiores.
     """
     
+    __slots__ = ('main_window', 'game_controller', 'docks', 'panels',
+                 '_updatable_panels', '_panel_factories')
+    
     def __init__(self, main_window, game_controller):
         """
         Inicializa o gerenciador de docks.
@@ -366,68 +320,98 @@ class MainWindowDockManager:
         self.game_controller = game_controller
         self.docks = {}
         self.panels = {}
+        self._updatable_panels = []  # Painéis que definem update_panel (ver update_panels)
+        
+        # Classes dos painéis, construídos após a primeira volta do event loop
+        self._panel_factories = {
+            'info': InfoPanel,
+            'minimap': MinimapPanel,
+            'unit': UnitPanel,
+            'city': CityPanel,
+        }
         
-        # Criar painéis
+        # Criar os docks (com marcadores de carregamento)
         self.setup_info_panel()
         self.setup_minimap_panel()
         self.setup_unit_panel()
         self.setup_city_panel()
     
-    def setup_info_panel(self):
-        """Configura o painel de informações."""
-        self.panels['info'] = InfoPanel(self.game_controller)
-        self.docks['info'] = GUIFactory.create_dock_widget(
-            "Game Info", 
-            self.panels['info'], 
+    def _add_dock(self, name, title, allowed_areas, area):
+        """
+        Cria o dock de um painel com um marcador e agenda a construção do painel.
+        
+        Args:
+            name: Nome do painel
+            title: Título do dock
+            allowed_areas: Áreas permitidas para o dock
+            area: Área inicial do dock
+        """
+        self.docks[name] = GUIFactory.create_dock_widget(
+            title, 
+            QLabel("Loading…"), 
             self.main_window, 
-            Qt.TopDockWidgetArea
+            allowed_areas
         )
-        self.main_window.addDockWidget(Qt.TopDockWidgetArea, self.docks['info'])
+        self.main_window.addDockWidget(area, self.docks[name])
+        QTimer.singleShot(0, partial(self._populate_panel, name))
+    
+    def _populate_panel(self, name):
+        """
+        Constrói o painel real de um dock, substituindo o marcador.
+        
+        Args:
+            name: Nome do painel
+            
+        Returns:
+            O painel construído (ou o já existente)
+        """
+        panel = self.panels.get(name)
+        if panel is not None:
+            return panel
+        
+        panel = self.panels[name] = self._panel_factories[name](self.game_controller)
+        if hasattr(panel, 'update_panel'):
+            self._updatable_panels.append(panel)
+        dock = self.docks[name]
+        placeholder = dock.widget()
+        dock.setWidget(panel)
+        if placeholder is not None:
+            placeholder.deleteLater()
+        return panel
+    
+    def setup_info_panel(self):
+        """Configura o painel de informações."""
+        self._add_dock('info', "Game Info", Qt.TopDockWidgetArea, Qt.TopDockWidgetArea)
     
     def setup_minimap_panel(self):
         """Configura o painel do minimapa."""
-        self.panels['minimap'] = MinimapPanel(self.game_controller)
-        self.docks['minimap'] = GUIFactory.create_dock_widget(
-            "Minimap", 
-            self.panels['minimap'], 
-            self.main_window, 
-            Qt.RightDockWidgetArea | Qt.BottomDockWidgetArea
-        )
-        self.main_window.addDockWidget(Qt.BottomDockWidgetArea, self.docks['minimap'])
+        self._add_dock('minimap', "Minimap",
+                       Qt.RightDockWidgetArea | Qt.BottomDockWidgetArea, Qt.BottomDockWidgetArea)
     
     def setup_unit_panel(self):
         """Configura o painel de unidades."""
-        self.panels['unit'] = UnitPanel(self.game_controller)
-        self.docks['unit'] = GUIFactory.create_dock_widget(
-            "Unit Info", 
-            self.panels['unit'], 
-            self.main_window, 
-            Qt.RightDockWidgetArea
-        )
-        self.main_window.addDockWidget(Qt.RightDockWidgetArea, self.docks['unit'])
+        self._add_dock('unit', "Unit Info", Qt.RightDockWidgetArea, Qt.RightDockWidgetArea)
     
     def setup_city_panel(self):
         """Configura o painel de cidades."""
-        self.panels['city'] = CityPanel(self.game_controller)
-        self.docks['city'] = GUIFactory.create_dock_widget(
-            "City Info", 
-            self.panels['city'], 
-            self.main_window, 
-            Qt.RightDockWidgetArea
-        )
-        self.main_window.addDockWidget(Qt.RightDockWidgetArea, self.docks['city'])
+        self._add_dock('city', "City Info", Qt.RightDockWidgetArea, Qt.RightDockWidgetArea)
     
     def get_panel(self, panel_name):
         """
         Obtém um painel pelo nome.
         
+        Um painel ainda não construído é construído na hora.
+        
         Args:
             panel_name: Nome do painel
             
         Returns:
             O painel correspondente ou None se não encontrado
         """
-        return self.panels.get(panel_name)
+        panel = self.panels.get(panel_name)
+        if panel is None and panel_name in self._panel_factories:
+            panel = self._populate_panel(panel_name)
+        return panel
     
     def get_dock(self, dock_name):
         """
@@ -459,9 +443,8 @@ class MainWindowDockManager:
     
     def update_panels(self):
         """Atualiza todos os painéis com base no estado do jogo."""
-        for panel in self.panels.values():
-            if hasattr(panel, 'update_panel'):
-                panel.update_panel()
+        for panel in self._updatable_panels:
+            panel.update_panel()
 
 
 class MainWindow(QMainWindow):
@@ -498,6 +481,19 @@ class MainWindow(QMainWindow):
         # Estado da janela
         self.is_fullscreen = config.FULLSCREEN
         self.normal_geometry = None
+        self._about_dialog = None  # Criado na primeira abertura e reaproveitado
+        self._dialog_cache = {}  # Diálogos reaproveitados, por classe (ver get_cached_dialog)
+        self._exit_confirm = None  # Confirmação de saída (ver _get_exit_confirm)
+        
+        # Último tile clicado; esquecido quando o jogo muda (ver _flush_updates)
+        self._last_tile = (-1, -1)
+        
+        # Atualizações de painéis/mapa agrupadas (ver _schedule_update)
+        self._pending_updates = set()
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._flush_updates)
         
         # Configurar componentes da GUI
         self.setup_central_widget()
@@ -525,15 +521,25 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Ready")
     
     def connect_signals(self):
-        """Conecta sinais entre componentes."""
-        # Conectar sinais do controlador do jogo
-        self.game_controller.turn_changed.connect(self.on_turn_changed)
-        self.game_controller.turn_ended.connect(self.on_turn_ended)
-        self.game_controller.active_city_changed.connect(self.on_active_city_changed)
-        self.game_controller.map_updated.connect(self.on_map_updated)
-        self.game_controller.game_started.connect(self.on_game_started)
-        self.game_controller.game_loaded.connect(self.on_game_loaded)
-        self.game_controller.game_saved.connect(self.on_game_saved)
+        """
+        Conecta sinais entre componentes.
+        
+        Todas as conexões são explícitas. A janela não usa uic/setupUi e não
+        deve chamar QMetaObject.connectSlotsByName: com tantos manipuladores
+        on_*, a varredura por nome poderia ligar slots extras sem aviso.
+        """
+        # Conectar sinais do controlador do jogo. Eles são sempre emitidos na
+        # thread da GUI (os workers só enfileiram eventos), então a conexão
+        # direta é segura e dispensa a resolução do tipo a cada emissão
+        gc = self.game_controller
+        direct = Qt.DirectConnection
+        gc.turn_changed.connect(self.on_turn_changed, direct)
+        gc.turn_ended.connect(self.on_turn_ended, direct)
+        gc.active_city_changed.connect(self.on_active_city_changed, direct)
+        gc.map_updated.connect(self.on_map_updated, direct)
+        gc.game_started.connect(self.on_game_started, direct)
+        gc.game_loaded.connect(self.on_game_loaded, direct)
+        gc.game_saved.connect(self.on_game_saved, direct)
         
         # Conectar sinais do mapa
         self.map_widget.tile_clicked.connect(self.on_tile_clicked)
@@ -547,13 +553,7 @@ class MainWindow(QMainWindow):
     # Manipuladores de eventos do jogo
     def on_turn_changed(self):
         """Manipulador para mudança de turno."""
-        # Atualizar painéis
-        self.dock_manager.get_panel('info').update_turn()
-        self.dock_manager.update_panels()
-        
-        # Atualizar barra de status
-        turn = self.game_controller.get_game_state().current_turn
-        self.status_bar.showMessage(f"Turn {turn}")
+        self._schedule_update('panels')
     
     def on_turn_ended(self):
         """Manipulador para fim de turno."""
@@ -562,30 +562,67 @@ class MainWindow(QMainWindow):
     
     def on_active_city_changed(self):
         """Manipulador para mudança de cidade ativa."""
+        self._last_tile = (-1, -1)
         self.dock_manager.get_panel('city').update_city()
     
     def on_map_updated(self):
         """Manipulador para atualização do mapa."""
-        self.map_widget.update_map()
-        self.dock_manager.get_panel('minimap').update_minimap()
+        self._schedule_update('map')
+    
+    def _schedule_update(self, kind):
+        """
+        Agenda uma atualização da interface.
+        
+        Sinais em sequência (fim de turno, jogadas da IA, vários tiles
+        alterados) resultam em uma única atualização de cada tipo.
+        
+        Args:
+            kind: 'panels' (painéis e barra de status) ou 'map' (mapa e minimapa)
+        """
+        self._pending_updates.add(kind)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    def _flush_updates(self):
+        """Executa as atualizações agendadas, uma vez por tipo."""
+        pending = self._pending_updates
+        self._pending_updates = set()
+        self._last_tile = (-1, -1)
+        
+        if 'panels' in pending:
+            # Atualizar painéis
+            self.dock_manager.get_panel('info').update_turn()
+            self.dock_manager.update_panels()
+            
+            # Atualizar barra de status
+            turn = self.game_controller.get_game_state().current_turn
+            self.status_bar.showMessage(f"Turn {turn}")
+        
+        if 'map' in pending:
+            self.map_widget.update_map()
+            self.dock_manager.get_panel('minimap').update_minimap()
     
     def on_game_started(self):
         """Manipulador para início de jogo."""
         self.game_started.emit()
-        self.menu_manager.update_actions()
+        self._last_tile = (-1, -1)
+        self.menu_manager.update_actions(self.game_controller.get_game_state())
         self.dock_manager.update_panels()
         self.status_bar.showMessage("Game started")
     
     def on_game_loaded(self):
         """Manipulador para carregamento de jogo."""
-        self.game_loaded.emit(self.game_controller.get_game_state().id)
-        self.menu_manager.update_actions()
+        game_state = self.game_controller.get_game_state()
+        self.game_loaded.emit(game_state.id)
+        self._last_tile = (-1, -1)
+        self.menu_manager.update_actions(game_state)
         self.dock_manager.update_panels()
         self.status_bar.showMessage("Game loaded")
     
     def on_game_saved(self):
         """Manipulador para salvamento de jogo."""
-        self.game_saved.emit(self.game_controller.get_game_state().id)
+        game_state = self.game_controller.get_game_state()
+        self.game_saved.emit(game_state.id)
         self.status_bar.showMessage("Game saved")
     
     def on_tile_clicked(self, x, y):
@@ -595,23 +632,22 @@ class MainWindow(QMainWindow):
         Args:
             x, y: Coordenadas do tile
         """
-        # Obter informações do tile
-        world = self.game_controller.get_world()
-        if not world:
+        # Mesmo tile do último clique, sem mudanças no jogo desde então
+        if (x, y) == self._last_tile:
             return
         
-        tile = world.get_tile(x, y)
+        # Obter informações do tile (tile, unidades e cidade numa só consulta)
+        tile, units, city = self.game_controller.tile_snapshot(x, y)
         if not tile:
             return
+        self._last_tile = (x, y)
         
         # Verificar se há unidades no tile
-        units = self.game_controller.get_units_at(x, y)
         if units:
             # Selecionar a primeira unidade
             self.dock_manager.get_panel('unit').set_unit(units[0])
         
         # Verificar se há cidade no tile
-        city = self.game_controller.get_city_at(x, y)
         if city:
             self.dock_manager.get_panel('city').set_city(city)
         
@@ -623,7 +659,9 @@ class MainWindow(QMainWindow):
     # Manipuladores de ações do menu
     def on_new_game(self):
         """Manipulador para ação de novo jogo."""
-        dialog = NewGameDialog(self.game_controller, self)
+        dialog = get_cached_dialog(self._dialog_cache, self, NewGameDialog, self.game_controller)
+        if dialog.isVisible():
+            return
         if dialog.exec_() == QDialog.Accepted:
             # Iniciar novo jogo com as configurações selecionadas
             config = dialog.get_game_config()
@@ -632,7 +670,7 @@ class MainWindow(QMainWindow):
     
     def on_load_game(self):
         """Manipulador para ação de carregar jogo."""
-        dialog = LoadGameDialog(self.game_controller, self)
+        dialog = get_cached_dialog(self._dialog_cache, self, LoadGameDialog, self.game_controller)
         if dialog.exec_() == QDialog.Accepted:
             # Carregar o jogo selecionado
             save_name = dialog.get_selected_save()
@@ -643,39 +681,48 @@ class MainWindow(QMainWindow):
     def on_save_game(self):
         """Manipulador para ação de salvar jogo."""
         # Verificar se há um jogo em andamento
-        if not self.game_controller.get_game_state():
+        game_state = self.game_controller.get_game_state()
+        if not game_state:
             QMessageBox.warning(self, "Save Game", "No game in progress to save.")
             return
         
         # Se o jogo já foi salvo, usar o mesmo nome
-        game_state = self.game_controller.get_game_state()
         if hasattr(game_state, 'save_name') and game_state.save_name:
             self.game_controller.save_game(game_state.save_name)
             self.status_bar.showMessage(f"Game saved as: {game_state.save_name}")
         else:
             # Se não, usar "Salvar como..."
-            self.on_save_game_as()
+            self._save_game_as(game_state)
     
     def on_save_game_as(self):
         """Manipulador para ação de salvar jogo como."""
         # Verificar se há um jogo em andamento
-        if not self.game_controller.get_game_state():
+        game_state = self.game_controller.get_game_state()
+        if not game_state:
             QMessageBox.warning(self, "Save Game", "No game in progress to save.")
             return
+        self._save_game_as(game_state)
+    
+    def _save_game_as(self, game_state):
+        """
+        Pede um nome ao usuário e salva o jogo.
         
-        dialog = SaveGameDialog(self.game_controller, self)
+        Args:
+            game_state: Estado do jogo em andamento (já obtido pelo chamador)
+        """
+        dialog = get_cached_dialog(self._dialog_cache, self, SaveGameDialog, self.game_controller)
         if dialog.exec_() == QDialog.Accepted:
             # Salvar o jogo com o nome especificado
             save_name = dialog.get_save_name()
             if save_name:
                 self.game_controller.save_game(save_name)
                 # Armazenar o nome do salvamento no estado do jogo
-                self.game_controller.get_game_state().save_name = save_name
+                game_state.save_name = save_name
                 self.status_bar.showMessage(f"Game saved as: {save_name}")
     
     def on_options(self):
         """Manipulador para ação de opções."""
-        dialog = OptionsDialog(self)
+        dialog = get_cached_dialog(self._dialog_cache, self, OptionsDialog)
         if dialog.exec_() == QDialog.Accepted:
             # Aplicar novas configurações
             self.apply_settings(dialog.get_settings())
@@ -684,7 +731,7 @@ class MainWindow(QMainWindow):
     def on_toggle_minimap(self):
         """Manipulador para ação de alternar minimapa."""
         visible = self.dock_manager.toggle_dock('minimap')
-        self.menu_manager.get_action('toggle_minimap').setChecked(visible)
+        self.menu_manager.action_toggle_minimap.setChecked(visible)
         self.status_bar.showMessage(f"Minimap {'shown' if visible else 'hidden'}")
     
     def on_toggle_grid(self):
@@ -694,14 +741,12 @@ class MainWindow(QMainWindow):
     
     def on_toggle_resources(self):
         """Manipulador para ação de alternar recursos."""
-        self.map_widget.show_resources = not self.map_widget.show_resources
-        self.map_widget.update()
+        self.map_widget.set_layer_visible('resources', not self.map_widget.show_resources)
         self.status_bar.showMessage(f"Resources {'shown' if self.map_widget.show_resources else 'hidden'}")
     
     def on_toggle_improvements(self):
         """Manipulador para ação de alternar melhorias."""
-        self.map_widget.show_improvements = not self.map_widget.show_improvements
-        self.map_widget.update()
+        self.map_widget.set_layer_visible('improvements', not self.map_widget.show_improvements)
         self.status_bar.showMessage(f"Improvements {'shown' if self.map_widget.show_improvements else 'hidden'}")
     
     def on_toggle_fullscreen(self):
@@ -719,16 +764,18 @@ class MainWindow(QMainWindow):
             self.is_fullscreen = False
         
         # Atualizar estado da ação
-        self.menu_manager.get_action('fullscreen').setChecked(self.is_fullscreen)
+        self.menu_manager.action_fullscreen.setChecked(self.is_fullscreen)
     
     def on_tech_tree(self):
         """Manipulador para ação de árvore tecnológica."""
-        dialog = TechDialog(self.game_controller, self)
+        TechDialog = load_dialog_class('game.gui.tech_dialog', 'TechDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, TechDialog, self.game_controller)
         dialog.exec_()
     
     def on_diplomacy(self):
         """Manipulador para ação de diplomacia."""
-        dialog = DiplomacyDialog(self.game_controller, self)
+        DiplomacyDialog = load_dialog_class('game.gui.diplomacy_dialog', 'DiplomacyDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, DiplomacyDialog, self.game_controller)
         dialog.exec_()
     
     def on_economy(self):
@@ -753,8 +800,10 @@ class MainWindow(QMainWindow):
     
     def on_about(self):
         """Manipulador para ação de sobre."""
-        dialog = AboutDialog(self)
-        dialog.exec_()
+        if self._about_dialog is None:
+            AboutDialog = load_dialog_class('game.gui.about_dialog', 'AboutDialog')
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec_()
     
     def apply_settings(self, settings):
         """
@@ -767,21 +816,36 @@ class MainWindow(QMainWindow):
         if 'fullscreen' in settings and settings['fullscreen'] != self.is_fullscreen:
             self.on_toggle_fullscreen()
         
-        # Aplicar configurações de renderização
+        # Aplicar configurações de renderização; o mapa só é redesenhado
+        # se alguma camada mudar de fato
         if 'show_grid' in settings:
-            self.map_widget.show_grid = settings['show_grid']
-            self.menu_manager.get_action('toggle_grid').setChecked(settings['show_grid'])
+            self.map_widget.set_layer_visible('grid', settings['show_grid'])
+            self.menu_manager.action_toggle_grid.setChecked(settings['show_grid'])
         
         if 'show_resources' in settings:
-            self.map_widget.show_resources = settings['show_resources']
-            self.menu_manager.get_action('toggle_resources').setChecked(settings['show_resources'])
+            self.map_widget.set_layer_visible('resources', settings['show_resources'])
+            self.menu_manager.action_toggle_resources.setChecked(settings['show_resources'])
         
         if 'show_improvements' in settings:
-            self.map_widget.show_improvements = settings['show_improvements']
-            self.menu_manager.get_action('toggle_improvements').setChecked(settings['show_improvements'])
+            self.map_widget.set_layer_visible('improvements', settings['show_improvements'])
+            self.menu_manager.action_toggle_improvements.setChecked(settings['show_improvements'])
+    
+    def _get_exit_confirm(self):
+        """
+        Obtém a caixa de confirmação de saída, criada no primeiro uso.
         
-        # Atualizar o mapa com as novas configurações
-        self.map_widget.update()
+        Returns:
+            QMessageBox: Pergunta Save/Discard/Cancel reaproveitada entre tentativas
+        """
+        if self._exit_confirm is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Question)
+            box.setWindowTitle('Exit Game')
+            box.setText('The current game is not saved. Do you want to save before exiting?')
+            box.setStandardButtons(QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel)
+            box.setDefaultButton(QMessageBox.Save)
+            self._exit_confirm = box
+        return self._exit_confirm
     
     def closeEvent(self, event):
         """
@@ -790,15 +854,15 @@ class MainWindow(QMainWindow):
         Args:
             event: Evento de fechamento
         """
+        # Janela já escondida (fechamento em andamento): nada a confirmar
+        if self.isHidden():
+            event.accept()
+            return
+        
         # Verificar se há um jogo em andamento e não salvo
         game_state = self.game_controller.get_game_state()
         if game_state and not hasattr(game_state, 'save_name'):
-            reply = QMessageBox.question(
-                self, 'Exit Game',
-                'The current game is not saved. Do you want to save before exiting?',
-                QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
-                QMessageBox.Save
-            )
+            reply = self._get_exit_confirm().exec_()
             
             if reply == QMessageBox.Save:
                 self.on_save_game()
@@ -826,70 +890,6 @@ class MainWindow(QMainWindow):
 
 # Implementação dos diálogos mencionados
 
-class AboutDialog(QDialog):
-    """Diálogo 'Sobre' com informações sobre o jogo."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("About Project CIVILIZATION")
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """Configura a interface do diálogo."""
-        from PyQt5.QtWidgets import QVBoxLayout, QLabel, QPushButton, QHBoxLayout
-        from PyQt5.QtGui import QPixmap, QFont
-        from PyQt5.QtCore import Qt
-        
-        layout = QVBoxLayout()
-        
-        # Título
-        title_label = QLabel("Project CIVILIZATION")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # Versão
-        version_label = QLabel("Version 0.1")
-        version_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(version_label)
-        
-        # Descrição
-        description = (
-            "Project CIVILIZATION is an open-source strategy game inspired by "
-            "the Civilization series. Build an empire to stand the test of time!"
-        )
-        desc_label = QLabel(description)
-        desc_label.setWordWrap(True)
-        desc_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(desc_label)
-        
-        # Créditos
-        credits = (
-            "Created by: Project CIVILIZATION Team\n"
-            "Graphics: OpenGL\n"
-            "UI Framework: PyQt5\n"
-            "License: MIT"
-        )
-        credits_label = QLabel(credits)
-        credits_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(credits_label)
-        
-        # Botão de fechar
-        button_layout = QHBoxLayout()
-        close_button = QPushButton("Close")
-        close_button.clicked.connect(self.accept)
-        button_layout.addStretch()
-        button_layout.addWidget(close_button)
-        button_layout.addStretch()
-        
-        layout.addLayout(button_layout)
-        self.setLayout(layout)
-        self.resize(400, 300)
-
-
 class NewGameDialog(QDialog):
     """Diálogo para configurar um novo jogo."""
     
@@ -901,9 +901,6 @@ class NewGameDialog(QDialog):
     
     def setup_ui(self):
         """Configura a interface do diálogo."""
-        from PyQt5.QtWidgets import (QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
-                                    QComboBox, QGroupBox, QGridLayout, QCheckBox)
-        
         layout = QVBoxLayout()
         
         # Grupo de configurações do mapa
@@ -913,13 +910,13 @@ class NewGameDialog(QDialog):
         # Tipo de mapa
         map_layout.addWidget(QLabel("Map Type:"), 0, 0)
         self.map_type_combo = QComboBox()
-        self.map_type_combo.addItems(["Continents", "Pangaea", "Archipelago", "Inland Sea", "Fractal"])
+        add_options(self.map_type_combo, MAP_TYPES)
         map_layout.addWidget(self.map_type_combo, 0, 1)
         
         # Tamanho do mapa
         map_layout.addWidget(QLabel("Map Size:"), 1, 0)
         self.map_size_combo = QComboBox()
-        self.map_size_combo.addItems(["Duel", "Tiny", "Small", "Standard", "Large", "Huge"])
+        add_options(self.map_size_combo, MAP_SIZES)
         self.map_size_combo.setCurrentText("Standard")
         map_layout.addWidget(self.map_size_combo, 1, 1)
         
@@ -933,21 +930,21 @@ class NewGameDialog(QDialog):
         # Dificuldade
         game_layout.addWidget(QLabel("Difficulty:"), 0, 0)
         self.difficulty_combo = QComboBox()
-        self.difficulty_combo.addItems(["Settler", "Chieftain", "Warlord", "Prince", "King", "Emperor", "Immortal", "Deity"])
+        add_options(self.difficulty_combo, DIFFICULTIES)
         self.difficulty_combo.setCurrentText("Prince")
         game_layout.addWidget(self.difficulty_combo, 0, 1)
         
         # Velocidade do jogo
         game_layout.addWidget(QLabel("Game Speed:"), 1, 0)
         self.speed_combo = QComboBox()
-        self.speed_combo.addItems(["Quick", "Standard", "Epic", "Marathon"])
+        add_options(self.speed_combo, SPEEDS)
         self.speed_combo.setCurrentText("Standard")
         game_layout.addWidget(self.speed_combo, 1, 1)
         
         # Número de civilizações
         game_layout.addWidget(QLabel("Number of Civilizations:"), 2, 0)
         self.num_civs_combo = QComboBox()
-        self.num_civs_combo.addItems([str(i) for i in range(2, 13)])
+        add_options(self.num_civs_combo, NUM_CIVS)
         self.num_civs_combo.setCurrentText("8")
         game_layout.addWidget(self.num_civs_combo, 2, 1)
         
@@ -1006,49 +1003,13 @@ class NewGameDialog(QDialog):
         Returns:
             dict: Configuração do jogo
         """
-        # Mapear nomes de exibição para valores internos
-        map_type_map = {
-            "Continents": "continents",
-            "Pangaea": "pangaea",
-            "Archipelago": "archipelago",
-            "Inland Sea": "inland_sea",
-            "Fractal": "fractal"
-        }
-        
-        map_size_map = {
-            "Duel": "duel",
-            "Tiny": "tiny",
-            "Small": "small",
-            "Standard": "standard",
-            "Large": "large",
-            "Huge": "huge"
-        }
-        
-        difficulty_map = {
-            "Settler": "settler",
-            "Chieftain": "chieftain",
-            "Warlord": "warlord",
-            "Prince": "prince",
-            "King": "king",
-            "Emperor": "emperor",
-            "Immortal": "immortal",
-            "Deity": "deity"
-        }
-        
-        speed_map = {
-            "Quick": "quick",
-            "Standard": "standard",
-            "Epic": "epic",
-            "Marathon": "marathon"
-        }
-        
         # Construir configuração
         config = {
-            "world_type": map_type_map[self.map_type_combo.currentText()],
-            "world_size": map_size_map[self.map_size_combo.currentText()],
-            "difficulty": difficulty_map[self.difficulty_combo.currentText()],
-            "game_speed": speed_map[self.speed_combo.currentText()],
-            "num_civs": int(self.num_civs_combo.currentText()),
+            "world_type": self.map_type_combo.currentData(),
+            "world_size": self.map_size_combo.currentData(),
+            "difficulty": self.difficulty_combo.currentData(),
+            "game_speed": self.speed_combo.currentData(),
+            "num_civs": self.num_civs_combo.currentData(),
             "victory_conditions": {
                 "domination": self.domination_check.isChecked(),
                 "cultural": self.cultural_check.isChecked(),
@@ -1073,9 +1034,6 @@ class SaveGameDialog(QDialog):
     
     def setup_ui(self):
         """Configura a interface do diálogo."""
-        from PyQt5.QtWidgets import (QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
-                                    QLineEdit, QListWidget, QListWidgetItem)
-        
         layout = QVBoxLayout()
         
         # Instruções
@@ -1116,12 +1074,19 @@ class SaveGameDialog(QDialog):
     
     def load_existing_saves(self):
         """Carrega a lista de salvamentos existentes."""
-        saves = self.game_controller.save_manager.list_saves()
+        saves = self.game_controller.save_manager.list_saves_cached()
         for save in saves:
             item = QListWidgetItem(save['name'])
             item.setData(Qt.UserRole, save['filename'])
             self.saves_list.addItem(item)
     
+    def refresh(self):
+        """Relê a lista de salvamentos e limpa o nome (reabertura do diálogo)."""
+        self.save_name = ""
+        self.name_edit.clear()
+        self.saves_list.clear()
+        self.load_existing_saves()
+    
     def on_save_selected(self, item):
         """
         Manipulador para seleção de um salvamento existente.
@@ -1135,7 +1100,6 @@ class SaveGameDialog(QDialog):
         """Manipulador para botão de salvar."""
         self.save_name = self.name_edit.text().strip()
         if not self.save_name:
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Save Game", "Please enter a name for your save.")
             return
         
@@ -1163,10 +1127,6 @@ class LoadGameDialog(QDialog):
     
     def setup_ui(self):
         """Configura a interface do diálogo."""
-        from PyQt5.QtWidgets import (QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
-                                    QListWidget, QListWidgetItem, QSplitter, QTextBrowser)
-        from PyQt5.QtCore import Qt
-        
         layout = QVBoxLayout()
         
         # Instruções
@@ -1175,12 +1135,19 @@ class LoadGameDialog(QDialog):
         # Splitter para lista e detalhes
         splitter = QSplitter(Qt.Horizontal)
         
-        # Lista de salvamentos
-        self.saves_list = QListWidget()
+        # Lista de salvamentos (a view só materializa as linhas visíveis)
+        self.saves_model = SavesModel(self)
+        self.saves_list = QListView()
+        self.saves_list.setUniformItemSizes(True)
+        self.saves_list.setModel(self.saves_model)
         splitter.addWidget(self.saves_list)
         
         # Painel de detalhes
-        self.details_browser = QTextBrowser()
+        # QLabel em texto simples: sem parser de HTML nem detecção automática
+        self.details_browser = QLabel()
+        self.details_browser.setTextFormat(Qt.PlainText)
+        self.details_browser.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.details_browser.setWordWrap(True)
         splitter.addWidget(self.details_browser)
         
         # Definir proporções do splitter
@@ -1192,7 +1159,7 @@ class LoadGameDialog(QDialog):
         self.load_existing_saves()
         
         # Conectar seleção da lista à exibição de detalhes
-        self.saves_list.itemClicked.connect(self.on_save_selected)
+        self.saves_list.clicked.connect(self.on_save_selected)
         
         # Botões
         button_layout = QHBoxLayout()
@@ -1220,43 +1187,38 @@ class LoadGameDialog(QDialog):
     
     def load_existing_saves(self):
         """Carrega a lista de salvamentos existentes."""
-        self.saves_list.clear()
-        saves = self.game_controller.save_manager.list_saves()
+        saves = self.game_controller.save_manager.list_saves_cached()
+        self.saves_model.set_saves(saves)
         
         if not saves:
             self.details_browser.setText("No saved games found.")
-            return
-        
-        for save in saves:
-            item = QListWidgetItem(save['name'])
-            item.setData(Qt.UserRole, save['filename'])
-            # Armazenar todos os detalhes do salvamento
-            item.setData(Qt.UserRole + 1, save)
-            self.saves_list.addItem(item)
     
-    def on_save_selected(self, item):
+    def refresh(self):
+        """Relê a lista de salvamentos e limpa a seleção (reabertura do diálogo)."""
+        self.selected_save = ""
+        self.load_button.setEnabled(False)
+        self.delete_button.setEnabled(False)
+        self.details_browser.clear()
+        self.load_existing_saves()
+    
+    def on_save_selected(self, index):
         """
         Manipulador para seleção de um salvamento.
         
         Args:
-            item: Item selecionado
+            index: Índice (QModelIndex) da linha selecionada
         """
-        self.selected_save = item.data(Qt.UserRole)
-        save_details = item.data(Qt.UserRole + 1)
+        save_details = self.saves_model.save_at(index.row())
+        if save_details['filename'] == self.selected_save:
+            return  # Mesmo salvamento clicado de novo; nada a redesenhar
+        self.selected_save = save_details['filename']
         
         # Habilitar botões
         self.load_button.setEnabled(True)
         self.delete_button.setEnabled(True)
         
         # Exibir detalhes
-        details_html = f"""
-        <h3>{save_details['name']}</h3>
-        <p><b>Date:</b> {save_details['timestamp']}</p>
-        <p><b>Version:</b> {save_details['version']}</p>
-        <p><b>File:</b> {save_details['filename']}</p>
-        """
-        
-        self.details_browser.setHtml(details_html)
+        self.details_browser.setText(SAVE_DETAILS_TPL.format_map(save_details))
     
     def on_load(self):
         """Manipulador para botão de carregar."""
@@ -1268,10 +1230,9 @@ class LoadGameDialog(QDialog):
         if not self.selected_save:
             return
         
-        from PyQt5.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             self, 'Delete Save',
-            f'Are you sure you want to delete "{self.saves_list.currentItem().text()}"?',
+            f'Are you sure you want to delete "{self.saves_list.currentIndex().data()}"?',
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
@@ -1299,6 +1260,90 @@ class LoadGameDialog(QDialog):
         return self.selected_save
 
 
+# Campos do diálogo de opções, por aba: (rótulo, campos da linha).
+# Cada campo é (atributo do widget, chave em settings, classe, parâmetros);
+# 'scale' converte o valor float da configuração na posição inteira do slider.
+_OPTIONS_TABS = (
+    ("Display", (
+        ("Fullscreen:", (("fullscreen_check", 'fullscreen', QCheckBox, {}),)),
+        ("Resolution:", (("width_spin", 'window_width', QSpinBox, {'range': (800, 3840)}),
+                         ("height_spin", 'window_height', QSpinBox, {'range': (600, 2160)}))),
+        ("VSync:", (("vsync_check", 'vsync', QCheckBox, {}),)),
+    )),
+    ("Graphics", (
+        ("Render Quality:", (("quality_combo", 'render_quality', QComboBox, {'items': _QUALITIES}),)),
+        ("Animation Speed:", (("animation_slider", 'animation_speed', QSlider,
+                               {'range': (0, 20), 'scale': 10}),)),
+        ("Show Grid:", (("grid_check", 'show_grid', QCheckBox, {}),)),
+        ("Show Resources:", (("resources_check", 'show_resources', QCheckBox, {}),)),
+        ("Show Improvements:", (("improvements_check", 'show_improvements', QCheckBox, {}),)),
+    )),
+    ("Sound", (
+        ("Enable Sound:", (("sound_check", 'enable_sound', QCheckBox, {}),)),
+        ("Music Volume:", (("music_slider", 'music_volume', QSlider,
+                            {'range': (0, 100), 'scale': 100}),)),
+        ("SFX Volume:", (("sfx_slider", 'sfx_volume', QSlider,
+                          {'range': (0, 100), 'scale': 100}),)),
+    )),
+    ("Interface", (
+        ("UI Scale:", (("ui_scale_spin", 'ui_scale', QDoubleSpinBox,
+                        {'range': (0.5, 2.0), 'step': 0.1}),)),
+        ("Font Size:", (("font_size_spin", 'font_size', QSpinBox, {'range': (8, 24)}),)),
+        ("Show Tooltips:", (("tooltips_check", 'show_tooltips', QCheckBox, {}),)),
+    )),
+)
+
+# Todos os campos em sequência, para ler/gravar valores sem percorrer as abas
+_OPTIONS_FIELDS = tuple(field
+                        for _, rows in _OPTIONS_TABS
+                        for _, fields in rows
+                        for field in fields)
+
+
+def _create_option_widget(widget_class, params):
+    """
+    Cria o controle de um campo do diálogo de opções.
+    
+    Args:
+        widget_class: Classe do controle (QCheckBox, QSpinBox, ...)
+        params: Parâmetros do campo ('range', 'step', 'items')
+        
+    Returns:
+        QWidget: Controle configurado
+    """
+    widget = QSlider(Qt.Horizontal) if widget_class is QSlider else widget_class()
+    if 'range' in params:
+        widget.setRange(*params['range'])
+    if 'step' in params:
+        widget.setSingleStep(params['step'])
+    if 'items' in params:
+        widget.addItems(params['items'])
+    return widget
+
+
+def _set_option_value(widget, value, params):
+    """Mostra um valor de configuração no controle correspondente."""
+    if isinstance(widget, QCheckBox):
+        widget.setChecked(value)
+    elif isinstance(widget, QComboBox):
+        widget.setCurrentText(value)
+    elif 'scale' in params:
+        widget.setValue(int(value * params['scale']))
+    else:
+        widget.setValue(value)
+
+
+def _option_value(widget, params):
+    """Lê o valor de configuração de um controle."""
+    if isinstance(widget, QCheckBox):
+        return widget.isChecked()
+    if isinstance(widget, QComboBox):
+        return widget.currentText()
+    if 'scale' in params:
+        return widget.value() / float(params['scale'])
+    return widget.value()
+
+
 class OptionsDialog(QDialog):
     """Diálogo de opções do jogo."""
     
@@ -1306,13 +1351,11 @@ class OptionsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Options")
         self.settings = {}
-        self.load_current_settings()
         self.setup_ui()
+        self.refresh()
     
     def load_current_settings(self):
         """Carrega as configurações atuais."""
-        import config
-        
         # Configurações de exibição
         self.settings['fullscreen'] = config.FULLSCREEN
         self.settings['window_width'] = config.WINDOW_WIDTH
@@ -1347,148 +1390,44 @@ class OptionsDialog(QDialog):
         self.settings['show_resources'] = True  # Valor padrão
         self.settings['show_improvements'] = True  # Valor padrão
     
+    def refresh(self):
+        """
+        Relê as configurações atuais e as mostra nos widgets já existentes.
+        
+        Permite reaproveitar o diálogo entre aberturas sem reconstruir as abas.
+        """
+        self.load_current_settings()
+        settings = self.settings
+        for attr, key, _, params in _OPTIONS_FIELDS:
+            _set_option_value(getattr(self, attr), settings[key], params)
+    
     def setup_ui(self):
         """Configura a interface do diálogo."""
-        from PyQt5.QtWidgets import (QVBoxLayout, QLabel, QPushButton, QHBoxLayout,
-                                    QTabWidget, QWidget, QGridLayout, QCheckBox,
-                                    QComboBox, QSlider, QSpinBox, QDoubleSpinBox)
-        from PyQt5.QtCore import Qt
-        
         layout = QVBoxLayout()
         
-        # Criar abas
+        # Criar abas a partir da tabela de campos
         tab_widget = QTabWidget()
-        
-        # Aba de exibição
-        display_tab = QWidget()
-        display_layout = QGridLayout()
-        
-        # Modo de tela cheia
-        display_layout.addWidget(QLabel("Fullscreen:"), 0, 0)
-        self.fullscreen_check = QCheckBox()
-        self.fullscreen_check.setChecked(self.settings['fullscreen'])
-        display_layout.addWidget(self.fullscreen_check, 0, 1)
-        
-        # Resolução
-        display_layout.addWidget(QLabel("Resolution:"), 1, 0)
-        resolution_layout = QHBoxLayout()
-        
-        self.width_spin = QSpinBox()
-        self.width_spin.setRange(800, 3840)
-        self.width_spin.setValue(self.settings['window_width'])
-        resolution_layout.addWidget(self.width_spin)
-        
-        resolution_layout.addWidget(QLabel("x"))
-        
-        self.height_spin = QSpinBox()
-        self.height_spin.setRange(600, 2160)
-        self.height_spin.setValue(self.settings['window_height'])
-        resolution_layout.addWidget(self.height_spin)
-        
-        display_layout.addLayout(resolution_layout, 1, 1)
-        
-        # VSync
-        display_layout.addWidget(QLabel("VSync:"), 2, 0)
-        self.vsync_check = QCheckBox()
-        self.vsync_check.setChecked(self.settings['vsync'])
-        display_layout.addWidget(self.vsync_check, 2, 1)
-        
-        display_tab.setLayout(display_layout)
-        tab_widget.addTab(display_tab, "Display")
-        
-        # Aba de gráficos
-        graphics_tab = QWidget()
-        graphics_layout = QGridLayout()
-        
-        # Qualidade de renderização
-        graphics_layout.addWidget(QLabel("Render Quality:"), 0, 0)
-        self.quality_combo = QComboBox()
-        self.quality_combo.addItems(["Low", "Medium", "High"])
-        self.quality_combo.setCurrentText(self.settings['render_quality'])
-        graphics_layout.addWidget(self.quality_combo, 0, 1)
-        
-        # Velocidade de animação
-        graphics_layout.addWidget(QLabel("Animation Speed:"), 1, 0)
-        self.animation_slider = QSlider(Qt.Horizontal)
-        self.animation_slider.setRange(0, 20)
-        self.animation_slider.setValue(int(self.settings['animation_speed'] * 10))
-        graphics_layout.addWidget(self.animation_slider, 1, 1)
-        
-        # Mostrar grade
-        graphics_layout.addWidget(QLabel("Show Grid:"), 2, 0)
-        self.grid_check = QCheckBox()
-        self.grid_check.setChecked(self.settings['show_grid'])
-        graphics_layout.addWidget(self.grid_check, 2, 1)
-        
-        # Mostrar recursos
-        graphics_layout.addWidget(QLabel("Show Resources:"), 3, 0)
-        self.resources_check = QCheckBox()
-        self.resources_check.setChecked(self.settings['show_resources'])
-        graphics_layout.addWidget(self.resources_check, 3, 1)
-        
-        # Mostrar melhorias
-        graphics_layout.addWidget(QLabel("Show Improvements:"), 4, 0)
-        self.improvements_check = QCheckBox()
-        self.improvements_check.setChecked(self.settings['show_improvements'])
-        graphics_layout.addWidget(self.improvements_check, 4, 1)
-        
-        graphics_tab.setLayout(graphics_layout)
-        tab_widget.addTab(graphics_tab, "Graphics")
-        
-        # Aba de som
-        sound_tab = QWidget()
-        sound_layout = QGridLayout()
-        
-        # Habilitar som
-        sound_layout.addWidget(QLabel("Enable Sound:"), 0, 0)
-        self.sound_check = QCheckBox()
-        self.sound_check.setChecked(self.settings['enable_sound'])
-        sound_layout.addWidget(self.sound_check, 0, 1)
-        
-        # Volume de música
-        sound_layout.addWidget(QLabel("Music Volume:"), 1, 0)
-        self.music_slider = QSlider(Qt.Horizontal)
-        self.music_slider.setRange(0, 100)
-        self.music_slider.setValue(int(self.settings['music_volume'] * 100))
-        sound_layout.addWidget(self.music_slider, 1, 1)
-        
-        # Volume de efeitos sonoros
-        sound_layout.addWidget(QLabel("SFX Volume:"), 2, 0)
-        self.sfx_slider = QSlider(Qt.Horizontal)
-        self.sfx_slider.setRange(0, 100)
-        self.sfx_slider.setValue(int(self.settings['sfx_volume'] * 100))
-        sound_layout.addWidget(self.sfx_slider, 2, 1)
-        
-        sound_tab.setLayout(sound_layout)
-        tab_widget.addTab(sound_tab, "Sound")
-        
-        # Aba de interface
-        ui_tab = QWidget()
-        ui_layout = QGridLayout()
-        
-        # Escala da UI
-        ui_layout.addWidget(QLabel("UI Scale:"), 0, 0)
-        self.ui_scale_spin = QDoubleSpinBox()
-        self.ui_scale_spin.setRange(0.5, 2.0)
-        self.ui_scale_spin.setSingleStep(0.1)
-        self.ui_scale_spin.setValue(self.settings['ui_scale'])
-        ui_layout.addWidget(self.ui_scale_spin, 0, 1)
-        
-        # Tamanho da fonte
-        ui_layout.addWidget(QLabel("Font Size:"), 1, 0)
-        self.font_size_spin = QSpinBox()
-        self.font_size_spin.setRange(8, 24)
-        self.font_size_spin.setValue(self.settings['font_size'])
-        ui_layout.addWidget(self.font_size_spin, 1, 1)
-        
-        # Mostrar tooltips
-        ui_layout.addWidget(QLabel("Show Tooltips:"), 2, 0)
-        self.tooltips_check = QCheckBox()
-        self.tooltips_check.setChecked(self.settings['show_tooltips'])
-        ui_layout.addWidget(self.tooltips_check, 2, 1)
-        
-        ui_tab.setLayout(ui_layout)
-        tab_widget.addTab(ui_tab, "Interface")
+        for tab_name, rows in _OPTIONS_TABS:
+            tab = QWidget()
+            grid = QGridLayout(tab)
+            for row, (label, fields) in enumerate(rows):
+                grid.addWidget(QLabel(label), row, 0)
+                if len(fields) == 1:
+                    attr, _, widget_class, params = fields[0]
+                    widget = _create_option_widget(widget_class, params)
+                    setattr(self, attr, widget)
+                    grid.addWidget(widget, row, 1)
+                    continue
+                # Vários controles na mesma linha (ex.: largura x altura)
+                row_layout = QHBoxLayout()
+                for i, (attr, _, widget_class, params) in enumerate(fields):
+                    if i:
+                        row_layout.addWidget(QLabel("x"))
+                    widget = _create_option_widget(widget_class, params)
+                    setattr(self, attr, widget)
+                    row_layout.addWidget(widget)
+                grid.addLayout(row_layout, row, 1)
+            tab_widget.addTab(tab, tab_name)
         
         layout.addWidget(tab_widget)
         
@@ -1533,55 +1472,13 @@ class OptionsDialog(QDialog):
     def on_reset(self):
         """Manipulador para botão de redefinir."""
         # Recarregar configurações padrão
-        import config
-        
-        # Configurações de exibição
-        self.fullscreen_check.setChecked(config.FULLSCREEN)
-        self.width_spin.setValue(config.WINDOW_WIDTH)
-        self.height_spin.setValue(config.WINDOW_HEIGHT)
-        self.vsync_check.setChecked(config.VSYNC)
-        
-        # Configurações gráficas
-        self.quality_combo.setCurrentText(config.RENDER_QUALITY)
-        self.animation_slider.setValue(int(config.ANIMATION_SPEED * 10))
-        self.grid_check.setChecked(True)
-        self.resources_check.setChecked(True)
-        self.improvements_check.setChecked(True)
-        
-        # Configurações de som
-        self.sound_check.setChecked(config.ENABLE_SOUND)
-        self.music_slider.setValue(int(config.MUSIC_VOLUME * 100))
-        self.sfx_slider.setValue(int(config.SFX_VOLUME * 100))
-        
-        # Configurações de interface
-        self.ui_scale_spin.setValue(config.UI_SCALE)
-        self.font_size_spin.setValue(config.FONT_SIZE)
-        self.tooltips_check.setChecked(config.SHOW_TOOLTIPS)
+        self.refresh()
     
     def update_settings(self):
         """Atualiza as configurações com base nos valores da interface."""
-        # Configurações de exibição
-        self.settings['fullscreen'] = self.fullscreen_check.isChecked()
-        self.settings['window_width'] = self.width_spin.value()
-        self.settings['window_height'] = self.height_spin.value()
-        self.settings['vsync'] = self.vsync_check.isChecked()
-        
-        # Configurações gráficas
-        self.settings['render_quality'] = self.quality_combo.currentText()
-        self.settings['animation_speed'] = self.animation_slider.value() / 10.0
-        self.settings['show_grid'] = self.grid_check.isChecked()
-        self.settings['show_resources'] = self.resources_check.isChecked()
-        self.settings['show_improvements'] = self.improvements_check.isChecked()
-        
-        # Configurações de som
-        self.settings['enable_sound'] = self.sound_check.isChecked()
-        self.settings['music_volume'] = self.music_slider.value() / 100.0
-        self.settings['sfx_volume'] = self.sfx_slider.value() / 100.0
-        
-        # Configurações de interface
-        self.settings['ui_scale'] = self.ui_scale_spin.value()
-        self.settings['font_size'] = self.font_size_spin.value()
-        self.settings['show_tooltips'] = self.tooltips_check.isChecked()
+        settings = self.settings
+        for attr, key, _, params in _OPTIONS_FIELDS:
+            settings[key] = _option_value(getattr(self, attr), params)
     
     def get_settings(self):
         """
@@ -16,16 +16,9 @@ from game.gui.info_panel import InfoPanel
 from game.gui.minimap_panel import MinimapPanel
 from game.gui.unit_panel import UnitPanel
 from game.gui.city_panel import CityPanel
-from game.gui.tech_dialog import TechDialog
-from game.gui.diplomacy_dialog import DiplomacyDialog
-from game.gui.options_dialog import OptionsDialog
-from game.gui.about_dialog import AboutDialog
-from game.gui.new_game_dialog import NewGameDialog
-from game.gui.save_game_dialog import SaveGameDialog
-from game.gui.load_game_dialog import LoadGameDialog
 
 # Usar as versões melhoradas dos gerenciadores
-from game.gui.gui_factory import GUIFactory
+from game.gui.gui_factory import GUIFactory, load_dialog_class, get_cached_dialog
 from game.gui.menu_manager import MenuManager
 from game.gui.dock_manager import DockManager
 
@@ -60,6 +53,8 @@ class MainWindow(QMainWindow):
         # Estado da janela
         self.is_fullscreen = config.FULLSCREEN
         self.normal_geometry = None
+        self._about_dialog = None  # Criado na primeira abertura e reaproveitado
+        self._dialog_cache = {}  # Diálogos reaproveitados, por classe (ver get_cached_dialog)
         
         # Configurar componentes da GUI
         self.setup_central_widget()
@@ -96,14 +91,18 @@ class MainWindow(QMainWindow):
     
     def connect_signals(self):
         """Conecta sinais entre componentes."""
-        # Conectar sinais do controlador do jogo
-        self.game_controller.turn_changed.connect(self.on_turn_changed)
-        self.game_controller.turn_ended.connect(self.on_turn_ended)
-        self.game_controller.active_city_changed.connect(self.on_active_city_changed)
-        self.game_controller.map_updated.connect(self.on_map_updated)
-        self.game_controller.game_started.connect(self.on_game_started)
-        self.game_controller.game_loaded.connect(self.on_game_loaded)
-        self.game_controller.game_saved.connect(self.on_game_saved)
+        # Conectar sinais do controlador do jogo. Eles são sempre emitidos na
+        # thread da GUI (os workers só enfileiram eventos), então a conexão
+        # direta é segura e dispensa a resolução do tipo a cada emissão
+        gc = self.game_controller
+        direct = Qt.DirectConnection
+        gc.turn_changed.connect(self.on_turn_changed, direct)
+        gc.turn_ended.connect(self.on_turn_ended, direct)
+        gc.active_city_changed.connect(self.on_active_city_changed, direct)
+        gc.map_updated.connect(self.on_map_updated, direct)
+        gc.game_started.connect(self.on_game_started, direct)
+        gc.game_loaded.connect(self.on_game_loaded, direct)
+        gc.game_saved.connect(self.on_game_saved, direct)
         
         # Conectar sinais do mapa
         self.map_widget.tile_clicked.connect(self.on_tile_clicked)
@@ -198,7 +197,10 @@ class MainWindow(QMainWindow):
     # Manipuladores de ações do menu
     def on_new_game(self):
         """Manipulador para ação de novo jogo."""
-        dialog = NewGameDialog(self.game_controller, self)
+        NewGameDialog = load_dialog_class('game.gui.new_game_dialog', 'NewGameDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, NewGameDialog, self.game_controller)
+        if dialog.isVisible():
+            return
         if dialog.exec_() == QDialog.Accepted:
             # Iniciar novo jogo com as configurações selecionadas
             config = dialog.get_game_config()
@@ -207,7 +209,8 @@ class MainWindow(QMainWindow):
     
     def on_load_game(self):
         """Manipulador para ação de carregar jogo."""
-        dialog = LoadGameDialog(self.game_controller, self)
+        LoadGameDialog = load_dialog_class('game.gui.load_game_dialog', 'LoadGameDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, LoadGameDialog, self.game_controller)
         if dialog.exec_() == QDialog.Accepted:
             # Carregar o jogo selecionado
             save_name = dialog.get_selected_save()
@@ -244,7 +247,8 @@ class MainWindow(QMainWindow):
             )
             return
         
-        dialog = SaveGameDialog(self.game_controller, self)
+        SaveGameDialog = load_dialog_class('game.gui.save_game_dialog', 'SaveGameDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, SaveGameDialog, self.game_controller)
         if dialog.exec_() == QDialog.Accepted:
             # Salvar o jogo com o nome especificado
             save_name = dialog.get_save_name()
@@ -256,7 +260,8 @@ class MainWindow(QMainWindow):
     
     def on_options(self):
         """Manipulador para ação de opções."""
-        dialog = OptionsDialog(self)
+        OptionsDialog = load_dialog_class('game.gui.options_dialog', 'OptionsDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, OptionsDialog)
         if dialog.exec_() == QDialog.Accepted:
             # Aplicar novas configurações
             self.apply_settings(dialog.get_settings())
@@ -339,12 +344,14 @@ class MainWindow(QMainWindow):
     
     def on_tech_tree(self):
         """Manipulador para ação de árvore tecnológica."""
-        dialog = TechDialog(self.game_controller, self)
+        TechDialog = load_dialog_class('game.gui.tech_dialog', 'TechDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, TechDialog, self.game_controller)
         dialog.exec_()
     
     def on_diplomacy(self):
         """Manipulador para ação de diplomacia."""
-        dialog = DiplomacyDialog(self.game_controller, self)
+        DiplomacyDialog = load_dialog_class('game.gui.diplomacy_dialog', 'DiplomacyDialog')
+        dialog = get_cached_dialog(self._dialog_cache, self, DiplomacyDialog, self.game_controller)
         dialog.exec_()
     
     def on_economy(self):
@@ -369,8 +376,10 @@ class MainWindow(QMainWindow):
     
     def on_about(self):
         """Manipulador para ação de sobre."""
-        dialog = AboutDialog(self)
-        dialog.exec_()
+        if self._about_dialog is None:
+            AboutDialog = load_dialog_class('game.gui.about_dialog', 'AboutDialog')
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec_()
     
     def apply_settings(self, settings: Dict[str, Any]):
         """
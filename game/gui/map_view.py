@@ -406,7 +406,7 @@ class MapGLWidget(QOpenGLWidget):
     
     def render_units(self, world):
         """Render units on the map."""
-        units = self.game_controller.get_all_units()
+        units = self.game_controller.iter_all_units()
         for unit in units:
             x, y = unit.x, unit.y
             
@@ -554,7 +554,7 @@ class MapGLWidget(QOpenGLWidget):
     
     def render_cities(self, world):
         """Render cities on the map."""
-        cities = self.game_controller.get_all_cities()
+        cities = self.game_controller.iter_all_cities()
         for city in cities:
             x, y = city.position
 
@@ -683,8 +683,23 @@ class MapGLWidget(QOpenGLWidget):
 
     def toggle_grid(self):
         """Toggle grid visibility."""
-        self.show_grid = not self.show_grid
+        self.set_layer_visible('grid', not self.show_grid)
+
+    def set_layer_visible(self, layer, visible):
+        """Show or hide a map layer ('grid', 'resources', 'improvements', 'units').
+
+        The GL frame is always redrawn whole, so the only saving available is
+        skipping the repaint when the visibility does not actually change.
+
+        Returns:
+            bool: True if the layer visibility changed.
+        """
+        attr = 'show_' + layer
+        if getattr(self, attr) == visible:
+            return False
+        setattr(self, attr, visible)
         self.update()
+        return True
 
     def mousePressEvent(self, event):
         """Handle mouse press events."""
@@ -2,7 +2,7 @@ from PyQt5.QtWidgets import QMenuBar, QAction, QMenu, QActionGroup, QToolBar
 from PyQt5.QtCore import Qt
 from typing import Dict, Any, Optional, List, Callable, Union
 
-from game.gui.gui_factory import GUIFactory
+from game.gui.gui_factory import create_action
 
 class MenuManager:
     """
@@ -39,39 +39,39 @@ class MenuManager:
     def _setup_game_menu(self):
         """Configura o menu Jogo."""
         # Criar ações
-        self.actions['new_game'] = GUIFactory.create_action(
+        self.actions['new_game'] = create_action(
             self.main_window, "New Game", 
             self.main_window.on_new_game, "Ctrl+N",
             tip="Start a new game"
         )
         
-        self.actions['load_game'] = GUIFactory.create_action(
+        self.actions['load_game'] = create_action(
             self.main_window, "Load Game", 
             self.main_window.on_load_game, "Ctrl+L",
             tip="Load a saved game"
         )
         
-        self.actions['save_game'] = GUIFactory.create_action(
+        self.actions['save_game'] = create_action(
             self.main_window, "Save Game", 
             self.main_window.on_save_game, "Ctrl+S",
             tip="Save the current game",
             enabled=False  # Desabilitado inicialmente
         )
         
-        self.actions['save_game_as'] = GUIFactory.create_action(
+        self.actions['save_game_as'] = create_action(
             self.main_window, "Save Game As...", 
             self.main_window.on_save_game_as, "Ctrl+Shift+S",
             tip="Save the current game with a new name",
             enabled=False  # Desabilitado inicialmente
         )
         
-        self.actions['options'] = GUIFactory.create_action(
+        self.actions['options'] = create_action(
             self.main_window, "Options", 
             self.main_window.on_options,
             tip="Configure game options"
         )
         
-        self.actions['exit'] = GUIFactory.create_action(
+        self.actions['exit'] = create_action(
             self.main_window, "Exit", 
             self.main_window.close, "Alt+F4",
             tip="Exit the game"
@@ -101,7 +101,7 @@ class MenuManager:
         self.menus['panels'] = panels_menu
 
         # Criar ações para painéis
-        self.actions['toggle_minimap'] = GUIFactory.create_action(
+        self.actions['toggle_minimap'] = create_action(
             self.main_window, "Minimap",
             self.main_window.on_toggle_minimap, "M",
             tip="Show or hide the minimap",
@@ -109,7 +109,7 @@ class MenuManager:
         )
         panels_menu.addAction(self.actions['toggle_minimap'])
         
-        self.actions['toggle_info'] = GUIFactory.create_action(
+        self.actions['toggle_info'] = create_action(
             self.main_window, "Info Panel",
             lambda: self.main_window.on_toggle_panel('info'), "I",
             tip="Show or hide the information panel",
@@ -117,7 +117,7 @@ class MenuManager:
         )
         panels_menu.addAction(self.actions['toggle_info'])
         
-        self.actions['toggle_unit'] = GUIFactory.create_action(
+        self.actions['toggle_unit'] = create_action(
             self.main_window, "Unit Panel",
             lambda: self.main_window.on_toggle_panel('unit'), "U",
             tip="Show or hide the unit panel",
@@ -125,7 +125,7 @@ class MenuManager:
         )
         panels_menu.addAction(self.actions['toggle_unit'])
         
-        self.actions['toggle_city'] = GUIFactory.create_action(
+        self.actions['toggle_city'] = create_action(
             self.main_window, "City Panel",
             lambda: self.main_window.on_toggle_panel('city'), "C",
             tip="Show or hide the city panel",
@@ -135,7 +135,7 @@ class MenuManager:
         
         # Restaurar layout
         panels_menu.addSeparator()
-        self.actions['restore_layout'] = GUIFactory.create_action(
+        self.actions['restore_layout'] = create_action(
             self.main_window, "Restore Default Layout",
             self.main_window.on_restore_layout,
             tip="Restore the default panel layout"
@@ -148,7 +148,7 @@ class MenuManager:
         self.menus['map_view'] = map_menu
     
         # Ações para visualização do mapa
-        self.actions['toggle_grid'] = GUIFactory.create_action(
+        self.actions['toggle_grid'] = create_action(
             self.main_window, "Grid",
             self.main_window.on_toggle_grid, "G",
             tip="Show or hide the grid",
@@ -156,7 +156,7 @@ class MenuManager:
         )
         map_menu.addAction(self.actions['toggle_grid'])
         
-        self.actions['toggle_resources'] = GUIFactory.create_action(
+        self.actions['toggle_resources'] = create_action(
             self.main_window, "Resources",
             self.main_window.on_toggle_resources, "R",
             tip="Show or hide resources",
@@ -164,7 +164,7 @@ class MenuManager:
         )
         map_menu.addAction(self.actions['toggle_resources'])
 
-        self.actions['toggle_improvements'] = GUIFactory.create_action(
+        self.actions['toggle_improvements'] = create_action(
             self.main_window, "Improvements",
             self.main_window.on_toggle_improvements, "Shift+I",
             tip="Show or hide improvements",
@@ -172,7 +172,7 @@ class MenuManager:
         )
         map_menu.addAction(self.actions['toggle_improvements'])
         
-        self.actions['toggle_units'] = GUIFactory.create_action(
+        self.actions['toggle_units'] = create_action(
             self.main_window, "Units",
             self.main_window.on_toggle_units, "Shift+U",
             tip="Show or hide units on the map",
@@ -192,7 +192,7 @@ class MenuManager:
 
         # Opções de qualidade
         for quality in ["Low", "Medium", "High"]:
-            action = GUIFactory.create_action(
+            action = create_action(
                 self.main_window, quality,
                 lambda q=quality: self.main_window.on_set_render_quality(q),
                 tip=f"Set render quality to {quality}",
@@ -205,7 +205,7 @@ class MenuManager:
 
         # Fullscreen
         view_menu.addSeparator()
-        self.actions['fullscreen'] = GUIFactory.create_action(
+        self.actions['fullscreen'] = create_action(
             self.main_window, "Fullscreen",
             self.main_window.on_toggle_fullscreen, "F11",
             tip="Toggle fullscreen mode",
@@ -216,35 +216,35 @@ class MenuManager:
     def _setup_civilization_menu(self):
         """Configura o menu Civilização."""
         # Criar ações
-        self.actions['tech_tree'] = GUIFactory.create_action(
+        self.actions['tech_tree'] = create_action(
             self.main_window, "Technology Tree",
             self.main_window.on_tech_tree, "T",
             tip="View the technology tree",
             enabled=False  # Desabilitado inicialmente
         )
 
-        self.actions['diplomacy'] = GUIFactory.create_action(
+        self.actions['diplomacy'] = create_action(
             self.main_window, "Diplomacy",
             self.main_window.on_diplomacy, "D",
             tip="Manage diplomatic relations",
             enabled=False  # Desabilitado inicialmente
         )
 
-        self.actions['economy'] = GUIFactory.create_action(
+        self.actions['economy'] = create_action(
             self.main_window, "Economy",
             self.main_window.on_economy, "E",
             tip="View economic information",
             enabled=False  # Desabilitado inicialmente
         )
 
-        self.actions['military'] = GUIFactory.create_action(
+        self.actions['military'] = create_action(
             self.main_window, "Military",
             self.main_window.on_military, "Shift+M",
             tip="View military information",
             enabled=False  # Desabilitado inicialmente
         )
 
-        self.actions['end_turn'] = GUIFactory.create_action(
+        self.actions['end_turn'] = create_action(
             self.main_window, "End Turn",
             self.main_window.on_end_turn, "Enter",
             tip="End the current turn",
@@ -265,13 +265,13 @@ class MenuManager:
     def _setup_help_menu(self):
         """Configura o menu Ajuda."""
         # Criar ações
-        self.actions['manual'] = GUIFactory.create_action(
+        self.actions['manual'] = create_action(
             self.main_window, "Game Manual",
             self.main_window.on_manual, "F1",
             tip="View the game manual"
         )
 
-        self.actions['about'] = GUIFactory.create_action(
+        self.actions['about'] = create_action(
             self.main_window, "About",
             self.main_window.on_about,
             tip="About Project CIVILIZATION"
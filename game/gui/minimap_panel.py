@@ -69,7 +69,7 @@ class MinimapPanel(QWidget):
                     )
         
         # Draw cities
-        cities = self.game_controller.get_all_cities()
+        cities = self.game_controller.iter_all_cities()
         for city in cities:
             x, y = city.position
             
@@ -88,7 +88,7 @@ class MinimapPanel(QWidget):
             )
         
         # Draw units (simplified as dots)
-        units = self.game_controller.get_all_units()
+        units = self.game_controller.iter_all_units()
         for unit in units:
             x, y = unit.x, unit.y
             
@@ -2,6 +2,9 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLay
                            QComboBox, QGroupBox, QGridLayout, QCheckBox)
 from PyQt5.QtCore import Qt
 
+from game.gui.dialog_options import (MAP_TYPES, MAP_SIZES, DIFFICULTIES, SPEEDS,
+                                     NUM_CIVS, add_options)
+
 class NewGameDialog(QDialog):
     """Diálogo para configurar um novo jogo."""
     
@@ -22,13 +25,13 @@ class NewGameDialog(QDialog):
         # Tipo de mapa
         map_layout.addWidget(QLabel("Map Type:"), 0, 0)
         self.map_type_combo = QComboBox()
-        self.map_type_combo.addItems(["Continents", "Pangaea", "Archipelago", "Inland Sea", "Fractal"])
+        add_options(self.map_type_combo, MAP_TYPES)
         map_layout.addWidget(self.map_type_combo, 0, 1)
         
         # Tamanho do mapa
         map_layout.addWidget(QLabel("Map Size:"), 1, 0)
         self.map_size_combo = QComboBox()
-        self.map_size_combo.addItems(["Duel", "Tiny", "Small", "Standard", "Large", "Huge"])
+        add_options(self.map_size_combo, MAP_SIZES)
         self.map_size_combo.setCurrentText("Standard")
         map_layout.addWidget(self.map_size_combo, 1, 1)
         
@@ -42,21 +45,21 @@ class NewGameDialog(QDialog):
         # Dificuldade
         game_layout.addWidget(QLabel("Difficulty:"), 0, 0)
         self.difficulty_combo = QComboBox()
-        self.difficulty_combo.addItems(["Settler", "Chieftain", "Warlord", "Prince", "King", "Emperor", "Immortal", "Deity"])
+        add_options(self.difficulty_combo, DIFFICULTIES)
         self.difficulty_combo.setCurrentText("Prince")
         game_layout.addWidget(self.difficulty_combo, 0, 1)
         
         # Velocidade do jogo
         game_layout.addWidget(QLabel("Game Speed:"), 1, 0)
         self.speed_combo = QComboBox()
-        self.speed_combo.addItems(["Quick", "Standard", "Epic", "Marathon"])
+        add_options(self.speed_combo, SPEEDS)
         self.speed_combo.setCurrentText("Standard")
         game_layout.addWidget(self.speed_combo, 1, 1)
         
         # Número de civilizações
         game_layout.addWidget(QLabel("Number of Civilizations:"), 2, 0)
         self.num_civs_combo = QComboBox()
-        self.num_civs_combo.addItems([str(i) for i in range(2, 13)])
+        add_options(self.num_civs_combo, NUM_CIVS)
         self.num_civs_combo.setCurrentText("8")
         game_layout.addWidget(self.num_civs_combo, 2, 1)
         
@@ -115,49 +118,13 @@ class NewGameDialog(QDialog):
         Returns:
             dict: Configuração do jogo
         """
-        # Mapear nomes de exibição para valores internos
-        map_type_map = {
-            "Continents": "continents",
-            "Pangaea": "pangaea",
-            "Archipelago": "archipelago",
-            "Inland Sea": "inland_sea",
-            "Fractal": "fractal"
-        }
-        
-        map_size_map = {
-            "Duel": "duel",
-            "Tiny": "tiny",
-            "Small": "small",
-            "Standard": "standard",
-            "Large": "large",
-            "Huge": "huge"
-        }
-        
-        difficulty_map = {
-            "Settler": "settler",
-            "Chieftain": "chieftain",
-            "Warlord": "warlord",
-            "Prince": "prince",
-            "King": "king",
-            "Emperor": "emperor",
-            "Immortal": "immortal",
-            "Deity": "deity"
-        }
-        
-        speed_map = {
-            "Quick": "quick",
-            "Standard": "standard",
-            "Epic": "epic",
-            "Marathon": "marathon"
-        }
-        
         # Construir configuração
         config = {
-            "world_type": map_type_map[self.map_type_combo.currentText()],
-            "world_size": map_size_map[self.map_size_combo.currentText()],
-            "difficulty": difficulty_map[self.difficulty_combo.currentText()],
-            "game_speed": speed_map[self.speed_combo.currentText()],
-            "num_civs": int(self.num_civs_combo.currentText()),
+            "world_type": self.map_type_combo.currentData(),
+            "world_size": self.map_size_combo.currentData(),
+            "difficulty": self.difficulty_combo.currentData(),
+            "game_speed": self.speed_combo.currentData(),
+            "num_civs": self.num_civs_combo.currentData(),
             "victory_conditions": {
                 "domination": self.domination_check.isChecked(),
                 "cultural": self.cultural_check.isChecked(),
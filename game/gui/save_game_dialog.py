@@ -54,12 +54,19 @@ class SaveGameDialog(QDialog):
     
     def load_existing_saves(self):
         """Carrega a lista de salvamentos existentes."""
-        saves = self.game_controller.save_manager.list_saves()
+        saves = self.game_controller.save_manager.list_saves_cached()
         for save in saves:
             item = QListWidgetItem(save['name'])
             item.setData(Qt.UserRole, save['filename'])
             self.saves_list.addItem(item)
     
+    def refresh(self):
+        """Relê a lista de salvamentos e limpa o nome (reabertura do diálogo)."""
+        self.save_name = ""
+        self.name_edit.clear()
+        self.saves_list.clear()
+        self.load_existing_saves()
+    
     def on_save_selected(self, item):
         """
         Manipulador para seleção de um salvamento existente.
@@ -10,6 +10,10 @@ class BaseModel:
     """
     required_fields: list[str] = []  # Pode ser sobrescrito nas subclasses
 
+    # Subclasses sem __slots__ continuam tendo __dict__; as que declaram
+    # __slots__ (Tile, Unit) ficam sem dicionário por instância
+    __slots__ = ('id', 'logger')
+
     def __init__(self):
         self.id = str(uuid.uuid4())
         self.logger = get_game_logger(self.__class__.__name__)
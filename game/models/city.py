@@ -11,6 +11,8 @@ class City(BaseModel):
     e produz recursos, unidades e edifícios.
     """
     
+    is_unit = False  # Marcador de tipo (ver Unit.is_unit)
+    
     def __init__(self, x, y, name):
         """
         Inicializa uma nova cidade.
@@ -46,6 +48,10 @@ class City(BaseModel):
         self.founded_turn = 0
         self.last_growth_turn = 0
         
+        # Ciência por turno; espelhada no array da civilização (ver
+        # update_science_output), atualizada só quando muda
+        self.science_output = self.calculate_income()['science']
+        
         self.logger = logging.getLogger(f"{self.__class__.__name__}:{name}")
     
     def calculate_income(self):
@@ -77,6 +83,20 @@ class City(BaseModel):
         
         return income
     
+    def update_science_output(self):
+        """
+        Recalcula a ciência da cidade e, se mudou, atualiza o array da civilização.
+        
+        Deve ser chamado sempre que algo que afeta a ciência mudar (população,
+        edifícios), para que a soma por civilização não precise varrer as cidades.
+        """
+        science = self.calculate_income()['science']
+        if science == self.science_output:
+            return
+        self.science_output = science
+        if self.owner is not None:
+            self.owner.set_city_science(self, science)
+    
     def process_turn(self):
         """
         Processa o turno da cidade.
@@ -101,6 +121,7 @@ class City(BaseModel):
             self.population += 1
             self.food_needed = 10 + (self.population * 5)  # Aumenta comida necessária
             actions['population_growth'] = True
+            self.update_science_output()
             self.logger.info(f"População cresceu para {self.population}")
         
         # Processa produção
@@ -114,6 +135,7 @@ class City(BaseModel):
                     building_id = self.producing['id']
                     self.buildings.append(building_id)
                     actions['building_completed'] = building_id
+                    self.update_science_output()
                     self.logger.info(f"Edifício {building_id} concluído")
                 
                 elif self.producing['type'] == 'unit':
@@ -311,4 +333,5 @@ class City(BaseModel):
         obj.worked_tiles = data.get('worked_tiles', [])
         obj.founded_turn = data.get('founded_turn', 0)
         obj.last_growth_turn = data.get('last_growth_turn', 0)
+        obj.update_science_output()
         return obj
@@ -3,6 +3,12 @@ from game.models.base_model import BaseModel
 import logging
 import random
 
+import numpy as np
+
+# Raios de visão (em tiles) de cidades e unidades
+CITY_SIGHT_RADIUS = 2
+UNIT_SIGHT_RADIUS = 1
+
 class Civilization(BaseModel):
     """
     Representa uma civilização no jogo.
@@ -36,7 +42,18 @@ class Civilization(BaseModel):
         # Coleções
         self.cities = []
         self.units = []
+        self._unit_index = None  # Índice {unit_id: unit} compartilhado do GameState
+        # Contagem de observadores por tile (h, w); criada sob demanda pelo WorldController
+        self._visibility = None
+        # Ciência por cidade em layout SoA, na mesma ordem de self.cities
+        self._city_science = np.zeros(0, dtype=np.int32)
+        # Incrementado a cada mudança em _city_science; faz parte da chave do
+        # cache de ciência do TechController
+        self._science_version = 0
         self.technologies = []
+        self._tech_set = set()  # Espelho de technologies para consultas O(1)
+        self._unlocked_dirty = True  # Cache de tecnologias disponíveis desatualizado
+        self._unlocked_cache = None
         self.researching = None  # Tecnologia em pesquisa
         
         # Relações diplomáticas
@@ -58,7 +75,12 @@ class Civilization(BaseModel):
         """
         if city not in self.cities:
             self.cities.append(city)
+            self._city_science = np.append(
+                self._city_science, np.int32(city.science_output)
+            )
+            self._science_version += 1
             city.owner = self
+            self.add_visibility(city.x, city.y, CITY_SIGHT_RADIUS)
             self.logger.info(f"Cidade {city.name} fundada")
     
     def remove_city(self, city):
@@ -69,9 +91,24 @@ class Civilization(BaseModel):
             city: Cidade a ser removida.
         """
         if city in self.cities:
-            self.cities.remove(city)
+            index = self.cities.index(city)
+            del self.cities[index]
+            self._city_science = np.delete(self._city_science, index)
+            self._science_version += 1
+            self.remove_visibility(city.x, city.y, CITY_SIGHT_RADIUS)
             self.logger.info(f"Cidade {city.name} perdida")
     
+    def set_city_science(self, city, value):
+        """
+        Atualiza a ciência de uma cidade no array SoA.
+        
+        Args:
+            city: Cidade da civilização.
+            value (int): Nova produção de ciência da cidade.
+        """
+        self._city_science[self.cities.index(city)] = value
+        self._science_version += 1
+    
     def add_unit(self, unit):
         """
         Adiciona uma unidade à civilização.
@@ -82,6 +119,9 @@ class Civilization(BaseModel):
         if unit not in self.units:
             self.units.append(unit)
             unit.owner = self
+            self.add_visibility(unit.x, unit.y, UNIT_SIGHT_RADIUS)
+            if self._unit_index is not None:
+                self._unit_index[unit.id] = unit
     
     def remove_unit(self, unit):
         """
@@ -92,6 +132,74 @@ class Civilization(BaseModel):
         """
         if unit in self.units:
             self.units.remove(unit)
+            self.remove_visibility(unit.x, unit.y, UNIT_SIGHT_RADIUS)
+            if self._unit_index is not None:
+                self._unit_index.pop(unit.id, None)
+    
+    @property
+    def is_active(self):
+        """
+        Indica se a civilização ainda tem algo a processar por turno.
+        
+        Returns:
+            bool: False para civilizações sem cidades, sem unidades e sem pesquisa
+            em andamento (derrotadas ou dormentes).
+        """
+        return bool(self.cities or self.units or getattr(self, 'current_research', None))
+    
+    def _shift_visibility(self, x, y, radius, delta):
+        """Soma delta à contagem de observadores no quadrado de raio radius em (x, y)."""
+        visibility = self._visibility
+        if visibility is None:
+            return
+        height, width = visibility.shape
+        if 0 <= x < width and 0 <= y < height:
+            visibility[max(0, y - radius):y + radius + 1,
+                       max(0, x - radius):x + radius + 1] += delta
+    
+    def add_visibility(self, x, y, radius):
+        """
+        Registra um observador em (x, y) no mapa de visibilidade.
+        
+        Args:
+            x (int): Coordenada X do observador.
+            y (int): Coordenada Y do observador.
+            radius (int): Raio de visão em tiles.
+        """
+        self._shift_visibility(x, y, radius, 1)
+    
+    def remove_visibility(self, x, y, radius):
+        """
+        Remove um observador em (x, y) do mapa de visibilidade.
+        
+        Args:
+            x (int): Coordenada X do observador.
+            y (int): Coordenada Y do observador.
+            radius (int): Raio de visão em tiles.
+        """
+        self._shift_visibility(x, y, radius, -1)
+    
+    def build_visibility(self, width, height):
+        """
+        Reconstrói do zero o mapa de visibilidade a partir de cidades e unidades.
+        
+        Args:
+            width (int): Largura do mundo.
+            height (int): Altura do mundo.
+            
+        Returns:
+            np.ndarray: Contagem de observadores por tile, formato (height, width).
+        """
+        self._visibility = np.zeros((height, width), dtype=np.int16)
+        for city in self.cities:
+            self.add_visibility(city.x, city.y, CITY_SIGHT_RADIUS)
+        for unit in self.units:
+            self.add_visibility(unit.x, unit.y, UNIT_SIGHT_RADIUS)
+        return self._visibility
+    
+    def invalidate_visibility(self):
+        """Descarta o mapa de visibilidade (reconstruído na próxima consulta)."""
+        self._visibility = None
     
     def has_technology(self, tech_id):
         """
@@ -103,7 +211,22 @@ class Civilization(BaseModel):
         Returns:
             bool: True se a civilização possui a tecnologia, False caso contrário.
         """
-        return tech_id in self.technologies
+        return tech_id in self._tech_set
+    
+    def add_technology(self, tech_id):
+        """
+        Registra uma tecnologia como conhecida pela civilização.
+        
+        Mantém ``technologies`` (ordem de descoberta) e ``_tech_set``
+        (consultas de pertinência) sincronizados.
+        
+        Args:
+            tech_id (str): ID da tecnologia.
+        """
+        if tech_id not in self._tech_set:
+            self._tech_set.add(tech_id)
+            self.technologies.append(tech_id)
+            self._unlocked_dirty = True
     
     def can_research(self, tech_id, tech_tree):
         """
@@ -171,7 +294,7 @@ class Civilization(BaseModel):
         # Verifica se a pesquisa foi concluída
         if self.researching['progress'] >= self.researching['cost']:
             tech_id = self.researching['id']
-            self.technologies.append(tech_id)
+            self.add_technology(tech_id)
             self.researching = None
             self.logger.info(f"Tecnologia {tech_id} concluída")
             return True
@@ -426,6 +549,7 @@ class Civilization(BaseModel):
         obj.cities = []
         obj.units = []
         obj.technologies = data.get('technologies', [])
+        obj._tech_set = set(obj.technologies)
         obj.researching = data.get('researching')
         obj.known_civs = data.get('known_civs', [])
         obj.relations = data.get('relations', {})
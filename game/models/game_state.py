@@ -25,6 +25,7 @@ class GameState:
         self.world = None
         self.civilizations = []
         self.player_civ = None
+        self.player_civ_id = None
         self.current_civ_index = 0
         self.game_over = False
         self.winner = None
@@ -34,6 +35,8 @@ class GameState:
         self._unit_data = None
         self._building_data = None
         self._tech_tree = None
+        self._unit_index = None
+        self._indexed_civs = 0
         self.logger = get_game_logger(self.__class__.__name__)
         if from_dict_data:
             self.from_dict(from_dict_data)
@@ -74,6 +77,31 @@ class GameState:
             self._tech_tree = self.data_loader.get_tech_tree()
         return self._tech_tree
 
+    @property
+    def unit_index(self):
+        """
+        Índice {unit_id: unit} de todas as unidades do jogo.
+        
+        Construído sob demanda e mantido por Civilization.add_unit/remove_unit;
+        é reconstruído se a lista de civilizações mudar de tamanho.
+        """
+        if self._unit_index is None or self._indexed_civs != len(self.civilizations):
+            index = {}
+            for civ in self.civilizations:
+                civ._unit_index = index
+                for unit in civ.units:
+                    index[unit.id] = unit
+            self._unit_index = index
+            self._indexed_civs = len(self.civilizations)
+        return self._unit_index
+
+    def invalidate_unit_index(self):
+        """Descarta o índice de unidades (ex.: ao trocar de jogo ou recarregar unidades)."""
+        for civ in self.civilizations:
+            civ._unit_index = None
+        self._unit_index = None
+        self._indexed_civs = 0
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -101,6 +129,8 @@ class GameState:
         if data.get('player_civ'):
             from game.models.civilization import Civilization
             self.player_civ = Civilization.from_dict(data['player_civ'])
+            self.player_civ_id = self.player_civ.id
+        self.invalidate_unit_index()
         self.current_civ_index = data.get('current_civ_index', 0)
         self.game_over = data.get('game_over', False)
         self.winner = data.get('winner')
@@ -1,5 +1,6 @@
 # game/models/unit.py
 from game.models.base_model import BaseModel
+from game.models.civilization import UNIT_SIGHT_RADIUS
 import logging
 import uuid
 
@@ -11,6 +12,15 @@ class Unit(BaseModel):
     e pode se mover, atacar e realizar ações especiais.
     """
     
+    is_unit = True  # Marcador de tipo (evita isinstance no caminho de combate)
+    
+    __slots__ = (
+        'x', 'y', 'type', 'owner',
+        'health', 'movement', 'max_movement', 'strength', 'ranged_strength', 'range',
+        'moves_left', 'has_acted', 'is_fortified', 'is_sleeping',
+        'experience', 'promotions',
+    )
+    
     def __init__(self, x, y, unit_type, id=None):
         super().__init__(id)
         self.x = x
@@ -115,6 +125,13 @@ class Unit(BaseModel):
         
         return True
     
+    def _update_owner_visibility(self, old_x, old_y):
+        """Move o raio de visão da unidade no mapa de visibilidade do dono."""
+        owner = getattr(self, 'owner', None)
+        if owner is not None and getattr(owner, '_visibility', None) is not None:
+            owner.remove_visibility(old_x, old_y, UNIT_SIGHT_RADIUS)
+            owner.add_visibility(self.x, self.y, UNIT_SIGHT_RADIUS)
+    
     def move_to(self, x, y):
         """
         Move a unidade para as coordenadas especificadas.
@@ -140,6 +157,7 @@ class Unit(BaseModel):
         # Atualiza as coordenadas
         old_x, old_y = self.x, self.y
         self.x, self.y = x, y
+        self._update_owner_visibility(old_x, old_y)
         
         # Consome pontos de movimento
         self.moves_left -= 1
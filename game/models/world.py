@@ -3,6 +3,10 @@ from game.models.base_model import BaseModel
 from game.utils.perlin_noise import PerlinNoise
 import random
 import logging
+import numpy as np
+
+# Custo de movimento a partir do qual um terreno é intransponível
+IMPASSABLE_COST = 999
 
 class Tile(BaseModel):
     """
@@ -10,8 +14,20 @@ class Tile(BaseModel):
     
     Cada tile tem um tipo de terreno, possivelmente um recurso,
     e pode conter unidades ou uma cidade.
+    
+    Depois de inserido em um World, o terreno do tile é armazenado no array
+    ``World.terrain`` (layout SoA). O atributo terrain_type guarda o nome
+    correspondente para leitura direta (renderização); alterações devem
+    passar por World.set_terrain, que mantém os dois sincronizados.
     """
     
+    __slots__ = (
+        'x', 'y', '_world', '_index', 'terrain_type',
+        'resource', 'improvement', 'owner', 'city', 'units',
+        # Referências pendentes preenchidas por from_dict
+        '_owner_id', '_city_id', '_unit_ids',
+    )
+    
     def __init__(self, x, y, terrain_type="plains", resource=None):
         """
         Inicializa um novo tile.
@@ -25,13 +41,17 @@ class Tile(BaseModel):
         super().__init__()
         self.x = x
         self.y = y
+        self._world = None   # Mundo que armazena o terreno deste tile
+        self._index = -1     # Índice do tile nos arrays do mundo (y * width + x)
+        # Nome do terreno, espelho do código em World.terrain para leitura
+        # rápida (renderização); com o tile em um mundo, altere via World.set_terrain
         self.terrain_type = terrain_type
         self.resource = resource
         self.improvement = None
         self.owner = None  # Civilização que controla este tile
         self.city = None   # Cidade neste tile, se houver
         self.units = []    # Unidades neste tile
-        
+    
     def to_dict(self):
         """
         Converte o tile para um dicionário para serialização.
@@ -39,7 +59,8 @@ class Tile(BaseModel):
         Returns:
             dict: Representação do tile como dicionário.
         """
-        data = super().to_dict()
+        # Não usa BaseModel.to_dict: a referência ao mundo não deve ser serializada
+        data = {'id': self.id}
         data.update({
             'x': self.x,
             'y': self.y,
@@ -164,6 +185,13 @@ class World(BaseModel):
         self.height = height
         self.seed = seed if seed is not None else random.randint(0, 1000000)
         self.tiles = []
+        self._tile_flat = []  # Tiles em ordem linha a linha (índice y * width + x)
+        # Terreno em layout SoA: código por tile e tabela código <-> nome
+        self.terrain = np.zeros(0, dtype=np.int8)
+        self._terrain_names = []
+        self._terrain_codes = {}
+        self._terrain_cost = None  # Custo de movimento por tile (mesmo índice de _tile_flat)
+        self._passable = None      # Máscara de tiles transponíveis por unidades terrestres
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Inicializa o grid de tiles vazio
@@ -177,6 +205,93 @@ class World(BaseModel):
             for x in range(self.width):
                 row.append(Tile(x, y))
             self.tiles.append(row)
+        self._rebuild_tile_index()
+    
+    def _rebuild_tile_index(self):
+        """Reconstrói a lista plana de tiles e vincula o terreno de cada um ao array do mundo."""
+        flat = [tile for row in self.tiles for tile in row]
+        names = [tile.terrain_type for tile in flat]
+        self._tile_flat = flat
+        self.terrain = np.zeros(len(flat), dtype=np.int8)
+        terrain_code = self.terrain_code
+        codes = [terrain_code(name) for name in names]
+        self.terrain[:] = codes
+        for index, tile in enumerate(flat):
+            tile._world = self
+            tile._index = index
+        self.invalidate_terrain_arrays()
+    
+    def terrain_code(self, terrain_type):
+        """
+        Obtém o código inteiro de um tipo de terreno, registrando-o se for novo.
+        
+        Args:
+            terrain_type (str): Tipo de terreno.
+            
+        Returns:
+            int: Código usado no array ``terrain``.
+        """
+        code = self._terrain_codes.get(terrain_type)
+        if code is None:
+            code = len(self._terrain_names)
+            self._terrain_names.append(terrain_type)
+            self._terrain_codes[terrain_type] = code
+        return code
+    
+    def set_terrain(self, index, terrain_type):
+        """
+        Define o terreno de um tile pelo índice plano.
+        
+        Args:
+            index (int): Índice do tile (y * width + x).
+            terrain_type (str): Tipo de terreno.
+        """
+        self.terrain[index] = self.terrain_code(terrain_type)
+        self._tile_flat[index].terrain_type = terrain_type
+        self.invalidate_terrain_arrays()
+    
+    def set_terrain_codes(self, codes):
+        """
+        Substitui o terreno de todos os tiles de uma vez.
+        
+        Args:
+            codes (np.ndarray): Códigos de terreno (ver terrain_code), um por
+                tile na ordem y * width + x.
+        """
+        self.terrain[:] = codes
+        names = self._terrain_names
+        for tile, code in zip(self._tile_flat, self.terrain.tolist()):
+            tile.terrain_type = names[code]
+        self.invalidate_terrain_arrays()
+    
+    def invalidate_terrain_arrays(self):
+        """Descarta os arrays de custo/passabilidade; devem ser reconstruídos após mudar o terreno."""
+        self._terrain_cost = None
+        self._passable = None
+    
+    def get_terrain_arrays(self, terrain_data):
+        """
+        Obtém os arrays planos de custo de movimento e passabilidade dos tiles.
+        
+        Os arrays são construídos na primeira chamada e reaproveitados até
+        invalidate_terrain_arrays() ser chamado.
+        
+        Args:
+            terrain_data (dict): Dados de terrenos do jogo.
+            
+        Returns:
+            tuple: (custos como np.int16, máscara de passabilidade como np.bool_),
+            indexados por y * width + x.
+        """
+        if self._terrain_cost is None:
+            # Tabela de custo por código de terreno, aplicada ao array inteiro
+            cost_by_code = np.array(
+                [terrain_data.get(name, {}).get('movement_cost', 1) for name in self._terrain_names] or [1],
+                dtype=np.int16
+            )
+            self._terrain_cost = cost_by_code[self.terrain]
+            self._passable = self._terrain_cost < IMPASSABLE_COST
+        return self._terrain_cost, self._passable
     
     def generate_terrain(self, data_loader):
         """
@@ -218,7 +333,7 @@ class World(BaseModel):
                 terrain_type = self._determine_terrain_type(elevation, moisture)
                 
                 # Atualiza o tile
-                self.tiles[y][x].terrain_type = terrain_type
+                self.set_terrain(y * self.width + x, terrain_type)
                 
                 # Chance de gerar um recurso
                 if random.random() < 0.1:  # 10% de chance
@@ -226,6 +341,7 @@ class World(BaseModel):
                     if resource:
                         self.tiles[y][x].resource = resource
         
+        self.invalidate_terrain_arrays()
         self.logger.info("Geração de terreno concluída.")
     
     def _determine_terrain_type(self, elevation, moisture):
@@ -296,8 +412,9 @@ class World(BaseModel):
         Returns:
             Tile: O tile nas coordenadas especificadas ou None se fora dos limites.
         """
-        if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+        width = self.width
+        if 0 <= x < width and 0 <= y < self.height:
+            return self._tile_flat[y * width + x]
         return None
     
     def get_neighbors(self, x, y, include_diagonals=False):
@@ -422,14 +539,15 @@ class World(BaseModel):
         Returns:
             dict: Representação do mundo como dicionário.
         """
-        data = super().to_dict()
-        data.update({
+        # Campos explícitos: índices e arrays em memória (_tile_flat, terrain, ...)
+        # não são serializados; o terreno é salvo através de cada tile
+        return {
+            'id': self.id,
             'width': self.width,
             'height': self.height,
             'seed': self.seed,
             'tiles': [[tile.to_dict() for tile in row] for row in self.tiles]
-        })
-        return data
+        }
     
     @classmethod
     def from_dict(cls, data):
@@ -462,4 +580,5 @@ class World(BaseModel):
                     
                 world.tiles[y][x] = Tile.from_dict(tile_data, world)
         
+        world._rebuild_tile_index()
         return world
@@ -298,6 +298,17 @@ class DataLoader:
             self.save_json("resources.json", resources)
             return resources
 
+
+@lru_cache(maxsize=None)
+def get_data_loader() -> DataLoader:
+    """
+    Obtém a instância compartilhada do carregador de dados.
+    
+    Returns:
+        DataLoader: Carregador de dados padrão (diretório "data").
+    """
+    return DataLoader()
+
 # Exemplo de modelo Pydantic para validação de tecnologia
 class TechnologyModel(BaseModel):
     name: str
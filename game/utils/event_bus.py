@@ -2,7 +2,22 @@
 Sistema de eventos para comunicação entre componentes do jogo.
 """
 import logging
-from typing import Dict, List, Callable, Any
+from contextvars import ContextVar
+from typing import Dict, List, Callable, Any, Optional, Tuple
+
+# Eventos de "estado atual" que podem ser agrupados durante um lote:
+# apenas a última publicação de cada um é entregue.
+COALESCED_EVENTS = frozenset({
+    "map.updated",
+    "city.selected",
+})
+
+# Buffer de eventos do contexto atual. Quando definido (ex.: em uma thread de
+# processamento de turno da IA), publish() apenas acumula os eventos nele; quem
+# definiu o buffer é responsável por republicá-los na thread principal.
+worker_event_buffer: ContextVar[Optional[List[Tuple[str, Dict[str, Any]]]]] = ContextVar(
+    "worker_event_buffer", default=None
+)
 
 class EventBus:
     """
@@ -16,6 +31,11 @@ class EventBus:
         """Inicializa o barramento de eventos."""
         self.subscribers: Dict[str, List[Callable]] = {}
         self.logger = logging.getLogger(__name__)
+        
+        # Estado do modo de publicação em lote
+        self._batch_depth = 0
+        self._batched: List[List[Any]] = []
+        self._batched_index: Dict[str, int] = {}
     
     def subscribe(self, event_type: str, callback: Callable) -> None:
         """
@@ -44,6 +64,52 @@ class EventBus:
             self.subscribers[event_type].remove(callback)
             self.logger.debug(f"Cancelada inscrição em evento '{event_type}': {callback.__name__}")
     
+    def has_subscribers(self, event_type: str) -> bool:
+        """
+        Verifica se algum inscrito receberia um evento do tipo informado.
+        
+        Args:
+            event_type: Tipo de evento
+            
+        Returns:
+            True se houver inscritos diretos ou inscritos em todos os eventos ("*")
+        """
+        subscribers = self.subscribers
+        return bool(subscribers.get(event_type)) or bool(subscribers.get("*"))
+    
+    # Forma curta usada para proteger a montagem de payloads nos pontos de publicação
+    has = has_subscribers
+    
+    @property
+    def is_batching(self) -> bool:
+        """Indica se há um lote de publicação aberto (eventos ainda não entregues)."""
+        return self._batch_depth > 0
+    
+    def begin_batch(self) -> None:
+        """
+        Inicia o modo de publicação em lote.
+        
+        Enquanto houver um lote aberto, os eventos são enfileirados e só são
+        entregues em end_batch(). Eventos de COALESCED_EVENTS publicados várias
+        vezes no mesmo lote são entregues uma única vez, com os dados mais recentes.
+        Lotes podem ser aninhados.
+        """
+        self._batch_depth += 1
+    
+    def end_batch(self) -> None:
+        """Fecha o lote atual e, se for o mais externo, entrega os eventos pendentes."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        
+        pending = self._batched
+        self._batched = []
+        self._batched_index = {}
+        for event_type, event_data in pending:
+            self._dispatch(event_type, event_data)
+    
     def publish(self, event_type: str, event_data: Dict[str, Any] = None) -> None:
         """
         Publica um evento para todos os inscritos.
@@ -58,6 +124,31 @@ class EventBus:
         # Adicionar o tipo de evento aos dados
         event_data["event_type"] = event_type
         
+        buffer = worker_event_buffer.get()
+        if buffer is not None:
+            buffer.append((event_type, event_data))
+            return
+        
+        if self._batch_depth:
+            if event_type in COALESCED_EVENTS:
+                index = self._batched_index.get(event_type)
+                if index is not None:
+                    self._batched[index][1] = event_data
+                    return
+                self._batched_index[event_type] = len(self._batched)
+            self._batched.append([event_type, event_data])
+            return
+        
+        self._dispatch(event_type, event_data)
+    
+    def _dispatch(self, event_type: str, event_data: Dict[str, Any]) -> None:
+        """
+        Entrega um evento aos inscritos diretos e aos inscritos em todos os eventos.
+        
+        Args:
+            event_type: Tipo de evento
+            event_data: Dados associados ao evento
+        """
         self.logger.debug(f"Publicando evento '{event_type}'")
         
         # Notificar inscritos diretos
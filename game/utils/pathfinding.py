@@ -0,0 +1,165 @@
+"""
+Núcleo de busca de caminho (A*) sobre arrays planos de custo/passabilidade.
+
+Quando a numba está disponível o laço é compilado com ``@njit``; sem ela,
+NUMBA_AVAILABLE é False e o WorldController usa sua implementação em Python.
+"""
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba é opcional
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Marcador retornado pelo kernel quando não há caminho
+NO_PATH = -1
+
+# Custo "infinito" para nós ainda não alcançados
+_UNREACHED = 1 << 62
+
+logger = logging.getLogger(__name__)
+
+
+def _heap_push(heap, size, key):
+    """Insere uma chave no heap binário mínimo armazenado em ``heap[:size]``."""
+    i = size
+    heap[i] = key
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap[parent] <= heap[i]:
+            break
+        heap[parent], heap[i] = heap[i], heap[parent]
+        i = parent
+    return size + 1
+
+
+def _heap_pop(heap, size):
+    """Remove e retorna a menor chave do heap; retorna (chave, novo tamanho)."""
+    top = heap[0]
+    size -= 1
+    heap[0] = heap[size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= size:
+            break
+        child = left
+        if left + 1 < size and heap[left + 1] < heap[left]:
+            child = left + 1
+        if heap[i] <= heap[child]:
+            break
+        heap[i], heap[child] = heap[child], heap[i]
+        i = child
+    return top, size
+
+
+def _astar_py(cost, passable, width, height, sx, sy, gx, gy, max_expansions):
+    """
+    A* em grid 4-conectado com heurística de Manhattan.
+
+    As chaves do heap empacotam ``f * n + índice`` em um int64.
+
+    Args:
+        cost: Custo de movimento por tile (índice y * width + x).
+        passable: Máscara de tiles transponíveis.
+        width: Largura do mundo.
+        height: Altura do mundo.
+        sx, sy: Coordenadas iniciais.
+        gx, gy: Coordenadas finais.
+        max_expansions: Número máximo de nós expandidos.
+
+    Returns:
+        np.ndarray: Índices dos tiles do caminho (sem o inicial) como int32;
+        ``[NO_PATH]`` se não houver caminho.
+    """
+    n = width * height
+    start = sy * width + sx
+    goal = gy * width + gx
+
+    g_score = np.full(n, _UNREACHED, dtype=np.int64)
+    came_from = np.full(n, -1, dtype=np.int64)
+    closed = np.zeros(n, dtype=np.bool_)
+    heap = np.empty(4 * n + 1, dtype=np.int64)
+
+    g_score[start] = 0
+    size = _heap_push(heap, 0, (abs(gx - sx) + abs(gy - sy)) * n + start)
+    expansions = 0
+    found = False
+
+    while size > 0:
+        key, size = _heap_pop(heap, size)
+        current = key % n
+        if current == goal:
+            found = True
+            break
+        if closed[current]:
+            continue
+        closed[current] = True
+
+        expansions += 1
+        if expansions > max_expansions:
+            break
+
+        x = current % width
+        y = current // width
+        for direction in range(4):
+            if direction == 0:
+                nx, ny = x, y - 1
+            elif direction == 1:
+                nx, ny = x + 1, y
+            elif direction == 2:
+                nx, ny = x, y + 1
+            else:
+                nx, ny = x - 1, y
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            neighbor = ny * width + nx
+            if closed[neighbor] or not passable[neighbor]:
+                continue
+            tentative = g_score[current] + cost[neighbor]
+            if tentative < g_score[neighbor]:
+                g_score[neighbor] = tentative
+                came_from[neighbor] = current
+                f = tentative + abs(gx - nx) + abs(gy - ny)
+                size = _heap_push(heap, size, f * n + neighbor)
+
+    if not found:
+        return np.full(1, NO_PATH, dtype=np.int32)
+
+    length = 0
+    node = goal
+    while node != start:
+        length += 1
+        node = came_from[node]
+
+    path = np.empty(length, dtype=np.int32)
+    node = goal
+    for i in range(length - 1, -1, -1):
+        path[i] = node
+        node = came_from[node]
+    return path
+
+
+if NUMBA_AVAILABLE:
+    _heap_push = njit(cache=True)(_heap_push)
+    _heap_pop = njit(cache=True)(_heap_pop)
+    astar = njit(cache=True)(_astar_py)
+else:
+    astar = _astar_py
+
+
+def warm_up():
+    """
+    Compila o kernel antecipadamente (com cache em disco) para evitar a pausa
+    de compilação na primeira busca de caminho do jogo.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    cost = np.ones(4, dtype=np.int16)
+    passable = np.ones(4, dtype=np.bool_)
+    astar(cost, passable, 2, 2, 0, 0, 1, 1, 16)
+    logger.debug("Kernel de pathfinding compilado")
@@ -4,10 +4,14 @@ import os
 import logging
 from datetime import datetime
 import hashlib
-import threading
-import time
+import zlib
+from functools import lru_cache
 from game.utils.logger import get_game_logger
 
+# Cabeçalho do formato binário compacto (JSON compacto + zlib)
+SAVE_HEADER = b"CIVZ\x01"
+SAVE_COMPRESSION_LEVEL = 1
+
 class SaveManager:
     """
     Gerencia o salvamento e carregamento de jogos.
@@ -26,6 +30,14 @@ class SaveManager:
         self.save_dir = save_dir
         self.logger = get_game_logger(self.__class__.__name__)
         
+        # Cache da listagem de salvamentos (invalidado pelo mtime do diretório)
+        self._cached_mtime = None
+        self._cached_list = None
+        # Incrementado a cada invalidação explícita (save/delete, inclusive o
+        # autosave em thread de trabalho); uma varredura iniciada antes dela
+        # não é guardada em cache
+        self._cache_version = 0
+        
         # Cria o diretório de salvamentos se não existir
         if not os.path.exists(save_dir):
             os.makedirs(save_dir)
@@ -35,6 +47,45 @@ class SaveManager:
         json_bytes = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
         return hashlib.sha256(json_bytes).hexdigest()
 
+    @staticmethod
+    def _read_save_file(save_path: str) -> dict:
+        """
+        Lê um arquivo de salvamento em qualquer formato suportado.
+        
+        Arquivos com o cabeçalho ``SAVE_HEADER`` são descomprimidos; os demais
+        são tratados como JSON legível (formato anterior).
+        
+        Args:
+            save_path (str): Caminho do arquivo.
+            
+        Returns:
+            dict: Conteúdo do salvamento.
+        """
+        with open(save_path, 'rb') as f:
+            blob = f.read()
+        if blob.startswith(SAVE_HEADER):
+            blob = zlib.decompress(blob[len(SAVE_HEADER):])
+        return json.loads(blob.decode('utf-8'))
+
+    @staticmethod
+    def serialize_state(game_state) -> str:
+        """
+        Tira o snapshot do estado do jogo como texto JSON.
+        
+        Deve rodar na thread dona do estado (a da GUI): depois dela o texto é
+        independente dos objetos vivos e pode ser gravado em outra thread com
+        write_serialized. O formato é o mesmo usado pelo hash de integridade.
+        
+        Args:
+            game_state: Estado do jogo (dict ou objeto com ``to_dict``).
+            
+        Returns:
+            str: Estado serializado.
+        """
+        if hasattr(game_state, 'to_dict'):
+            game_state = game_state.to_dict()
+        return json.dumps(game_state, sort_keys=True, ensure_ascii=False)
+
     def save_game(self, game_state, save_name=None) -> str | None:
         """
         Salva o estado atual do jogo.
@@ -43,6 +94,27 @@ class SaveManager:
             game_state (dict): Estado do jogo a ser salvo.
             save_name (str): Nome do salvamento. Se None, usa a data/hora atual.
             
+        Returns:
+            str: Caminho do arquivo de salvamento ou None se falhar.
+        """
+        try:
+            state_json = self.serialize_state(game_state)
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar jogo: {e}", exc_info=True)
+            return None
+        return self.write_serialized(state_json, save_name)
+
+    def write_serialized(self, state_json: str, save_name=None) -> str | None:
+        """
+        Grava um estado já serializado por serialize_state.
+        
+        Calcula o hash, comprime e grava; não toca nos objetos do jogo, então
+        pode rodar em uma thread de trabalho.
+        
+        Args:
+            state_json (str): Estado serializado.
+            save_name (str): Nome do salvamento. Se None, usa a data/hora atual.
+            
         Returns:
             str: Caminho do arquivo de salvamento ou None se falhar.
         """
@@ -59,20 +131,28 @@ class SaveManager:
             # Caminho completo do arquivo
             save_path = os.path.join(self.save_dir, save_name)
             
-            # Adiciona metadados ao salvamento
-            save_data = {
-                'metadata': {
-                    'version': '2.0',
-                    'timestamp': datetime.now().isoformat(),
-                    'name': save_name
-                },
-                'game_state': game_state
+            # O texto serializado é o mesmo que _compute_hash produziria
+            state_bytes = state_json.encode('utf-8')
+            metadata = {
+                'version': '3.0',
+                'timestamp': datetime.now().isoformat(),
+                'name': save_name,
+                'integrity_hash': hashlib.sha256(state_bytes).hexdigest(),
             }
-            # Calcula hash de integridade
-            save_data['metadata']['integrity_hash'] = self._compute_hash(save_data['game_state'])
-            # Salva como JSON
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            # Monta o JSON do salvamento sem reserializar o estado
+            payload = b''.join((
+                b'{"metadata":',
+                json.dumps(metadata, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+                b',"game_state":',
+                state_bytes,
+                b'}',
+            ))
+            # Salva no formato binário compacto
+            with open(save_path, 'wb') as f:
+                f.write(SAVE_HEADER + zlib.compress(payload, SAVE_COMPRESSION_LEVEL))
+            
+            # Sobrescrever um arquivo não altera o mtime do diretório
+            self._invalidate_cache()
             
             self.logger.info(f"Jogo salvo com sucesso em: {save_path}")
             return save_path
@@ -104,9 +184,8 @@ class SaveManager:
                 self.logger.error(f"Arquivo de salvamento não encontrado: {save_path}")
                 return None
             
-            # Carrega os dados usando JSON
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            # Carrega os dados (formato compacto ou JSON legado)
+            save_data = self._read_save_file(save_path)
             
             # Verifica integridade
             expected_hash = save_data['metadata'].get('integrity_hash')
@@ -122,23 +201,81 @@ class SaveManager:
             self.logger.error(f"Erro ao carregar jogo: {e}", exc_info=True)
             return None
     
-    def autosave(self, game_state_getter, interval_sec=120):
-        """Inicia um autosave em background a cada interval_sec segundos."""
-        def _autosave_loop():
-            while True:
-                try:
-                    state = game_state_getter()
-                    self.save_game(state, save_name='autosave')
-                except Exception as e:
-                    self.logger.error(f"Erro no autosave: {e}")
-                time.sleep(interval_sec)
-        t = threading.Thread(target=_autosave_loop, daemon=True)
-        t.start()
+    def autosave(self, state_json):
+        """
+        Grava um autosave a partir de um snapshot já serializado.
+        
+        Pensado para ser chamado em uma thread de trabalho: o chamador tira o
+        snapshot com serialize_state na thread dona do estado e só o hash, a
+        compressão e a escrita em disco acontecem aqui.
+        
+        Args:
+            state_json: Estado serializado por serialize_state (ou None).
+            
+        Returns:
+            str: Caminho do arquivo salvo ou None se nada foi salvo.
+        """
+        if state_json is None:
+            return None
+        return self.write_serialized(state_json, save_name='autosave')
+    
+    def _invalidate_cache(self):
+        """Descarta a listagem de salvamentos em cache."""
+        self._cache_version += 1
+        self._cached_mtime = None
+        self._cached_list = None
     
     def list_saves(self):
         """
         Lista todos os jogos salvos disponíveis.
         
+        A listagem é reaproveitada enquanto o mtime do diretório de
+        salvamentos não mudar.
+        
+        Returns:
+            list: Lista de dicionários com informações sobre os salvamentos.
+        """
+        return list(self.list_saves_cached())
+    
+    def list_saves_cached(self):
+        """
+        Versão de list_saves que devolve a própria listagem em cache.
+        
+        Evita a cópia a cada chamada; destinada a quem só lê a lista (diálogos
+        de carregar/salvar), que não deve modificá-la.
+        
+        Returns:
+            list: Lista compartilhada de dicionários com informações sobre os salvamentos.
+        """
+        version = self._cache_version
+        try:
+            mtime = os.stat(self.save_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if mtime is not None and mtime == self._cached_mtime:
+            return self._cached_list
+        
+        saves = self._scan_saves()
+        if mtime is not None and version == self._cache_version:
+            self._cached_mtime = mtime
+            self._cached_list = saves
+        return saves
+    
+    def list_autosaves(self):
+        """
+        Lista apenas os autosaves disponíveis.
+        
+        Returns:
+            list: Lista de dicionários com informações sobre os autosaves.
+        """
+        return [save for save in self.list_saves_cached()
+                if save['filename'].startswith('autosave')]
+    
+    def _scan_saves(self):
+        """
+        Lê o diretório de salvamentos e os metadados de cada arquivo.
+        
         Returns:
             list: Lista de dicionários com informações sobre os salvamentos.
         """
@@ -152,17 +289,16 @@ class SaveManager:
                     
                     try:
                         # Tenta carregar os metadados do salvamento
-                        with open(save_path, 'r', encoding='utf-8') as f:
-                            save_data = json.load(f)
-                            metadata = save_data.get('metadata', {})
-                            
-                            saves.append({
-                                'filename': filename,
-                                'path': save_path,
-                                'name': metadata.get('name', filename),
-                                'timestamp': metadata.get('timestamp', ''),
-                                'version': metadata.get('version', 'unknown')
-                            })
+                        save_data = self._read_save_file(save_path)
+                        metadata = save_data.get('metadata', {})
+                        
+                        saves.append({
+                            'filename': filename,
+                            'path': save_path,
+                            'name': metadata.get('name', filename),
+                            'timestamp': metadata.get('timestamp', ''),
+                            'version': metadata.get('version', 'unknown')
+                        })
                     except Exception as e:
                         # Se não conseguir carregar os metadados, adiciona informações básicas
                         self.logger.warning(f"Não foi possível ler metadados de {filename}: {e}")
@@ -207,9 +343,21 @@ class SaveManager:
             
             # Exclui o arquivo
             os.remove(save_path)
+            self._invalidate_cache()
             self.logger.info(f"Salvamento excluído: {save_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Erro ao excluir salvamento: {e}", exc_info=True)
             return False
+
+
+@lru_cache(maxsize=None)
+def get_save_manager() -> SaveManager:
+    """
+    Obtém a instância compartilhada do gerenciador de salvamentos.
+    
+    Returns:
+        SaveManager: Gerenciador de salvamentos padrão (diretório "saves").
+    """
+    return SaveManager()
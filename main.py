@@ -37,6 +37,10 @@ def main():
         logger.info("Inicializando o controlador do jogo")
         game_controller = GameController()
         
+        # Compilar antecipadamente o kernel de pathfinding (se a numba estiver disponível)
+        from game.utils.pathfinding import warm_up
+        warm_up()
+        
         # Inicializar a janela principal
         logger.info("Inicializando a interface gráfica")
         window = MainWindow(game_controller)